@@ -0,0 +1,55 @@
+"""Benchmark of `Colormap` against per-value `rgb()` / `Styles.Fg.rgb()`.
+
+Run it from the repository root using:
+python -m benchmarks.bench_colormap [<number of values>]
+"""
+
+
+import random
+import sys
+import time
+
+import dyepy
+
+
+def timed(label, func, *args):
+    """Runs *func* with *args*, prints and returns its result and time
+"""
+
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+
+    print(f'{label:<24} {elapsed:8.3f} s')
+
+    return result
+
+
+def main(count=1_000_000):
+    rng = random.Random(32)
+    floats = [rng.random() for _ in range(count)]
+    octets = bytes(rng.getrandbits(8) for _ in range(count))
+
+    cmap = dyepy.Colormap(['#000004', '#b73779', '#fcffa4'])
+    cmap8 = dyepy.Colormap(cmap.gradient, vmin=0, vmax=255)
+
+    print(f'{count} values')
+
+    timed('indices (float)', cmap.indices, floats)
+    timed('hex (float)', cmap.hex, floats)
+    timed('fg (float)', cmap.fg, floats)
+    timed('indices (8-bit)', cmap8.indices, octets)
+    timed('rgb (8-bit)', cmap8.rgb, octets)
+    hexes = timed('hex (8-bit)', cmap8.hex, octets)
+    timed('bg (8-bit)', cmap8.bg, octets)
+
+    sample = octets[:count // 10]
+    table = cmap8.table
+    scalar = timed(f'rgb() x{len(sample)}',
+                   lambda: [dyepy.rgb(*table[value]) for value in sample])
+
+    assert scalar == hexes[:len(sample)]
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
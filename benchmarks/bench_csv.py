@@ -0,0 +1,57 @@
+"""Benchmark of `convert_csv`, in rows per second.
+
+A CSV file of colors (from a palette of 4096 colors) is converted to
+hex and hsl, in this process and in process pools; every output must
+be the same. The peak memory of this process is printed too: it stays
+bounded by the chunks in flight, not the file size.
+
+Run it from the repository root using:
+python -m benchmarks.bench_csv [<number of rows>]
+"""
+
+
+import filecmp
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+
+import dyepy
+
+
+def main(count=1_000_000):
+    generator = random.Random(48)
+    palette = ['#%06x' % generator.getrandbits(24) for _ in range(4096)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, 'colors.csv')
+
+        with open(source, 'w') as file:
+            file.write('id,color,label\n')
+            file.writelines(f'{index},{generator.choice(palette)},row \
+{index}\n' for index in range(count))
+
+        print(f'{count} rows, {os.path.getsize(source) / 2 ** 20:.1f} MiB')
+        expected = None
+
+        for workers in sorted({1, 2, os.cpu_count() or 1}):
+            output = os.path.join(directory, f'out{workers}.csv')
+            start = time.perf_counter()
+            dyepy.convert_csv(source, output, ['color'], ['hex', 'hsl'],
+                              workers)
+            elapsed = time.perf_counter() - start
+
+            assert expected is None or filecmp.cmp(output, expected, False)
+            expected = output
+
+            print(f'{workers:>3} workers {elapsed:8.3f} s \
+{count / elapsed:>12,.0f} rows/s')
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f'peak memory of this process: {peak / 2 ** 10:.0f} MiB')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,66 @@
+"""Benchmark of `simulate_cvd` against a per-pixel simulation.
+
+Run it from the repository root using:
+python -m benchmarks.bench_cvd [<number of pixels>]
+"""
+
+
+import random
+import sys
+import time
+
+import dyepy
+from dyepy.converters import _linear2srgb, _srgb2linear
+
+
+def timed(label, func, *args):
+    """Returns the result of *func* and prints how long it took
+"""
+
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+
+    print(f'{label:<28} {elapsed:8.3f} s')
+
+    return result
+
+
+def per_pixel(pixels, deficiency):
+    """Simulates *deficiency* pixel by pixel with float maths
+"""
+
+    matrix = dyepy.cvd_matrix(deficiency)
+    out = bytearray()
+
+    for start in range(0, len(pixels), 3):
+        linear = [_srgb2linear(value / 255)
+                  for value in pixels[start:start + 3]]
+
+        for row in matrix:
+            value = min(1, max(0, sum(map(float.__mul__, row, linear))))
+            out.append(round(_linear2srgb(value) * 255))
+
+    return bytes(out)
+
+
+def main(count=1_000_000):
+    pixels = random.Random(40).randbytes(count * 3)
+    palette = ['#%06x' % value for value in
+               random.Random(41).sample(range(1 << 24), 256)]
+
+    print(f'{count} pixels')
+
+    for deficiency in dyepy.CVD_MATRICES:
+        # The slow reference only runs on a tenth of the pixels
+        expected = timed(f'per pixel ({deficiency}, 1/10)', per_pixel,
+                         pixels[:count // 10 * 3], deficiency)
+        simulated = timed(f'simulate_cvd ({deficiency})', dyepy.simulate_cvd,
+                          pixels, deficiency)
+        assert simulated.tobytes()[:len(expected)] == expected
+
+    timed('cvd_distinguishable (256)', dyepy.cvd_distinguishable, palette)
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
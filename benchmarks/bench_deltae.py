@@ -0,0 +1,37 @@
+"""Benchmark of the CIEDE2000 throughput of `dyepy.deltae`.
+
+Run it from the repository root using:
+python -m benchmarks.bench_deltae [<number of colors>] [<tile size>]
+
+All N × (N - 1) / 2 pairs of N random colors are compared in tiles,
+and the pairs per second of each formula are printed.
+"""
+
+
+import random
+import sys
+import time
+
+import dyepy
+
+
+def main(count=3000, tile=512):
+    rng = random.Random(27)
+    pixels = bytes(rng.getrandbits(8) for _ in range(count * 3))
+    colors = dyepy.rgb2lab_array(dyepy.ColorArray.frombuffer(pixels))
+    pairs = count * (count - 1) // 2
+
+    print(f'{count} random colors, {pairs} pairs, tiles of {tile}')
+
+    for method in ('cie76', 'cie94', 'ciede2000'):
+        start = time.perf_counter()
+        found = sum(1 for _ in dyepy.delta_e_pairs(
+            colors, 2.3, method=method, tile=tile))
+        elapsed = time.perf_counter() - start
+
+        print(f'{method:<10} {elapsed:8.3f} s {pairs / elapsed:12,.0f} \
+pairs/s {found:8} pairs ≤ 2.3')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,49 @@
+"""Benchmark of rendering a large matrix as a terminal heatmap.
+
+Run it from the repository root using:
+python -m benchmarks.bench_heatmap [<side of the matrix>]
+"""
+
+
+import math
+import sys
+import time
+
+import dyepy
+
+
+def timed(label, func, *args, **kwargs):
+    """Runs *func* with *args*, prints and returns its result and time
+"""
+
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+
+    print(f'{label:<28} {elapsed:8.3f} s')
+
+    return result
+
+
+def main(side=1000):
+    matrix = [[math.sin(x / 40) * math.cos(y / 60) + x / side
+               for x in range(side)] for y in range(side)]
+
+    print(f'{side}×{side} matrix')
+
+    for size in ((80, 24), (200, 60)):
+        for truecolor in (True, False):
+            text = timed(f'{size[0]}×{size[1]} truecolor={truecolor}',
+                         dyepy.render_heatmap, matrix, size=size,
+                         truecolor=truecolor)
+
+        print(f'{"":<28} {len(text)} characters')
+
+    timed('80×24 reduce=max', dyepy.render_heatmap, matrix, size=(80, 24),
+          reduce='max')
+    timed(f'{side}×{side} (no downsampling)', dyepy.render_heatmap, matrix,
+          size=(side * 2, side), cell=2)
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
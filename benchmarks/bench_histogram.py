@@ -0,0 +1,65 @@
+"""Benchmark of `ColorHistogram` against a dict of (r, g, b) tuples.
+
+Run it from the repository root using:
+python -m benchmarks.bench_histogram [<number of pixels>]
+"""
+
+
+import random
+import sys
+import time
+import tracemalloc
+
+import dyepy
+
+
+def measure(label, func, *args):
+    """Runs *func* twice: once timed, once traced (peak memory)
+"""
+
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(f'{label:<28} {elapsed:8.3f} s {peak / 2 ** 20:9.1f} MiB')
+
+    return result
+
+
+def tuples(pixels):
+    """Counts *pixels* in a dict of (r, g, b) tuples
+"""
+
+    counts = {}
+
+    for color in zip(pixels[0::3], pixels[1::3], pixels[2::3]):
+        counts[color] = counts.get(color, 0) + 1
+
+    return counts
+
+
+def main(count=4_000_000):
+    rng = random.Random(37)
+
+    # Few colors, like a photo after light quantization, and noise
+    photo = bytes(rng.getrandbits(5) << 3 for _ in range(count * 3 // 8)) \
+        * 8
+    noise = rng.randbytes(count * 3)
+
+    for name, pixels in (('photo', photo), ('noise', noise)):
+        print(f'{count} pixels ({name})')
+
+        measure('dict of tuples', tuples, pixels)
+        histogram = measure('ColorHistogram',
+                            lambda: dyepy.ColorHistogram().feed(pixels))
+        measure('top(10)', histogram.top, 10)
+        print(f'{"":<28} {len(histogram)} colors, dense={histogram.dense}')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,106 @@
+"""Benchmark of the import time and memory of `dyepy`.
+
+Each scenario runs in a fresh interpreter, measured twice: with
+`-X importtime` (the time of every import it makes, standard modules
+included) and with `tracemalloc` (the memory allocated by the
+scenario).
+`from dyepy import *` loads every submodule, like the eager
+`import dyepy` of the versions before the lazy imports.
+
+Run it from the repository root using:
+python -m benchmarks.bench_import [<runs per scenario>]
+"""
+
+
+import compileall
+import os
+import statistics
+import subprocess
+import sys
+
+import dyepy
+
+
+SCENARIOS = {
+    'import dyepy': 'import dyepy',
+    'dyepy.rgb2hsl(...)': 'import dyepy; dyepy.rgb2hsl(0, 120, 215)',
+    'dyepy.Styles.Fg.n(...)': 'import dyepy; dyepy.Styles.Fg.n(69)',
+    'dyepy.ColorArray': 'import dyepy; dyepy.ColorArray',
+    'from dyepy import *': 'from dyepy import *',
+    # The command-line interface, before it runs a command
+    'python -m dyepy': 'import dyepy.__main__',
+}
+
+MEMORY = '''
+import tracemalloc
+tracemalloc.start()
+{}
+import sys
+print(tracemalloc.get_traced_memory()[0],
+      len([name for name in sys.modules if name.startswith('dyepy')]))
+'''
+
+
+def top_level(code):
+    """Returns {name: cumulative import time (µs)} of the modules
+imported at the top level by *code*, from `-X importtime`
+"""
+
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            capture_output=True, text=True, check=True)
+    times = {}
+
+    # Lines: 'import time: self [us] | cumulative | imported package',
+    # a top-level import has no indentation before its name
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+
+        _, cumulative, name = line.split('|')
+
+        if name[1:2] != ' ' and cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def import_time(code, startup):
+    """Returns the import time (µs) of *code*: every top-level import,
+but the ones of the interpreter start-up (the names of *startup*),
+including the standard modules the dyepy modules import
+"""
+
+    return sum(elapsed for name, elapsed in top_level(code).items()
+               if name not in startup)
+
+
+def memory(code):
+    """Returns (bytes allocated, number of dyepy modules) of *code*
+"""
+
+    result = subprocess.run([sys.executable, '-c', MEMORY.format(code)],
+                            capture_output=True, text=True, check=True)
+    size, modules = result.stdout.split()
+
+    return int(size), int(modules)
+
+
+def main(runs=5):
+    # Compiled once, so that no run times the compilation (the .pyc
+    # files are read even where writing them is disabled)
+    compileall.compile_dir(os.path.dirname(dyepy.__file__), quiet=1)
+    startup = set(top_level('pass'))
+
+    print(f'{"scenario":<24} {"import time":>12} {"memory":>10} modules')
+
+    for label, code in SCENARIOS.items():
+        elapsed = statistics.median(import_time(code, startup)
+                                    for _ in range(runs))
+        size, modules = memory(code)
+
+        print(f'{label:<24} {elapsed / 1e3:9.2f} ms {size / 2 ** 10:7.0f} KiB \
+{modules:>7}')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,64 @@
+"""Benchmark of the overhead of `dyepy.instrument`.
+
+Times a few scalar functions before instrumentation, while enabled,
+and after `disable` (which must cost nothing, the original functions
+being put back).
+
+Run it from the repository root using:
+python -m benchmarks.bench_instrument [<number of calls>]
+"""
+
+
+import random
+import sys
+import time
+from collections import deque
+from itertools import starmap
+
+import dyepy
+from dyepy import instrument
+
+
+def timed(function, arguments):
+    """Returns the time per call of *function* on *arguments*, in ns
+"""
+
+    start = time.perf_counter_ns()
+    deque(starmap(function, arguments), 0)
+
+    return (time.perf_counter_ns() - start) / len(arguments)
+
+
+def main(count=200_000):
+    rng = random.Random(43)
+    rgbs = [(rng.randrange(256), rng.randrange(256), rng.randrange(256))
+            for _ in range(count)]
+    hexes = [(dyepy.rgb(*rgb),) for rgb in rgbs]
+    cases = {
+        'rgb2hsl': (lambda: dyepy.rgb2hsl, rgbs),
+        'hex2cmyk': (lambda: dyepy.hex2cmyk, hexes),
+        'Styles.Fg.rgb': (lambda: dyepy.Styles.Fg.rgb, rgbs),
+    }
+    originals = {name: get() for name, (get, _) in cases.items()}
+
+    print(f'{count} calls{"":<14} {"before":>10} {"enabled":>10} \
+{"disabled":>10} ns/call')
+
+    for name, (get, arguments) in cases.items():
+        before = timed(get(), arguments)
+        instrument.enable()
+        enabled = timed(get(), arguments)
+        instrument.disable()
+        disabled = timed(get(), arguments)
+
+        assert get() is originals[name]
+        print(f'{name:<24} {before:10.0f} {enabled:10.0f} {disabled:10.0f}')
+
+    instrument.enable()
+    dyepy.hex2hsl('#0078d7')
+    instrument.disable()
+    print(instrument.snapshot()['hex2hsl'])
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,58 @@
+"""Benchmark of `convert_jsonl`, in records per second.
+
+The records are {"id": ..., "rgb": [r, g, b]}, with colors drawn from
+a palette of 4096 colors (as in real data, where colors repeat) and
+all distinct (the worst case: every color is converted).
+
+Run it from the repository root using:
+python -m benchmarks.bench_jsonl [<number of records>]
+"""
+
+
+import io
+import json
+import random
+import sys
+import time
+
+import dyepy
+
+
+def records(count, palette):
+    """Returns *count* JSON lines (bytes) with colors of *palette*, or
+random colors if *palette* is None
+"""
+
+    generator = random.Random(47)
+    lines = []
+
+    for index in range(count):
+        color = generator.choice(palette) if palette else \
+            [generator.randrange(256) for _ in range(3)]
+        lines.append(json.dumps({'id': index, 'rgb': color}))
+
+    return ('\n'.join(lines) + '\n').encode()
+
+
+def main(count=500_000):
+    generator = random.Random(48)
+    palette = [[generator.randrange(256) for _ in range(3)]
+               for _ in range(4096)]
+
+    print(f'{count} records')
+
+    for label, data in (('4096 colors', records(count, palette)),
+                        ('distinct colors', records(count, None))):
+        for targets in (('hex',), ('hex', 'hsl'), ('oklch',)):
+            for batch_size in (1024, 8192):
+                start = time.perf_counter()
+                dyepy.convert_jsonl(io.BytesIO(data), io.BytesIO(), 'rgb',
+                                    targets, batch_size)
+                elapsed = time.perf_counter() - start
+
+                print(f'{label:<16} {"+".join(targets):<8} \
+batch {batch_size:>5} {count / elapsed:>12,.0f} records/s')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,45 @@
+"""Benchmark of the scaling of `dyepy.kmeans` from 1 to N processes.
+
+Run it from the repository root using:
+python -m benchmarks.bench_kmeans [<number of pixels>] [<k>]
+
+The same random pixels are clustered with 1, 2, 4, ... workers up to
+the number of CPUs, with a fixed seed and a fixed number of iterations
+(so that every run does the same work), and the time and speedup of
+each run are printed.
+"""
+
+
+import os
+import random
+import sys
+import time
+
+from dyepy.kmeans import KMeans
+
+
+def main(count=500_000, k=16):
+    rng = random.Random(29)
+    pixels = bytes(rng.getrandbits(8) for _ in range(count * 3))
+    cpus = os.cpu_count() or 1
+    workers = sorted({1, cpus, *(2 ** power for power in range(8)
+                                 if 2 ** power < cpus)})
+
+    print(f'{count} random pixels, k={k}, {cpus} CPUs')
+
+    baseline = None
+
+    for processes in workers:
+        model = KMeans(k, workers=processes, max_iterations=5, tolerance=0,
+                       seed=29)
+        start = time.perf_counter()
+        model.fit(pixels)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+
+        print(f'{processes:3} workers {elapsed:8.2f} s \
+{baseline / elapsed:6.2f}x {model.hex()[:3]}')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,60 @@
+"""Benchmark of the OKLab/OKLCh batch converters against the scalar ones.
+
+Run it from the repository root using:
+python -m benchmarks.bench_oklab [<number of colors>]
+"""
+
+
+import random
+import sys
+import time
+
+import dyepy
+
+
+def timed(label, func, *args):
+    """Runs *func* with *args*, prints and returns its result and time
+"""
+
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+
+    print(f'{label:<24} {elapsed:8.3f} s')
+
+    return result
+
+
+def main(count=1_000_000):
+    rng = random.Random(26)
+    pixels = bytes(rng.getrandbits(8) for _ in range(count * 3))
+    colors = dyepy.ColorArray.frombuffer(pixels)
+
+    print(f'{count} random colors')
+
+    lab = timed('rgb2oklab_array', dyepy.rgb2oklab_array, colors)
+    timed('oklab2rgb_array', dyepy.oklab2rgb_array, lab)
+    lch = timed('rgb2oklch_array', dyepy.rgb2oklch_array, colors)
+    timed('oklch2rgb_array', dyepy.oklch2rgb_array, lch)
+
+    # An image-like input: few colors, each repeated many times
+    palette = [pixels[index:index + 3] for index in range(0, 3 * 256, 3)]
+    colors = dyepy.ColorArray.frombuffer(
+        b''.join(rng.choice(palette) for _ in range(count)))
+
+    print(f'{count} colors of a 256-color palette')
+
+    lab = timed('rgb2oklab_array', dyepy.rgb2oklab_array, colors)
+    timed('oklab2rgb_array', dyepy.oklab2rgb_array, lab)
+    lch = timed('rgb2oklch_array', dyepy.rgb2oklch_array, colors)
+    timed('oklch2rgb_array', dyepy.oklch2rgb_array, lch)
+
+    sample = list(colors)[:count // 10]
+    scalar = timed(f'rgb2oklab x{len(sample)}',
+                   lambda: [dyepy.rgb2oklab(*color) for color in sample])
+
+    assert all(abs(x - y) < 1e-9 for x, y in zip(lab[0], scalar[0]))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
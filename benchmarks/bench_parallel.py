@@ -0,0 +1,55 @@
+"""Benchmark of `convert_many` against `convert_array`.
+
+Small inputs should cost the same (they stay in process), large ones
+less with more workers (on a machine with several CPUs); the second
+call of a size reuses the pool started by the first.
+
+Run it from the repository root using:
+python -m benchmarks.bench_parallel [<largest number of colors>]
+"""
+
+
+import os
+import random
+import sys
+import time
+
+import dyepy
+
+
+def timed(func, *args, **kwargs):
+    """Returns (the result of *func*, the seconds it took)
+"""
+
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+
+    return result, time.perf_counter() - start
+
+
+def main(count=1_000_000):
+    data = random.Random(50).randbytes(count * 3)
+    workers = sorted({1, 2, os.cpu_count() or 1})
+
+    print(f'{"colors":>9} {"space":<6} {"convert_array":>14} ' + ' '.join(
+        f'{f"{number} worker(s)":>12}' for number in workers))
+
+    for size in (1_000, 100_000, count):
+        for space in ('hsl', 'oklab'):
+            colors = dyepy.ColorArray.frombuffer(data[:size * 3])
+            expected, elapsed = timed(dyepy.convert_array, colors, space)
+            line = f'{size:>9} {space:<6} {elapsed:>12.3f} s'
+
+            for number in workers:
+                # The first call may start the pool, the second reuses it
+                dyepy.convert_many(colors, 'rgb', space, workers=number)
+                result, elapsed = timed(dyepy.convert_many, colors, 'rgb',
+                                        space, workers=number)
+                assert result == expected
+                line += f' {elapsed:>10.3f} s'
+
+            print(line)
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
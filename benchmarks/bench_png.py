@@ -0,0 +1,52 @@
+"""Benchmark of the PNG encoder and decoder, per filter strategy.
+
+Run it from the repository root using:
+python -m benchmarks.bench_png [<width> [<height>]]
+"""
+
+
+import io
+import random
+import sys
+import time
+
+import dyepy
+
+
+def main(width=1024, height=768):
+    rng = random.Random(35)
+
+    # A smooth gradient with some noise, like a photo
+    rows = [bytes(min(255, (x * 255 // width + y * 255 // height) // 2
+                       + channel * 40 + rng.randrange(8)) % 256
+                  for x in range(width) for channel in range(3))
+            for y in range(height)]
+    size = width * height * 3 / 1e6
+
+    print(f'{width}×{height} RGB, {size:.1f} MB raw')
+    print(f'{"filter":<10} {"encode":>14} {"decode":>14} {"size":>10}')
+
+    for name in ('none', 'sub', 'up', 'average', 'paeth', 'fast',
+                 'adaptive'):
+        buffer = io.BytesIO()
+
+        start = time.perf_counter()
+        dyepy.write_png(buffer, rows, width, height, filter=name)
+        encode = time.perf_counter() - start
+
+        buffer.seek(0)
+        start = time.perf_counter()
+
+        with dyepy.PNGReader(buffer) as image:
+            decoded = list(image.raw_rows())
+
+        decode = time.perf_counter() - start
+
+        assert decoded == rows
+
+        print(f'{name:<10} {size / encode:9.2f} MB/s {size / decode:9.2f} \
+MB/s {len(buffer.getvalue()) / 1e6:7.2f} MB')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,96 @@
+"""Benchmark of the octree quantizer against a naive histogram.
+
+Run it from the repository root using:
+python -m benchmarks.bench_quantize [<megapixels>] [<colors>]
+
+A synthetic photo-like image (smooth gradients with noise) of 24
+megapixels by default is streamed row by row into `OctreeQuantizer`,
+and also counted into a dict of (r, g, b) tuples, the naive way of
+finding the most common colors. Both are run twice: once for the time
+and once for the peak memory (tracemalloc slows allocations down, so
+it would skew the times).
+"""
+
+
+import random
+import sys
+import time
+import tracemalloc
+
+from dyepy.octree import OctreeQuantizer
+
+
+def image_rows(width, height, seed=28):
+    """Yields *height* rows of a synthetic image as packed RGB bytes
+"""
+
+    rng = random.Random(seed)
+    noise = bytes(rng.getrandbits(4) for _ in range(width * 4))
+    reds = bytes(x * 240 // width for x in range(width))
+
+    for y in range(height):
+        offset = rng.randrange(width * 3)
+        row = bytearray(width * 3)
+        row[0::3] = reds
+        row[1::3] = bytes([y * 200 // height + 20]) * width
+        row[2::3] = noise[offset:offset + width]
+
+        yield bytes(row)
+
+
+def measure(label, func, rows, *args):
+    """Runs *func* twice on *rows()*, prints its time and peak memory
+"""
+
+    start = time.perf_counter()
+    result = func(rows(), *args)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    func(rows(), *args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(f'{label:<18} {elapsed:8.2f} s {peak / 2 ** 20:10.1f} MiB')
+
+    return result
+
+
+def octree(rows, colors):
+    quantizer = OctreeQuantizer(colors)
+
+    for row in rows:
+        quantizer.feed(row)
+
+    return quantizer.palette()
+
+
+def naive(rows, colors):
+    counts = {}
+
+    for row in rows:
+        for pixel in zip(row[0::3], row[1::3], row[2::3]):
+            counts[pixel] = counts.get(pixel, 0) + 1
+
+    top = sorted(counts, key=counts.__getitem__, reverse=True)[:colors]
+
+    return ['#%02x%02x%02x' % pixel for pixel in top]
+
+
+def main(megapixels=24, colors=256):
+    width = 6000
+    height = round(megapixels * 1e6 / width)
+
+    print(f'{width}x{height} image, {colors} colors')
+
+    def rows():
+        return image_rows(width, height)
+
+    palette = measure('octree', octree, rows, colors)
+    measure('naive histogram', naive, rows, colors)
+
+    print(f'octree palette: {len(palette)} colors, e.g. {palette[:4]}')
+
+
+if __name__ == '__main__':
+    main(*map(float, sys.argv[1:2]), *map(int, sys.argv[2:3]))
@@ -0,0 +1,177 @@
+"""Exhaustive round-trip accuracy and speed of the scalar converters.
+
+Every 24-bit RGB color (16,777,216 of them) goes through each round
+trip, e.g. `rgb2hsl` then `hsl2rgb`, in a pool of processes (one task
+per red value). For each round trip this reports:
+
+    the maximum and mean error (absolute difference per channel),
+    a histogram of the error of each color (its largest channel error,
+    rounded, in bins of powers of 2), and how many colors are off in
+    each channel,
+    the worst color,
+    the time per million round trips (CPU time of the workers).
+
+Run it from the repository root using:
+python -m benchmarks.bench_roundtrip [-w WORKERS] [-s STEP] [-o out.json]
+
+--step 4 only checks every 4th value of each channel (1/64 of the
+colors) for a quick run; the default (1) checks all of them, which
+takes a few CPU-minutes per round trip.
+"""
+
+
+import argparse
+import json
+import sys
+import time
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+
+import dyepy.converters as scalar
+
+
+# Name: (RGB to space, space to RGB) of every round trip
+ROUND_TRIPS = {
+    'hsl': (scalar.rgb2hsl, scalar.hsl2rgb),
+    'cmyk': (scalar.rgb2cmyk, scalar.cmyk2rgb),
+    'yiq': (scalar.rgb2yiq, scalar.yiq2rgb),
+}
+
+# Upper bounds of the bins of the error histogram
+BINS = (0, 1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+def check(name, red, step):
+    """Runs the round trip *name* on every color of red value *red*,
+returns its partial statistics
+"""
+
+    forward, backward = ROUND_TRIPS[name]
+    histogram = Counter()
+    channels = [0, 0, 0]
+    total = maximum = 0.0
+    worst = None
+    count = 0
+    start = time.process_time()
+
+    for green in range(0, 256, step):
+        for blue in range(0, 256, step):
+            color = (red, green, blue)
+            back = backward(*forward(*color))
+            errors = [abs(x - y) for x, y in zip(back, color)]
+            error = max(errors)
+
+            total += sum(errors)
+            histogram[BINS[bisect_left(BINS, round(error))]] += 1
+            count += 1
+
+            if error:
+                for index, value in enumerate(errors):
+                    channels[index] += value >= 0.5
+
+                if error > maximum:
+                    maximum, worst = error, (color, tuple(back))
+
+    return {
+        'count': count,
+        'seconds': time.process_time() - start,
+        'total': total,
+        'maximum': maximum,
+        'worst': worst,
+        'histogram': histogram,
+        'channels': channels,
+    }
+
+
+def merge(results):
+    """Returns the statistics of a whole round trip from its parts
+"""
+
+    merged = {'count': 0, 'seconds': 0.0, 'total': 0.0, 'maximum': 0.0,
+              'worst': None, 'histogram': Counter(), 'channels': [0, 0, 0]}
+
+    for result in results:
+        for key in ('count', 'seconds', 'total'):
+            merged[key] += result[key]
+
+        merged['histogram'].update(result['histogram'])
+        merged['channels'] = [x + y for x, y in
+                              zip(merged['channels'], result['channels'])]
+
+        if result['maximum'] > merged['maximum']:
+            merged['maximum'] = result['maximum']
+            merged['worst'] = result['worst']
+
+    return merged
+
+
+def report(name, stats, wall):
+    """Prints the statistics of the round trip *name*
+"""
+
+    count = stats['count']
+    mean = stats['total'] / (count * 3)
+    exact = stats['histogram'][0]
+
+    print(f'rgb → {name} → rgb: {count} colors in {wall:.1f} s')
+    print(f'    {stats["seconds"] / count * 1e6:.2f} s per million round \
+trips (CPU)')
+    print(f'    error: max {stats["maximum"]:.4g}, mean {mean:.4g} per \
+channel, {exact / count:.2%} of colors exact')
+    print(f'    colors off by ≥ 0.5 in R, G, B: {stats["channels"]}')
+
+    if stats['worst'] is not None:
+        color, back = stats['worst']
+        print(f'    worst: {color} -> {tuple(round(x, 3) for x in back)}')
+
+    print('    histogram (largest channel error: colors):')
+
+    for error, number in sorted(stats['histogram'].items()):
+        print(f'    {"≤ " + str(error) if error > 2 else error:>8} \
+{number:>10} {number / count:8.3%}')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m \
+benchmarks.bench_roundtrip', description=__doc__.splitlines()[0])
+    parser.add_argument('round_trips', nargs='*', default=list(ROUND_TRIPS),
+                        help=f'round trips to check: {", ".join(ROUND_TRIPS)} \
+(default: all)')
+    parser.add_argument('-w', '--workers', type=int, default=cpu_count(),
+                        help='processes (default: every CPU)')
+    parser.add_argument('-s', '--step', type=int, default=1,
+                        help='check every STEP-th value of each channel')
+    parser.add_argument('-o', '--output', help='JSON file of results')
+    args = parser.parse_args(argv)
+
+    for name in args.round_trips:
+        if name not in ROUND_TRIPS:
+            parser.error(f'unknown round trip \'{name}\'')
+
+    output = {}
+
+    with ProcessPoolExecutor(args.workers) as pool:
+        for name in args.round_trips:
+            start = time.perf_counter()
+            reds = range(0, 256, args.step)
+            stats = merge(pool.map(check, [name] * len(reds), reds,
+                                   [args.step] * len(reds)))
+            wall = time.perf_counter() - start
+
+            report(name, stats, wall)
+
+            stats['histogram'] = dict(sorted(stats['histogram'].items()))
+            stats['wall'] = wall
+            output[name] = stats
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(output, file, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
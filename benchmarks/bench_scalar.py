@@ -0,0 +1,224 @@
+"""Microbenchmarks of every scalar function of `dyepy`.
+
+Every public function of `dyepy.converters` (constructors, `x2y`
+converters, `clamp`), `dyepy.extract` and the `Styles.Fg`/`Styles.Bg`
+helpers is timed on the same seeded inputs, so two runs (e.g. before
+and after an upgrade) can be compared function by function.
+
+Run it from the repository root using:
+python -m benchmarks.bench_scalar run [-o results.json] [-n 1000]
+python -m benchmarks.bench_scalar compare old.json new.json [-t 10]
+
+`run` prints a table and writes the results as JSON; `compare` prints
+the change of every function and exits with status 1 if any of them
+got slower by more than the threshold (in percent).
+"""
+
+
+import argparse
+import inspect
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from collections import deque
+from itertools import starmap
+
+import dyepy.converters as scalar
+import dyepy.extract as extract
+from dyepy.dyepy import __version__
+from dyepy.styles import Styles
+
+
+# Spaces whose colors can be made from an RGB color with `rgb2<space>`
+SPACES = ('rgb', 'hex', 'hsv', 'hsl', 'yiq', 'cmyk', 'oklab', 'oklch',
+          'lab')
+
+
+def colors(count, seed):
+    """Returns *count* seeded RGB tuples
+"""
+
+    rng = random.Random(seed)
+
+    return [(rng.randrange(256), rng.randrange(256), rng.randrange(256))
+            for _ in range(count)]
+
+
+def source(space, rgb):
+    """Returns the arguments of *rgb* in *space*, as a tuple
+"""
+
+    if space == 'rgb':
+        return rgb
+
+    if space == 'hex':
+        return (scalar.rgb(*rgb),)
+
+    return getattr(scalar, f'rgb2{space}')(*rgb)
+
+
+def inputs(name, rgbs, seed):
+    """Returns the list of argument tuples used to time *name*
+"""
+
+    if name == 'clamp':
+        rng = random.Random(seed)
+
+        return [(0, rng.uniform(-1, 2), 1) for _ in rgbs]
+
+    if name.startswith('Styles.') and name.endswith('.n'):
+        return [(red,) for red, _, _ in rgbs]
+
+    if name.startswith('Styles.'):
+        # The helpers take (red, blue, green)
+        return [(red, blue, green) for red, green, blue in rgbs]
+
+    if name.startswith('extract_'):
+        space = name[len('extract_'):]
+
+        if space == 'rgb':
+            return [(f'rgb{rgb}',) for rgb in rgbs]
+
+        return [(getattr(scalar, f'rgb2{space}')(*rgb, True),)
+                for rgb in rgbs]
+
+    space = name.split('2')[0]
+
+    if space not in SPACES:
+        raise ValueError(f'no inputs for \'{name}\': add them to \
+`inputs` so it is benchmarked')
+
+    return [source(space, rgb) for rgb in rgbs]
+
+
+def functions():
+    """Returns {name: function} of every benchmarked function
+"""
+
+    # Aliases (e.g. `hsb` for `hsv`) are timed once, under their name
+    found = {
+        name: function
+        for module in (scalar, extract)
+        for name, function in inspect.getmembers(module, inspect.isfunction)
+        if not name.startswith('_') and name == function.__name__
+        and function.__module__ == module.__name__
+    }
+
+    for kind in ('Fg', 'Bg'):
+        for helper in ('n', 'rgb'):
+            found[f'Styles.{kind}.{helper}'] = \
+                getattr(getattr(Styles, kind), helper)
+
+    return found
+
+
+def run(count, repeat, seed, pattern=''):
+    """Returns {name: {'best': ns, 'median': ns}} per call of every
+function whose name contains *pattern*
+"""
+
+    rgbs = colors(count, seed)
+    results = {}
+
+    for name, function in sorted(functions().items()):
+        if pattern not in name:
+            continue
+
+        arguments = inputs(name, rgbs, seed)
+        times = []
+
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            deque(starmap(function, arguments), 0)
+            times.append((time.perf_counter_ns() - start) / count)
+
+        results[name] = {'best': min(times),
+                         'median': statistics.median(times)}
+        print(f'{name:<24} {results[name]["best"]:10.0f} ns/call')
+
+    return results
+
+
+def compare(old, new, threshold):
+    """Prints the change of every function of both runs and returns the
+names of the ones slower by more than *threshold* percent
+"""
+
+    regressions = []
+
+    for name in sorted(old.keys() & new.keys()):
+        before, after = old[name]['best'], new[name]['best']
+        change = (after - before) / before * 100
+        flag = ''
+
+        if change > threshold:
+            regressions.append(name)
+            flag = '  REGRESSION'
+
+        print(f'{name:<24} {before:10.0f} {after:10.0f} ns \
+{change:+7.1f} %{flag}')
+
+    for name in sorted(old.keys() ^ new.keys()):
+        print(f'{name:<24} only in {"old" if name in old else "new"} run')
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.bench_scalar',
+                                     description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='time every function')
+    run_parser.add_argument('-o', '--output', help='JSON file of results')
+    run_parser.add_argument('-n', '--count', type=int, default=1000,
+                            help='inputs per function (default: 1000)')
+    run_parser.add_argument('-r', '--repeat', type=int, default=5,
+                            help='runs per function, the best is kept')
+    run_parser.add_argument('--seed', type=int, default=41)
+    run_parser.add_argument('-k', '--filter', default='',
+                            help='only functions containing this text')
+
+    compare_parser = commands.add_parser('compare',
+                                         help='compare two JSON results')
+    compare_parser.add_argument('old')
+    compare_parser.add_argument('new')
+    compare_parser.add_argument('-t', '--threshold', type=float, default=10,
+                                help='slowdown flagged, in percent')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        results = run(args.count, args.repeat, args.seed, args.filter)
+
+        if args.output:
+            with open(args.output, 'w') as file:
+                json.dump({
+                    'python': platform.python_version(),
+                    'platform': platform.platform(),
+                    'dyepy': __version__,
+                    'count': args.count,
+                    'repeat': args.repeat,
+                    'seed': args.seed,
+                    'results': results,
+                }, file, indent=2)
+
+        return 0
+
+    with open(args.old) as old, open(args.new) as new:
+        regressions = compare(json.load(old)['results'],
+                              json.load(new)['results'], args.threshold)
+
+    if regressions:
+        print(f'{len(regressions)} regression(s) above {args.threshold} %')
+
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
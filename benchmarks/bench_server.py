@@ -0,0 +1,167 @@
+"""Load test of the conversion server (`python -m dyepy serve`).
+
+Many clients, each on one keep-alive connection, send requests one
+after the other; the latency of every request is recorded. By default
+a server is started for each batch size given (1 means no batching),
+on localhost TCP or a Unix socket; --address tests a running server.
+
+Run it from the repository root using:
+python -m benchmarks.bench_server [-c CLIENTS] [-n REQUESTS] [-k COLORS]
+    [--path /convert] [--batch-sizes 1 1024] [--unix] [--address H:P]
+"""
+
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+# Body of the requests of every path, with *count* colors
+BODIES = {
+    '/convert': lambda colors: {'colors': colors, 'to': 'hsl'},
+    '/nearest': lambda colors: {'colors': colors},
+    '/contrast': lambda colors: {'pairs': [[color, '#ffffff']
+                                           for color in colors]},
+}
+
+
+async def client(connect, path, bodies, latencies):
+    """Sends *bodies* to *path* on one connection, appending the
+latency of each request to *latencies*
+"""
+
+    reader, writer = await connect()
+
+    try:
+        for body in bodies:
+            start = time.perf_counter()
+            writer.write(f'POST {path} HTTP/1.1\r\nHost: localhost\r\n\
+Content-Length: {len(body)}\r\n\r\n'.encode() + body)
+            status = await reader.readline()
+            length = 0
+
+            while (line := await reader.readline()) not in (b'\r\n', b''):
+                name, _, value = line.partition(b':')
+
+                if name.lower() == b'content-length':
+                    length = int(value)
+
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+
+            if b' 200 ' not in status:
+                raise RuntimeError(f'{path}: {status.decode().strip()}')
+
+    finally:
+        writer.close()
+
+
+async def load(connect, args):
+    """Runs the clients, returns (latencies, seconds)
+"""
+
+    generator = random.Random(49)
+    per_client = args.requests // args.clients
+    latencies = []
+    bodies = [[json.dumps(BODIES[args.path](
+        ['#%06x' % generator.getrandbits(24) for _ in range(args.colors)]
+    )).encode() for _ in range(per_client)] for _ in range(args.clients)]
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(connect, args.path, bodies[index],
+                                  latencies)
+                           for index in range(args.clients)))
+
+    return latencies, time.perf_counter() - start
+
+
+def report(label, latencies, seconds):
+    """Prints the latency percentiles and the throughput
+"""
+
+    cuts = statistics.quantiles(latencies, n=100)
+
+    print(f'{label:<18} {len(latencies) / seconds:>9,.0f} req/s   p50 \
+{cuts[49] * 1e3:7.2f} ms   p99 {cuts[98] * 1e3:7.2f} ms   max \
+{max(latencies) * 1e3:7.2f} ms')
+
+
+def start_server(batch_size, unix):
+    """Starts a server, returns (process, connect function)
+"""
+
+    command = [sys.executable, '-m', 'dyepy', 'serve', '--batch-size',
+               str(batch_size)]
+
+    if unix:
+        path = os.path.join(tempfile.mkdtemp(), 'dyepy.sock')
+        command += ['--unix', path]
+
+    else:
+        command += ['--port', '0']
+
+    process = subprocess.Popen(command, stderr=subprocess.PIPE, text=True)
+    # Waits for the line giving the address listened on
+    address = process.stderr.readline().split()[-1]
+
+    if unix:
+        return process, lambda: asyncio.open_unix_connection(address)
+
+    host, port = address.rsplit('/', 1)[-1].rsplit(':', 1)
+
+    return process, lambda: asyncio.open_connection(host, int(port))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m \
+benchmarks.bench_server', description=__doc__.splitlines()[0])
+    parser.add_argument('-c', '--clients', type=int, default=64,
+                        help='concurrent connections (default: 64)')
+    parser.add_argument('-n', '--requests', type=int, default=20000,
+                        help='requests in all (default: 20000)')
+    parser.add_argument('-k', '--colors', type=int, default=1,
+                        help='colors per request (default: 1)')
+    parser.add_argument('--path', choices=sorted(BODIES),
+                        default='/convert', help='route (default: /convert)')
+    parser.add_argument('--batch-sizes', type=int, nargs='+',
+                        default=[1, 1024], help='batch sizes of the servers '
+                        'started (default: 1 1024)')
+    parser.add_argument('--unix', action='store_true',
+                        help='use a Unix socket instead of TCP')
+    parser.add_argument('--address', help='HOST:PORT of a running server '
+                        '(no server is started)')
+    args = parser.parse_args(argv)
+
+    print(f'{args.clients} clients, {args.requests} requests of \
+{args.colors} color(s) to {args.path}')
+
+    if args.address:
+        host, port = args.address.rsplit(':', 1)
+        report(args.address, *asyncio.run(load(
+            lambda: asyncio.open_connection(host, int(port)), args)))
+
+        return 0
+
+    for batch_size in args.batch_sizes:
+        process, connect = start_server(batch_size, args.unix)
+
+        try:
+            report(f'batch size {batch_size}',
+                   *asyncio.run(load(connect, args)))
+
+        finally:
+            process.terminate()
+            process.wait()
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
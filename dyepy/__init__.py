@@ -1 +1,110 @@
-from dyepy.dyepy import *
\ No newline at end of file
+"""DyePy, a styling and color conversion package.
+
+Every public name is importable from `dyepy` directly, e.g.
+`dyepy.rgb2hsl` or `from dyepy import ColorArray`, but the submodule
+defining it is only imported when the name is first used (PEP 562),
+so `import dyepy` itself costs next to nothing: a script that only
+converts a few colors never builds the named colors, the lookup tables
+of the batch converters or the image codecs.
+
+Separate documentation for each function and class written with them.
+To read the documentation, type `help(<function/class>)` into the CLI
+"""
+
+
+import sys as _sys
+from importlib import import_module as _import_module
+from types import ModuleType as _ModuleType
+
+
+# Public names of every submodule, imported on first use
+_EXPORTS = {
+    'styles': ('Styles',),
+    'colors': ('Colors',),
+    'converters': (
+        'clamp', 'rgb', 'hsv', 'hsb', 'hsl', 'yiq', 'cmyk', 'oklab', 'oklch',
+        'hex2rgb', 'hex2hsv', 'hex2hsl', 'hex2yiq', 'hex2cmyk', 'hex2oklab',
+        'hex2oklch', 'rgb2hsv', 'rgb2hsl', 'rgb2yiq', 'rgb2cmyk', 'hsv2rgb',
+        'hsv2hsl', 'hsv2yiq', 'hsv2cmyk', 'hsl2rgb', 'hsl2hsv', 'hsl2yiq',
+        'hsl2cmyk', 'yiq2rgb', 'yiq2hsv', 'yiq2hsl', 'yiq2cmyk', 'cmyk2rgb',
+        'cmyk2hsv', 'cmyk2hsl', 'cmyk2yiq', 'rgb2oklab', 'rgb2oklch',
+        'oklab2rgb', 'oklab2oklch', 'oklch2rgb', 'oklch2oklab', 'rgb2lab',
+        'lab2rgb',
+    ),
+    'extract': ('extract_rgb', 'extract_hsv', 'extract_hsl', 'extract_yiq',
+                'extract_cmyk'),
+    'batch': (
+        'ColorArray', 'as_color_array', 'as_rgb', 'convert_array',
+        'oklab2oklch_array', 'oklab2rgb_array', 'oklch2oklab_array',
+        'oklch2rgb_array', 'rgb2lab_array', 'rgb2oklab_array',
+        'rgb2oklch_array',
+    ),
+    'csvconvert': ('convert_csv',),
+    'deltae': ('delta_e', 'delta_e_matrix', 'delta_e_nearest',
+               'delta_e_one_to_many', 'delta_e_pairs', 'named_palette'),
+    'octree': ('OctreeQuantizer', 'quantize'),
+    'kmeans': ('KMeans', 'kmeans_palette'),
+    'dither': ('XTERM_PALETTE', 'PaletteIndex', 'floyd_steinberg',
+               'ordered_dither'),
+    'gradient': ('Gradient',),
+    'colormap': ('Colormap',),
+    'heatmap': ('HEATMAP_STOPS', 'heatmap', 'render_heatmap'),
+    'netpbm': ('PNMImage', 'PNMWriter', 'read_pnm', 'write_pnm'),
+    'png': ('PNGReader', 'PNGWriter', 'read_png', 'write_png'),
+    'imageconvert': ('PLANES', 'convert_image'),
+    'jsonl': ('convert_jsonl',),
+    'histogram': ('ColorHistogram', 'top_colors'),
+    'contrast': ('WCAG_LEVELS', 'accessible_color', 'accessible_palette',
+                 'contrast_failures', 'contrast_matrix', 'contrast_ratio',
+                 'luminance_array', 'relative_luminance', 'wcag_level'),
+    'cvd': ('CVD_MATRICES', 'cvd_confusions', 'cvd_distinguishable',
+            'cvd_matrix', 'simulate_cvd'),
+    'parallel': ('convert_many',),
+    'profiler': ('Profile', 'profile'),
+    'server': ('Batcher', 'ColorServer', 'serve'),
+}
+
+# Submodule of every public name
+_MODULES = {name: module for module, names in _EXPORTS.items()
+            for name in names}
+
+# Submodules reachable as attributes, e.g. `dyepy.batch`
+_SUBMODULES = frozenset(_EXPORTS) | {'dyepy', 'instrument'}
+
+# `from dyepy import *` still gets every public name
+__all__ = list(_MODULES)
+
+
+# Hidden module `__getattr__` importing the submodule of a name (PEP 562)
+def __getattr__(name):
+    if name in _MODULES:
+        value = getattr(_import_module(f'dyepy.{_MODULES[name]}'), name)
+
+    elif name in _SUBMODULES:
+        value = _import_module(f'dyepy.{name}')
+
+    else:
+        raise AttributeError(f'module \'dyepy\' has no attribute \'{name}\'')
+
+    # Later lookups find it directly, without calling `__getattr__`
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULES) | _SUBMODULES)
+
+
+# Hidden class of the package module, so that a function named like
+# its submodule (`dyepy.heatmap`) stays the function once imported
+class _Package(_ModuleType):
+    def __setattr__(self, name, value):
+        # The import system binds every imported submodule on the package
+        if isinstance(value, _ModuleType) and _MODULES.get(name) == name:
+            value = getattr(value, name)
+
+        super().__setattr__(name, value)
+
+
+_sys.modules[__name__].__class__ = _Package
@@ -0,0 +1,524 @@
+"""Command-line interface of DyePy.
+
+Run `python -m dyepy --help` for the list of commands, and
+`python -m dyepy <command> --help` for the options of each of them.
+
+The color commands (`convert`, `nearest`, `swatch`) take any number of
+values as arguments, or one per line from the standard input when none
+is given (or '-'), and write all of their output at once, one line per
+value, so they suit shell pipelines and batches of thousands of
+colors. A value that cannot be read gives an empty line (so the lines
+still match the input) and an error on the standard error.
+
+E.g.:
+python -m dyepy convert --from hsl --to hex 'hsl(207, 1, 0.42)' 120,1,0.5
+python -m dyepy convert --to oklch < colors.txt
+python -m dyepy nearest '#ff0001' 'rgb(0, 120, 210)'
+python -m dyepy swatch windowsblue '#c0ffee'
+python -m dyepy jsonl --field rgb --to hex hsl < in.jsonl > out.jsonl
+python -m dyepy csv colors.csv --columns color --to hex hsl -o out.csv
+python -m dyepy serve --port 8765
+python -m dyepy image-convert photo.png --space yiq --workers 8
+"""
+
+
+import argparse
+import re
+import sys
+from functools import lru_cache
+
+import dyepy.converters as _converters
+from dyepy.batch import _yiq2rgb, as_rgb
+from dyepy.contrast import relative_luminance
+from dyepy.deltae import delta_e_nearest, named_palette
+from dyepy.styles import Styles
+
+
+# Color spaces of the color commands, 'hex' being '#rrggbb' strings
+_SPACES = ('hex', 'rgb', 'hsv', 'hsl', 'yiq', 'cmyk', 'oklab', 'oklch', 'lab')
+
+# Color spaces of the file commands (the keys of `PLANES` of
+# `dyepy.imageconvert`, which is only imported to run them)
+_FILE_SPACES = tuple(sorted(_SPACES[1:]))
+
+# A number in a value, e.g. each of '120, 1, 0.5' or 'hsl(120 1 .5)'
+_NUMBER = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+
+# Space: function converting its values to RGB
+_TO_RGB = {
+    'hex': _converters.hex2rgb,
+    'rgb': lambda red, green, blue: (red, green, blue),
+    **{space: getattr(_converters, f'{space}2rgb') for space in _SPACES[2:]},
+    # YIQ values in the 0-255 units of `rgb2yiq`, i.e. of the output
+    'yiq': _yiq2rgb,
+}
+
+# Space: function converting RGB values to it
+_FROM_RGB = {
+    'hex': _converters.rgb,
+    'rgb': lambda red, green, blue: (round(red), round(green), round(blue)),
+    **{space: getattr(_converters, f'rgb2{space}') for space in _SPACES[2:]},
+}
+
+
+# Hidden function `_pipeline` to make the converter between two spaces
+def _pipeline(source, target):
+    """Returns the function converting values of *source* to *target*:
+the direct `source2target` converter if there is one, else through RGB
+(always from 'yiq', as the `yiq2...` converters take values in [0, 1])
+"""
+
+    direct = getattr(_converters, f'{source}2{target}', None)
+
+    if direct is not None and target not in ('hex', 'rgb') \
+            and source != 'yiq':
+        return direct
+
+    to_rgb, from_rgb = _TO_RGB[source], _FROM_RGB[target]
+
+    return lambda *values: from_rgb(*to_rgb(*values))
+
+
+# (Source, target): converter of every pair of spaces, 'auto' values
+# being parsed straight to RGB
+_CONVERTERS = {
+    (source, target): _pipeline('rgb' if source == 'auto' else source,
+                                target)
+    for source in ('auto',) + _SPACES for target in _SPACES
+}
+
+
+# Hidden function `_parse` to read a value given on the command line
+def _parse(text, space):
+    """Returns the values (a tuple, to be unpacked into a converter) of
+the color *text* written in *space*
+
+'auto' reads anything `as_rgb` accepts (Hex, names, functional
+strings); the other spaces also accept plain numbers separated by
+commas or spaces, e.g. '207, 1, 0.42' for 'hsl'.
+"""
+
+    if space == 'auto':
+        return as_rgb(text)
+
+    if space == 'hex':
+        return (text.strip(),)
+
+    numbers = [float(number) for number in _NUMBER.findall(text)]
+
+    if len(numbers) != (4 if space == 'cmyk' else 3):
+        raise ValueError(f'\'{text}\' is not a color of space \'{space}\'')
+
+    if space == 'rgb':
+        return tuple(round(number) for number in numbers)
+
+    return tuple(numbers)
+
+
+# Hidden function `_values` to get the values of a color command
+def _values(args):
+    """Returns the values given as arguments, else the non-blank lines
+of the standard input (read at once)
+"""
+
+    values = args.values
+
+    if not values or values == ['-']:
+        values = sys.stdin.read().splitlines()
+
+    return [value for value in values if value.strip()]
+
+
+# Hidden function `_finish` to write the output of a color command
+def _finish(command, lines, errors):
+    """Writes *lines* to the standard output and *errors* to the
+standard error, each in a single write; returns the exit status
+"""
+
+    sys.stdout.write(''.join(line + '\n' for line in lines))
+
+    if errors:
+        sys.stderr.write(''.join(f'python -m dyepy {command}: {error}\n'
+                                 for error in errors))
+
+        return 1
+
+    return 0
+
+
+# Hidden function `_rgb_values` to read the values of a color command
+def _rgb_values(args):
+    """Returns (the values, the RGB tuple of each of them or None for
+the invalid ones, the list of errors)
+"""
+
+    parse, to_rgb = _parse, _CONVERTERS[args.source, 'rgb']
+    texts, colors, errors = _values(args), [], []
+
+    for text in texts:
+        try:
+            colors.append(to_rgb(*parse(text, args.source)))
+
+        except (TypeError, ValueError) as error:
+            colors.append(None)
+            errors.append(f'\'{text}\': {error}')
+
+    return texts, colors, errors
+
+
+# Hidden function `_convert` to run the `convert` command
+def _convert(args):
+    """Converts every value from the space `--from` to `--to`
+"""
+
+    parse, source, target = _parse, args.source, args.target
+    convert = _CONVERTERS[source, target]
+    precision = args.precision
+
+    def number(value):
+        # +0.0 turns -0.0 into 0.0
+        return f'{round(value, precision) + 0.0:g}'
+
+    if target == 'hex':
+        write = str
+
+    elif args.format == 'css':
+        def write(values):
+            return f'{target}({", ".join(map(number, values))})'
+
+    else:
+        def write(values):
+            return ' '.join(map(number, values))
+
+    # Repeated values (common in real data) are converted once
+    @lru_cache(2 ** 16)
+    def line(text):
+        return write(convert(*parse(text, source)))
+
+    lines, errors = [], []
+
+    for text in _values(args):
+        try:
+            lines.append(line(text))
+
+        except (TypeError, ValueError) as error:
+            lines.append('')
+            errors.append(f'\'{text}\': {error}')
+
+    return _finish(args.command, lines, errors)
+
+
+# Hidden function `_nearest` to run the `nearest` command
+def _nearest(args):
+    """Prints the name, Hex code and Delta E of the nearest palette
+color of every value
+"""
+
+    _, colors, errors = _rgb_values(args)
+    names, codes = named_palette(args.palette)
+    # Each distinct color is matched once, all of them in one batch
+    unique = list(dict.fromkeys(color for color in colors
+                                if color is not None))
+    indexes, distances = delta_e_nearest(unique, codes, args.method) \
+        if unique else ((), ())
+    matches = {color: f'{names[index]} {codes[index]} {distance:.2f}'
+               for color, index, distance in zip(unique, indexes, distances)}
+    lines = [matches.get(color, '') for color in colors]
+
+    return _finish(args.command, lines, errors)
+
+
+# Hidden function `_swatch` to run the `swatch` command
+def _swatch(args):
+    """Prints a block of truecolor of every value, labeled with its Hex
+code in black or white (whichever contrasts more), and the value
+"""
+
+    texts, colors, errors = _rgb_values(args)
+    width = args.width
+    lines = []
+
+    for text, color in zip(texts, colors):
+        if color is None:
+            lines.append('')
+            continue
+
+        code = _converters.rgb(*color)
+        # Above this luminance, black text contrasts more than white
+        ink = (0, 0, 0) if relative_luminance(color) > 0.179 \
+            else (255, 255, 255)
+        label = code.center(width) if width >= len(code) else ' ' * width
+        lines.append(f'{Styles.Bg.rgb(*color)}{Styles.Fg.rgb(*ink)}{label}\
+{Styles.RESET} {text.strip()}')
+
+    return _finish(args.command, lines, errors)
+
+
+# Hidden function `_jsonl` to run the `jsonl` command
+def _jsonl(args):
+    """Adds the converted color fields to the JSON lines of the standard
+input (or a file), written to the standard output (or a file)
+"""
+
+    from dyepy.jsonl import convert_jsonl
+
+    targets = [tuple(target.split('=', 1)[::-1]) if '=' in target
+               else target for target in args.targets]
+    source = sys.stdin.buffer if args.input == '-' else open(args.input, 'rb')
+    output = sys.stdout.buffer if args.output == '-' \
+        else open(args.output, 'wb')
+
+    try:
+        convert_jsonl(source, output, args.field, targets, args.batch_size,
+                      args.precision)
+
+    finally:
+        for file in (source, output):
+            if file not in (sys.stdin.buffer, sys.stdout.buffer):
+                file.close()
+
+
+# Hidden function `_csv` to run the `csv` command
+def _csv(args):
+    """Adds the converted color columns to a CSV or TSV file, written to
+a file or the standard output
+"""
+
+    from dyepy.csvconvert import convert_csv
+
+    delimiter = '\t' if args.tsv else args.delimiter
+    output = sys.stdout.buffer if args.output == '-' else args.output
+    convert_csv(args.input, output, args.columns, args.targets,
+                args.workers, args.chunk_size, delimiter, args.precision,
+                args.encoding)
+
+
+# Hidden function `_serve` to run the `serve` command
+def _serve(args):
+    """Runs the conversion server until interrupted (Ctrl+C)
+"""
+
+    import asyncio
+
+    from dyepy.server import serve
+
+    def ready(address):
+        if isinstance(address, tuple):
+            address = f'http://{address[0]}:{address[1]}'
+
+        sys.stderr.write(f'python -m dyepy serve: serving on {address}\n')
+        sys.stderr.flush()
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.batch_size,
+                          args.batch_delay, ready))
+
+    except KeyboardInterrupt:
+        pass
+
+
+# Hidden function `_image_convert` to run the `image-convert` command
+def _image_convert(args):
+    """Converts an image into channel planes and prints their paths
+"""
+
+    from dyepy.imageconvert import convert_image
+
+    output = args.output
+
+    if output is None:
+        output = args.input.rsplit('.', 1)[0]
+
+    paths = convert_image(args.input, output, args.space, args.tile,
+                          args.workers, args.depth, args.format)
+    sys.stdout.write(''.join(path + '\n' for path in paths))
+
+
+# Hidden function `_parser` to build the argument parser
+def _parser():
+    """Returns the `argparse` parser of every command
+"""
+
+    parser = argparse.ArgumentParser(
+        prog='python -m dyepy',
+        description='DyePy color conversion tools.',
+    )
+    commands = parser.add_subparsers(dest='command', metavar='command',
+                                     required=True)
+
+    # Arguments shared by the color commands
+    values = argparse.ArgumentParser(add_help=False)
+    values.add_argument('values', nargs='*', metavar='value',
+                        help='colors (default: one per line of the '
+                             'standard input)')
+    values.add_argument('--from', dest='source', choices=('auto',) + _SPACES,
+                        default='auto', help='space of the values (default: '
+                        'auto, any Hex code, name or functional string)')
+
+    convert = commands.add_parser(
+        'convert', parents=[values],
+        help='convert colors to another space',
+        description='Converts colors from one space to another, e.g. '
+                    '`convert --from hsl --to hex 207,1,0.42`.',
+    )
+    convert.add_argument('--to', dest='target', choices=_SPACES,
+                         default='hex', help='target space (default: hex)')
+    convert.add_argument('-f', '--format', choices=('css', 'plain'),
+                         default='css', help='css: \'hsl(207, 1, 0.42)\', '
+                         'plain: \'207 1 0.42\' (default: css)')
+    convert.add_argument('-p', '--precision', type=int, default=4,
+                         help='decimals of the values (default: 4)')
+    convert.set_defaults(run=_convert)
+
+    nearest = commands.add_parser(
+        'nearest', parents=[values],
+        help='find the nearest named color',
+        description='Prints the name, Hex code and Delta E of the palette '
+                    'color nearest to each color.',
+    )
+    nearest.add_argument('-p', '--palette', choices=('css', 'xterm'),
+                         default='css', help='css: the names of `Colors`, '
+                         'xterm: the 256 terminal colors (default: css)')
+    nearest.add_argument('-m', '--method',
+                         choices=('cie76', 'cie94', 'ciede2000'),
+                         default='ciede2000',
+                         help='Delta E formula (default: ciede2000)')
+    nearest.set_defaults(run=_nearest)
+
+    swatch = commands.add_parser(
+        'swatch', parents=[values],
+        help='show colors in the terminal',
+        description='Prints a truecolor block of each color, labeled with '
+                    'its Hex code.',
+    )
+    swatch.add_argument('-w', '--width', type=int, default=11,
+                        help='width of the blocks (default: 11)')
+    swatch.set_defaults(run=_swatch)
+
+    jsonl = commands.add_parser(
+        'jsonl',
+        help='add converted color fields to JSON lines',
+        description='Reads JSON objects, one per line, and writes them with '
+                    'one new field per target space, converted from their '
+                    'color field, e.g. {"rgb": [0, 120, 215]} -> '
+                    '{"rgb": [0, 120, 215], "hex": "#0078d7"}.',
+    )
+    jsonl.add_argument('input', nargs='?', default='-',
+                       help='path of the JSON lines (default: the standard '
+                            'input)')
+    jsonl.add_argument('-o', '--output', default='-',
+                       help='path of the output (default: the standard '
+                            'output)')
+    jsonl.add_argument('--field', default='rgb',
+                       help='color field of the records: [r, g, b] lists, '
+                            'Hex codes, names... (default: rgb)')
+    jsonl.add_argument('--to', dest='targets', nargs='+', default=['hex'],
+                       metavar='SPACE[=FIELD]',
+                       help='target spaces, each added as the field named '
+                            'like it or FIELD, e.g. --to hex hsl=color_hsl '
+                            '(default: hex)')
+    jsonl.add_argument('-b', '--batch-size', type=int, default=8192,
+                       help='records per micro-batch (default: 8192)')
+    jsonl.add_argument('-p', '--precision', type=int, default=4,
+                       help='decimals of the values (default: 4)')
+    jsonl.set_defaults(run=_jsonl)
+
+    table = commands.add_parser(
+        'csv',
+        help='add converted color columns to a CSV or TSV file',
+        description='Adds to a CSV or TSV file (with a header) new columns '
+                    'with the colors of the given columns converted to each '
+                    'target space, converting chunks of the file in a '
+                    'process pool.',
+    )
+    table.add_argument('input', help='path of the CSV or TSV file')
+    table.add_argument('-c', '--columns', nargs='+', required=True,
+                       help='names of the color columns')
+    table.add_argument('--to', dest='targets', nargs='+', default=['hex'],
+                       choices=('hex',) + _FILE_SPACES, metavar='SPACE',
+                       help='target spaces: hex, ' + ', '.join(_FILE_SPACES)
+                            + ' (default: hex)')
+    table.add_argument('-o', '--output', default='-',
+                       help='path of the output (default: the standard '
+                            'output)')
+    table.add_argument('-w', '--workers', type=int, default=None,
+                       help='number of processes (default: every CPU)')
+    table.add_argument('--chunk-size', type=int, default=1 << 20,
+                       help='bytes per chunk (default: 1 MiB)')
+    table.add_argument('-d', '--delimiter', default=None,
+                       help='field delimiter (default: a tab for .tsv '
+                            'files, a comma otherwise)')
+    table.add_argument('-t', '--tsv', action='store_true',
+                       help='tab-separated values, same as -d \'\\t\'')
+    table.add_argument('-p', '--precision', type=int, default=4,
+                       help='decimals of the values (default: 4)')
+    table.add_argument('--encoding', default='utf-8',
+                       help='encoding of the file (default: utf-8)')
+    table.set_defaults(run=_csv)
+
+    server = commands.add_parser(
+        'serve',
+        help='run a local HTTP/JSON conversion server',
+        description='Serves POST /convert, /nearest and /contrast (JSON, '
+                    'HTTP/1.1 with keep-alive) on localhost or a Unix '
+                    'socket, merging concurrent requests into batches. See '
+                    '`help(dyepy.server)` for the requests.',
+    )
+    server.add_argument('--host', default='127.0.0.1',
+                        help='address to listen on (default: 127.0.0.1)')
+    server.add_argument('--port', type=int, default=8765,
+                        help='TCP port, 0 for any free one (default: 8765)')
+    server.add_argument('--unix', metavar='PATH', default=None,
+                        help='listen on this Unix socket instead of TCP')
+    server.add_argument('-b', '--batch-size', type=int, default=1024,
+                        help='most colors per batch (default: 1024)')
+    server.add_argument('--batch-delay', type=float, default=0.0,
+                        help='seconds a request may wait to be batched '
+                             '(default: 0, only the requests read at once)')
+    server.set_defaults(run=_serve)
+
+    image = commands.add_parser(
+        'image-convert',
+        help='convert an image into one gray image per channel',
+        description='Converts an RGB image (PNG, PPM or PGM) to another '
+                    'color space, tile by tile in a process pool, and '
+                    'writes each channel as a separate gray image '
+                    '<output>.<channel>.<format>.',
+    )
+    image.add_argument('input', help='path of the PNG, PPM or PGM image')
+    image.add_argument('-s', '--space', choices=_FILE_SPACES,
+                       default='hsv', help='target space (default: hsv)')
+    image.add_argument('-o', '--output', help='path prefix of the planes '
+                       '(default: the input path without its extension)')
+    image.add_argument('-t', '--tile', type=int, default=256,
+                       help='side of the tiles in pixels (default: 256)')
+    image.add_argument('-w', '--workers', type=int, default=None,
+                       help='number of processes (default: every CPU)')
+    image.add_argument('-d', '--depth', type=int, choices=(8, 16),
+                       default=8, help='bits per sample (default: 8)')
+    image.add_argument('-f', '--format', choices=('pgm', 'png'),
+                       default='pgm', help='format of the planes '
+                       '(default: pgm)')
+    image.set_defaults(run=_image_convert)
+
+    return parser
+
+
+# A function to run the command-line interface
+def main(argv=None):
+    """Runs the command given by *argv* (default: sys.argv[1:])
+"""
+
+    args = _parser().parse_args(argv)
+
+    try:
+        return args.run(args) or 0
+
+    except (OSError, TypeError, ValueError) as error:
+        sys.stderr.write(f'python -m dyepy {args.command}: {error}\n')
+
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
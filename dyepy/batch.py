@@ -0,0 +1,771 @@
+"""Module with packed color arrays and batch (array) color converters.
+
+The scalar converters of `dyepy` check, convert and return one color
+per call, which is fine for a handful of colors but far too slow for
+whole palettes or images. This module stores many colors in one packed
+`array.array` (a `ColorArray`) and converts all of them at once, with
+lookup tables in place of repeated math, and each distinct color
+converted once where colors repeat (as they do in images).
+
+Separate documentation for each function and class written with them.
+To read the documentation, type `help(<function/class>)` into the CLI
+"""
+
+
+from array import array
+from bisect import bisect
+from colorsys import hls_to_rgb, hsv_to_rgb, rgb_to_hls, rgb_to_hsv
+from itertools import chain
+from math import atan2, cos, degrees, hypot, radians, sin
+from sys import byteorder
+
+from dyepy.colors import Colors
+from dyepy.converters import _D65, _SRGB_TO_LINEAR, _srgb2linear, _type, \
+    cmyk2rgb, hex2rgb, hsl2rgb, hsv2rgb, lab2rgb, oklab2rgb, oklch2rgb, \
+    rgb2cmyk, rgb2hsl, rgb2hsv, rgb2yiq, yiq2rgb
+
+
+# Typecode and number of channels of every supported color space
+_SPACES = {
+    'rgb': ('B', 3),
+    'hsv': ('d', 3),
+    'hsl': ('d', 3),
+    'yiq': ('d', 3),
+    'cmyk': ('d', 4),
+    'oklab': ('d', 3),
+    'oklch': ('d', 3),
+    'lab': ('d', 3),
+}
+
+# Functional notations accepted in color strings, e.g.: 'hsl(0, 1, 0.5)'
+_TO_RGB = {
+    'hsv': hsv2rgb,
+    'hsb': hsv2rgb,
+    'hsl': hsl2rgb,
+    'yiq': yiq2rgb,
+    'cmyk': cmyk2rgb,
+    'oklab': oklab2rgb,
+    'oklch': oklch2rgb,
+    'lab': lab2rgb,
+}
+
+# Linear-light boundaries between consecutive 8-bit sRGB values, used
+# to encode linear values back to 8 bits with a (C-level) bisection
+_LINEAR_BOUNDS = tuple(_srgb2linear((value + 0.5) / 255)
+                       for value in range(255))
+
+
+# Hidden function `_linear2byte` to encode a linear-light value to 8 bits
+def _linear2byte(channel, _bounds=_LINEAR_BOUNDS):
+    """Returns the rounded 8-bit sRGB value of a linear-light *channel*
+"""
+
+    return bisect(_bounds, channel)
+
+
+# Hidden function `_rgb_values` to check and round RGB values
+def _rgb_values(values):
+    """Returns red, green, blue *values* rounded to ints, checked like
+the arguments of `rgb`
+"""
+
+    for color_value in values:
+        if type(color_value) not in (int, float):
+            raise TypeError(f'\'{color_value}\' must be of type \
+\'int\' or \'float\', not {_type(color_value)}')
+
+        elif color_value < 0 or color_value > 255:
+            raise ValueError(f'\'color_value\' must be ≥ 0 and ≤ 255, \
+not \'{color_value}\'')
+
+    return tuple(round(value) for value in values)
+
+
+# A function to parse any single color into red, green, blue values
+def as_rgb(color):
+    """Returns red, green, blue values of *color* as a tuple of ints
+
+*color* may be any of:
+    a Hex string: '#0078d7' or '#07d'
+    a color name from `Colors`: 'windowsblue' or 'WINDOWSBLUE'
+    a functional string: 'rgb(0, 120, 215)', 'hsl(207, 1, 0.42)',
+        'hsv(...)', 'yiq(...)', 'cmyk(...)', 'oklab(...)', 'oklch(...)',
+        'lab(...)'
+    a packed int: 0x0078d7
+    an RGB tuple or list: (0, 120, 215)
+"""
+
+    if isinstance(color, str):
+        color = color.strip()
+
+        if color.startswith('#'):
+            return hex2rgb(color)
+
+        if '(' in color:
+            space, _, values = color.partition('(')
+            space = space.strip().lower()
+            values = [float(value) for value in
+                      values.replace(')', '').split(',')]
+
+            if space in ('rgb', 'rgba'):
+                return _rgb_values(values[:3])
+
+            if space not in _TO_RGB:
+                raise ValueError(f'unknown color space \'{space}\'')
+
+            return tuple(round(value) for value in _TO_RGB[space](*values))
+
+        hexcode = getattr(Colors, color.upper(), None)
+
+        if not isinstance(hexcode, str):
+            raise ValueError(f'unknown color \'{color}\'')
+
+        return hex2rgb(hexcode)
+
+    if type(color) is int:
+        if color < 0 or color > 0xffffff:
+            raise ValueError(f'\'color\' must be ≥ 0 and ≤ 0xffffff, not \
+\'{color}\'')
+
+        return (color >> 16, color >> 8 & 255, color & 255)
+
+    if isinstance(color, (tuple, list)) and len(color) == 3:
+        return _rgb_values(color)
+
+    raise TypeError(f'unacceptable color {color!r} of type {_type(color)}')
+
+
+# A class to hold many colors of one color space in a packed array
+class ColorArray:
+    """ColorArray class
+
+A packed, flat array of colors of one color space. RGB colors are
+stored as unsigned bytes (r, g, b, r, g, b, ...), all other spaces as
+doubles, so a million colors take 3 MB (RGB) or 24 MB (others)
+instead of hundreds of MB of tuples.
+
+E.g.:
+colors = ColorArray.fromcolors(['#ff0000', 'rgb(0, 128, 0)', 'navy'])
+colors = ColorArray.frombuffer(open('image.rgb', 'rb').read())
+lab = rgb2oklab_array(colors)
+lab[0] -> (0.627..., 0.224..., 0.125...)
+
+Supported spaces: rgb, hsv, hsl, yiq, cmyk, oklab, oklch, lab
+"""
+
+    __slots__ = ('space', 'channels', 'data')
+
+    def __init__(self, space='rgb', data=()):
+        if space not in _SPACES:
+            raise ValueError(f'unknown color space \'{space}\'')
+
+        typecode, self.channels = _SPACES[space]
+        self.space = space
+
+        if isinstance(data, array) and data.typecode == typecode:
+            self.data = data
+
+        else:
+            self.data = array(typecode, data)
+
+        if len(self.data) % self.channels:
+            raise ValueError(f'data length must be a multiple of \
+{self.channels} for \'{space}\', not {len(self.data)}')
+
+    @classmethod
+    def frombuffer(cls, buffer, space='rgb'):
+        """Returns a ColorArray of the raw machine values in *buffer*
+
+*buffer* can be any bytes-like object (bytes, bytearray, memoryview,
+mmap), e.g. packed 8-bit RGB pixels: b'\\xff\\x00\\x00\\x00\\xff\\x00'
+"""
+
+        colors = cls(space)
+        colors.data.frombytes(buffer)
+
+        if len(colors.data) % colors.channels:
+            raise ValueError(f'buffer length must be a multiple of \
+{colors.channels} values for \'{space}\'')
+
+        return colors
+
+    @classmethod
+    def fromcolors(cls, colors):
+        """Returns an RGB ColorArray of any colors accepted by `as_rgb`
+"""
+
+        if isinstance(colors, cls):
+            return colors
+
+        return cls('rgb', chain.from_iterable(map(as_rgb, colors)))
+
+    @classmethod
+    def frompacked(cls, packed):
+        """Returns an RGB ColorArray of packed 0xRRGGBB ints
+"""
+
+        packed = array('I', packed)
+
+        if byteorder == 'big':
+            packed.byteswap()
+
+        raw = packed.tobytes()
+        data = bytearray(len(packed) * 3)
+        data[0::3] = raw[2::4]
+        data[1::3] = raw[1::4]
+        data[2::3] = raw[0::4]
+
+        return cls.frombuffer(data)
+
+    def __len__(self):
+        return len(self.data) // self.channels
+
+    def __iter__(self):
+        data, channels = self.data, self.channels
+
+        return zip(*(data[index::channels] for index in range(channels)))
+
+    def __getitem__(self, index):
+        channels = self.channels
+
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+
+            if step != 1:
+                raise ValueError('ColorArray slices must be contiguous')
+
+            return ColorArray(self.space,
+                              self.data[start * channels:stop * channels])
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError('ColorArray index out of range')
+
+        return tuple(self.data[index * channels:(index + 1) * channels])
+
+    def __eq__(self, other):
+        if not isinstance(other, ColorArray):
+            return NotImplemented
+
+        return self.space == other.space and self.data == other.data
+
+    def __repr__(self):
+        return f'ColorArray({self.space!r}, <{len(self)} colors>)'
+
+    def append(self, color):
+        """Appends one *color* (a tuple of channel values) to the array
+"""
+
+        if len(color) != self.channels:
+            raise ValueError(f'\'{self.space}\' colors have \
+{self.channels} channels, not {len(color)}')
+
+        self.data.extend(color)
+
+    def channel(self, index):
+        """Returns a copy of channel *index* of every color as an array
+"""
+
+        return self.data[index::self.channels]
+
+    def tobytes(self):
+        """Returns the raw machine values of the array as bytes
+"""
+
+        return self.data.tobytes()
+
+    def packed(self):
+        """Returns RGB colors as an array('I') of 0xRRGGBB ints
+"""
+
+        if self.space != 'rgb':
+            raise ValueError(f'only \'rgb\' colors can be packed, \
+not \'{self.space}\'')
+
+        raw = bytearray(len(self) * 4)
+
+        # Reorder the bytes so that every 4 of them read as one
+        # native unsigned int, which is done by C-level slicing
+        if byteorder == 'little':
+            raw[0::4] = self.data[2::3]
+            raw[1::4] = self.data[1::3]
+            raw[2::4] = self.data[0::3]
+
+        else:
+            raw[1::4] = self.data[0::3]
+            raw[2::4] = self.data[1::3]
+            raw[3::4] = self.data[2::3]
+
+        packed = array('I')
+        packed.frombytes(raw)
+
+        return packed
+
+    def hex(self):
+        """Returns RGB colors as a list of Hex strings, like `rgb`
+"""
+
+        if self.space != 'rgb':
+            raise ValueError(f'only \'rgb\' colors can be turned to \
+Hex, not \'{self.space}\'')
+
+        return ['#%06x' % value for value in self.packed()]
+
+
+# A function to turn any colors into an RGB `ColorArray`
+def as_color_array(colors, space='rgb'):
+    """Returns *colors* as a `ColorArray` of the color space *space*
+
+*colors* may be a ColorArray, a bytes-like object of packed
+machine values, or an iterable of colors (for RGB, anything
+accepted by `as_rgb`, else tuples of channel values)
+"""
+
+    if isinstance(colors, ColorArray):
+        if colors.space != space:
+            raise ValueError(f'expected \'{space}\' colors, not \
+\'{colors.space}\'')
+
+        return colors
+
+    if isinstance(colors, (bytes, bytearray, memoryview)):
+        return ColorArray.frombuffer(colors, space)
+
+    if space == 'rgb':
+        return ColorArray.fromcolors(colors)
+
+    return ColorArray(space, chain.from_iterable(colors))
+
+
+# Separable tables: row i, channel j of the LMS matrix times every
+# linearised 8-bit value, so a matrix product is 9 lookups and 6 sums
+_LMS_TABLES = tuple(
+    tuple(tuple(weight * linear for linear in _SRGB_TO_LINEAR)
+          for weight in row)
+    for row in (
+        (0.4122214708, 0.5363325363, 0.0514459929),
+        (0.2119034982, 0.6806995451, 0.1073969566),
+        (0.0883024619, 0.2817188376, 0.6299787005),
+    )
+)
+
+
+# Colors looked at by `_by_distinct` to guess if colors repeat
+_DISTINCT_SAMPLE = 4096
+
+
+# Hidden function `_by_distinct` to run a kernel once per distinct color
+def _by_distinct(colors, kernel):
+    """Returns kernel(*colors*), run on the distinct colors only when
+they repeat (as in images, where flat areas repeat a few colors)
+
+Colors are told apart by their raw bytes, and a sample of the first
+ones is checked first, so that colors that hardly repeat (e.g. random
+ones) are not hashed for nothing.
+"""
+
+    data = colors.tobytes()
+    step = colors.channels * colors.data.itemsize
+    sample = {data[index:index + step]
+              for index in range(0, min(len(data), _DISTINCT_SAMPLE * step),
+                                 step)}
+
+    # Under a quarter of repeats is not worth the lookups
+    if len(sample) * 4 > min(len(colors), _DISTINCT_SAMPLE) * 3:
+        return kernel(colors)
+
+    keys = [data[index:index + step] for index in range(0, len(data), step)]
+    distinct = dict.fromkeys(keys)
+
+    if len(distinct) * 4 > len(keys) * 3:
+        return kernel(colors)
+
+    result = kernel(ColorArray.frombuffer(b''.join(distinct), colors.space))
+    converted = result.tobytes()
+    size = result.channels * result.data.itemsize
+    rows = dict(zip(distinct, (converted[index:index + size]
+                               for index in range(0, len(converted), size))))
+
+    return ColorArray.frombuffer(b''.join(map(rows.__getitem__, keys)),
+                                 result.space)
+
+
+# Hidden function `_rgb2oklab` to convert RGB colors to OKLab one by one
+def _rgb2oklab(colors):
+    """Returns an OKLab `ColorArray` of the RGB `ColorArray` *colors*
+"""
+
+    data = colors.data
+    (lr, lg, lb), (mr, mg, mb), (sr, sg, sb) = _LMS_TABLES
+    third = 1 / 3
+    out = []
+    extend = out.extend
+
+    for red, green, blue in zip(data[0::3], data[1::3], data[2::3]):
+        long_ = (lr[red] + lg[green] + lb[blue]) ** third
+        medium = (mr[red] + mg[green] + mb[blue]) ** third
+        short = (sr[red] + sg[green] + sb[blue]) ** third
+
+        extend((0.2104542553 * long_ + 0.7936177850 * medium
+                - 0.0040720468 * short,
+                1.9779984951 * long_ - 2.4285922050 * medium
+                + 0.4505937099 * short,
+                0.0259040371 * long_ + 0.7827717662 * medium
+                - 0.8086757660 * short))
+
+    return ColorArray('oklab', array('d', out))
+
+
+# A function to convert many RGB colors to OKLab colors at once
+def rgb2oklab_array(colors):
+    """Returns an OKLab `ColorArray` of all RGB *colors*
+
+*colors* may be anything accepted by `as_color_array`.
+The linearisation and the first matrix are done with table lookups,
+so only the cube roots and the second matrix are computed per color,
+and per distinct color when colors repeat.
+"""
+
+    return _by_distinct(as_color_array(colors), _rgb2oklab)
+
+
+# Hidden function `_oklab2rgb` to convert OKLab colors to RGB one by one
+def _oklab2rgb(colors):
+    """Returns an RGB `ColorArray` of the OKLab `ColorArray` *colors*
+"""
+
+    data = colors.data
+    bounds = _LINEAR_BOUNDS
+    out = []
+    extend = out.extend
+
+    # `bisect` on the bounds is `_linear2byte`, without a Python call
+    for lightness, a, b in zip(data[0::3], data[1::3], data[2::3]):
+        long_ = (lightness + 0.3963377774 * a + 0.2158037573 * b) ** 3
+        medium = (lightness - 0.1055613458 * a - 0.0638541728 * b) ** 3
+        short = (lightness - 0.0894841775 * a - 1.2914855480 * b) ** 3
+
+        extend((bisect(bounds, 4.0767416621 * long_
+                       - 3.3077115913 * medium + 0.2309699292 * short),
+                bisect(bounds, -1.2684380046 * long_
+                       + 2.6097574011 * medium - 0.3413193965 * short),
+                bisect(bounds, -0.0041960863 * long_
+                       - 0.7034186147 * medium + 1.7076147010 * short)))
+
+    return ColorArray.frombuffer(bytes(out))
+
+
+# A function to convert many OKLab colors to RGB colors at once
+def oklab2rgb_array(colors):
+    """Returns an RGB `ColorArray` of all OKLab *colors*
+
+*colors* may be anything accepted by `as_color_array` for 'oklab'.
+Colors outside of the sRGB gamut are clamped channel-wise, and the
+results match `oklab2rgb` exactly. Repeated colors are converted once.
+"""
+
+    return _by_distinct(as_color_array(colors, 'oklab'), _oklab2rgb)
+
+
+# A function to convert many OKLab colors to OKLCh colors at once
+def oklab2oklch_array(colors):
+    """Returns an OKLCh `ColorArray` of all OKLab *colors*
+"""
+
+    colors = as_color_array(colors, 'oklab')
+    data = colors.data
+    out = array('d', bytes(len(data) * 8))
+    out[0::3] = data[0::3]
+    chroma = array('d', map(hypot, data[1::3], data[2::3]))
+    out[1::3] = chroma
+    out[2::3] = array('d', (
+        degrees(atan2(b, a)) % 360 if c > 1e-7 else 0.0
+        for a, b, c in zip(data[1::3], data[2::3], chroma)))
+
+    return ColorArray('oklch', out)
+
+
+# A function to convert many OKLCh colors to OKLab colors at once
+def oklch2oklab_array(colors):
+    """Returns an OKLab `ColorArray` of all OKLCh *colors*
+"""
+
+    colors = as_color_array(colors, 'oklch')
+    data = colors.data
+    hues = [radians(hue) for hue in data[2::3]]
+    out = array('d', bytes(len(data) * 8))
+    out[0::3] = data[0::3]
+    out[1::3] = array('d', map(
+        lambda chroma, hue: chroma * cos(hue), data[1::3], hues))
+    out[2::3] = array('d', map(
+        lambda chroma, hue: chroma * sin(hue), data[1::3], hues))
+
+    return ColorArray('oklab', out)
+
+
+# A function to convert many RGB colors to OKLCh colors at once
+def rgb2oklch_array(colors):
+    """Returns an OKLCh `ColorArray` of all RGB *colors*
+"""
+
+    return _by_distinct(as_color_array(colors),
+                        lambda colors: oklab2oklch_array(_rgb2oklab(colors)))
+
+
+# A function to convert many OKLCh colors to RGB colors at once
+def oklch2rgb_array(colors):
+    """Returns an RGB `ColorArray` of all OKLCh *colors*
+"""
+
+    return _by_distinct(as_color_array(colors, 'oklch'),
+                        lambda colors: _oklab2rgb(oklch2oklab_array(colors)))
+
+
+# Separable tables of the linear sRGB to relative XYZ (D65) matrix
+_XYZ_TABLES = tuple(
+    tuple(tuple(weight / white * linear for linear in _SRGB_TO_LINEAR)
+          for weight in row)
+    for row, white in zip((
+        (0.4124564, 0.3575761, 0.1804375),
+        (0.2126729, 0.7151522, 0.0721750),
+        (0.0193339, 0.1191920, 0.9503041),
+    ), _D65)
+)
+
+
+# A function to convert many RGB colors to CIELAB colors at once
+def rgb2lab_array(colors):
+    """Returns a CIELAB (D65) `ColorArray` of all RGB *colors*
+
+*colors* may be anything accepted by `as_color_array`.
+"""
+
+    colors = as_color_array(colors)
+    data = colors.data
+
+    (xr, xg, xb), (yr, yg, yb), (zr, zg, zb) = _XYZ_TABLES
+    third = 1 / 3
+    out = [0.0] * len(data)
+    index = 0
+
+    for red, green, blue in zip(data[0::3], data[1::3], data[2::3]):
+        x = xr[red] + xg[green] + xb[blue]
+        y = yr[red] + yg[green] + yb[blue]
+        z = zr[red] + zg[green] + zb[blue]
+
+        # Same companding as `_lab_f`, inlined for speed
+        x = x ** third if x > 216 / 24389 else x * 841 / 108 + 4 / 29
+        y = y ** third if y > 216 / 24389 else y * 841 / 108 + 4 / 29
+        z = z ** third if z > 216 / 24389 else z * 841 / 108 + 4 / 29
+
+        out[index] = 116 * y - 16
+        out[index + 1] = 500 * (x - y)
+        out[index + 2] = 200 * (y - z)
+        index += 3
+
+    return ColorArray('lab', array('d', out))
+
+
+# Scalar converters used for spaces without a dedicated array kernel
+_FROM_RGB = {
+    'hsv': rgb2hsv,
+    'hsl': rgb2hsl,
+    'yiq': rgb2yiq,
+    'cmyk': rgb2cmyk,
+}
+
+
+# Hidden function `_from_rgb_scalar` to convert RGB colors one by one
+def _from_rgb_scalar(colors, space):
+    """Returns a *space* `ColorArray` of RGB *colors* using the scalar
+converter, which is called once per distinct color
+"""
+
+    convert = _FROM_RGB[space]
+    cache = {}
+
+    for value in set(colors.packed()):
+        cache[value] = convert(value >> 16, value >> 8 & 255, value & 255)
+
+    return ColorArray(space, array('d', chain.from_iterable(
+        map(cache.__getitem__, colors.packed()))))
+
+
+# Hidden function `_yiq2rgb` for YIQ colors in `rgb2yiq` units
+def _yiq2rgb(y, i, q):
+    """Returns `yiq2rgb` of a YIQ color scaled to 0-255, as returned by
+`rgb2yiq`, while `yiq2rgb` (and `yiq`) take values in [0, 1]
+"""
+
+    return yiq2rgb(y / 255, i / 255, q / 255)
+
+
+# Hidden function `_rgb2yiq_exact` to convert to YIQ without clamping
+def _rgb2yiq_exact(red, green, blue):
+    """Returns the YIQ values of an RGB color in `rgb2yiq` units, not
+clamped, so that I and Q keep their sign
+"""
+
+    y = 0.30 * red + 0.59 * green + 0.11 * blue
+
+    return (y, 0.74 * (red - y) - 0.27 * (blue - y),
+            0.48 * (red - y) + 0.41 * (blue - y))
+
+
+# Hidden function `_yiq2rgb_exact` to invert `_rgb2yiq_exact`
+def _yiq2rgb_exact(y, i, q):
+    """Returns the (unrounded) RGB values of a YIQ color of
+`_rgb2yiq_exact`
+"""
+
+    return (y + 0.9468822170900693 * i + 0.6235565819861433 * q,
+            y - 0.27478764629897834 * i - 0.6356910791873801 * q,
+            y - 1.1085450346420322 * i + 1.7090069284064666 * q)
+
+
+# Hidden function `_rgb2hsv_exact` to convert to HSV without rounding
+def _rgb2hsv_exact(red, green, blue):
+    """Returns the HSV values of an RGB color, the hue not rounded
+"""
+
+    hue, saturation, value = rgb_to_hsv(red / 255, green / 255, blue / 255)
+
+    return (hue * 360, saturation, value)
+
+
+# Hidden function `_hsv2rgb_exact` to invert `_rgb2hsv_exact`
+def _hsv2rgb_exact(hue, saturation, value):
+    """Returns the (unrounded) RGB values of an HSV color
+"""
+
+    return tuple(channel * 255 for channel in
+                 hsv_to_rgb(hue / 360, saturation, value))
+
+
+# Hidden function `_rgb2hsl_exact` to convert to HSL without rounding
+def _rgb2hsl_exact(red, green, blue):
+    """Returns the HSL values of an RGB color, the hue not rounded
+"""
+
+    hue, lightness, saturation = rgb_to_hls(red / 255, green / 255,
+                                            blue / 255)
+
+    return (hue * 360, saturation, lightness)
+
+
+# Hidden function `_hsl2rgb_exact` to invert `_rgb2hsl_exact`
+def _hsl2rgb_exact(hue, saturation, lightness):
+    """Returns the (unrounded) RGB values of an HSL color
+"""
+
+    return tuple(channel * 255 for channel in
+                 hls_to_rgb(hue / 360, lightness, saturation))
+
+
+# Converters of the spaces whose scalar converters round or clamp, for
+# values that are mixed, e.g. by `Gradient` (`rgb2yiq` clamps I and Q,
+# `rgb2hsv` and `rgb2hsl` round the hue): (from RGB, to RGB)
+_EXACT = {
+    'yiq': (_rgb2yiq_exact, _yiq2rgb_exact),
+    'hsv': (_rgb2hsv_exact, _hsv2rgb_exact),
+    'hsl': (_rgb2hsl_exact, _hsl2rgb_exact),
+}
+
+
+# Hidden function `_exact_from_rgb` to convert RGB colors losslessly
+def _exact_from_rgb(colors, space):
+    """Returns a *space* `ColorArray` of the RGB `ColorArray` *colors*,
+converted by the `_EXACT` converter of *space*
+"""
+
+    data = colors.data
+
+    return ColorArray(space, array('d', chain.from_iterable(map(
+        _EXACT[space][0], data[0::3], data[1::3], data[2::3]))))
+
+
+# Hidden function `_exact_to_rgb` to convert colors of `_exact_from_rgb`
+def _exact_to_rgb(colors):
+    """Returns an RGB `ColorArray` of *colors* of `_exact_from_rgb`,
+clamped and rounded to 8 bits
+"""
+
+    return ColorArray('rgb', bytes(
+        0 if value < 0 else 255 if value > 255 else round(value)
+        for color in colors for value in _EXACT[colors.space][1](*color)))
+
+
+# Hidden function `_to_rgb_scalar` to convert colors to RGB one by one
+def _to_rgb_scalar(colors):
+    """Returns an RGB `ColorArray` of *colors* using the scalar
+converter of their space, clamped and rounded to 8 bits
+"""
+
+    convert = _yiq2rgb if colors.space == 'yiq' else _TO_RGB[colors.space]
+
+    return ColorArray('rgb', bytes(
+        0 if value < 0 else 255 if value > 255 else round(value)
+        for color in colors for value in convert(*color)))
+
+
+_TO_RGB_ARRAY = {
+    'oklab': oklab2rgb_array,
+    'oklch': oklch2rgb_array,
+}
+
+_FROM_RGB_ARRAY = {
+    'oklab': rgb2oklab_array,
+    'oklch': rgb2oklch_array,
+    'lab': rgb2lab_array,
+}
+
+# (Source, target): kernels between spaces that do not need RGB
+_DIRECT_ARRAY = {
+    ('oklab', 'oklch'): oklab2oklch_array,
+    ('oklch', 'oklab'): oklch2oklab_array,
+}
+
+
+# A function to convert a ColorArray from any space to any other space
+def convert_array(colors, space):
+    """Returns *colors* (a `ColorArray`) converted to the space *space*
+
+Conversions go through RGB, using the array kernels where there are
+some and the scalar converters (once per distinct color) otherwise;
+OKLab and OKLCh are converted to each other directly, without the loss
+of 8-bit RGB. A ColorArray already in *space* is returned as it is.
+
+E.g.:
+hsl = convert_array(ColorArray.fromcolors(['red', 'navy']), 'hsl')
+list(hsl) -> [(0.0, 1.0, 0.5), (240.0, 1.0, 0.25...)]
+"""
+
+    if space not in _SPACES:
+        raise ValueError(f'unknown color space \'{space}\'')
+
+    if not isinstance(colors, ColorArray):
+        raise TypeError(f'\'colors\' must be of type \'ColorArray\', \
+not {_type(colors)}')
+
+    if colors.space == space:
+        return colors
+
+    if (colors.space, space) in _DIRECT_ARRAY:
+        return _DIRECT_ARRAY[colors.space, space](colors)
+
+    if colors.space != 'rgb':
+        if colors.space in _TO_RGB_ARRAY:
+            colors = _TO_RGB_ARRAY[colors.space](colors)
+
+        else:
+            colors = _to_rgb_scalar(colors)
+
+    if space == 'rgb':
+        return colors
+
+    if space in _FROM_RGB_ARRAY:
+        return _FROM_RGB_ARRAY[space](colors)
+
+    return _from_rgb_scalar(colors, space)
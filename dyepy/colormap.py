@@ -0,0 +1,183 @@
+"""Module with colormaps: lookup tables from numbers to colors.
+
+A colormap compiles a `Gradient` into a fixed-size table once, then
+maps whole arrays of numbers to table indexes in one step, and those
+indexes to Hex strings, RGB colors or `Styles` escapes by indexing into
+the table, instead of calling `rgb()` or `Styles.Fg.rgb()` per value.
+
+8-bit inputs (bytes, bytearray, array('B')) are mapped with one
+`bytes.translate` call, which takes a few milliseconds per million
+values; other numbers take one list comprehension.
+
+E.g.:
+heat = Colormap(['#000004', '#b73779', '#fcffa4'], vmin=0, vmax=100)
+heat.hex([0, 100]) -> ['#000004', '#fcffa4']
+heat.fg(latencies) -> ['\\x1b[38;2;...m', ...]
+
+Separate documentation for each function and class written with them.
+To read the documentation, type `help(<function/class>)` into the CLI
+"""
+
+
+from array import array
+
+from dyepy.batch import ColorArray
+from dyepy.converters import _type
+from dyepy.gradient import Gradient
+
+
+# A class to map numbers to colors through a lookup table
+class Colormap:
+    """Colormap class
+
+Maps numbers in [*vmin*, *vmax*] to the *size* colors of a gradient;
+numbers outside of it are clamped to the first or last color, and
+NaN maps to the first color.
+
+gradient: a `Gradient`, or stops to build one (in OKLab) from.
+size (int): number of colors of the table, 2 to 65536.
+
+E.g.:
+cmap = Colormap(['navy', 'white', 'crimson'], vmin=-1, vmax=1)
+cmap.indices([-1, 0, 1]) -> b'\\x00\\x80\\xff'
+cmap.hex([-1, 0, 1]) -> ['#000080', '#fffefe', '#dc143c']
+cmap.styles([-1, 0, 1], background=True) -> ['\\x1b[48;2;0;0;128m', ...]
+"""
+
+    def __init__(self, gradient, size=256, vmin=0.0, vmax=1.0):
+        if not isinstance(gradient, Gradient):
+            gradient = Gradient(gradient)
+
+        if type(size) is not int:
+            raise TypeError(f'\'{size}\' must be of type \'int\', not \
+{_type(size)}')
+
+        if not 2 <= size <= 65536:
+            raise ValueError(f'\'size\' must be ≥ 2 and ≤ 65536, not \
+\'{size}\'')
+
+        for value in (vmin, vmax):
+            if type(value) not in (int, float):
+                raise TypeError(f'\'{value}\' must be of type \'int\' or \
+\'float\', not {_type(value)}')
+
+        if not vmin < vmax:
+            raise ValueError(f'\'vmin\' must be < \'vmax\', not \
+{vmin} and {vmax}')
+
+        self.gradient = gradient
+        self.size = size
+        self.vmin = vmin
+        self.vmax = vmax
+
+        self.table = gradient.rgb(size)
+        self._hex = gradient.hex(size)
+        self._rows = [bytes(color) for color in self.table]
+        self._scale = (size - 1) / (vmax - vmin)
+        self._translate = None
+
+        if size <= 256:
+            # One byte table per channel, for `bytes.translate`
+            self._channels = [
+                bytes(self.table.channel(index)).ljust(256, b'\0')
+                for index in range(3)
+            ]
+
+            # Index of every 8-bit input value
+            self._translate = self._indices(range(256))
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return f'Colormap({self.gradient!r}, {self.size}, {self.vmin}, \
+{self.vmax})'
+
+    def _indices(self, values):
+        """Returns table indexes of *values*, as bytes or array('H')
+"""
+
+        scale = self._scale
+        offset = 0.5 - self.vmin * scale
+        top = self.size - 1
+        limit = top + 0.5
+
+        # Positions are rounded by flooring x + 0.5; the comparisons
+        # also send NaN (which fails every one of them) to index 0
+        indexes = [int(x) if 0 < x < limit else 0 if not x > 0 else top
+                   for x in [value * scale + offset for value in values]]
+
+        if top < 256:
+            return bytes(indexes)
+
+        return array('H', indexes)
+
+    def indices(self, values):
+        """Returns table indexes of *values*, as bytes (size ≤ 256) or
+as an array('H')
+
+*values* may be any iterable of numbers: a list, an array.array,
+a generator... 8-bit bytes-like values are translated at C speed.
+"""
+
+        if self._translate is not None:
+            if isinstance(values, (bytes, bytearray)):
+                return values.translate(self._translate)
+
+            if isinstance(values, array) and values.typecode == 'B' or \
+                    isinstance(values, memoryview) and values.format == 'B':
+                return bytes(values).translate(self._translate)
+
+        return self._indices(values)
+
+    def rgb(self, values):
+        """Returns the colors of *values* as an RGB `ColorArray`
+"""
+
+        indexes = self.indices(values)
+
+        if isinstance(indexes, bytes):
+            data = bytearray(len(indexes) * 3)
+
+            for index, channel in enumerate(self._channels):
+                data[index::3] = indexes.translate(channel)
+
+            return ColorArray.frombuffer(data)
+
+        return ColorArray.frombuffer(b''.join(map(self._rows.__getitem__,
+                                                  indexes)))
+
+    def packed(self, values):
+        """Returns the colors of *values* as an array('I') of 0xRRGGBB
+"""
+
+        return self.rgb(values).packed()
+
+    def hex(self, values):
+        """Returns the colors of *values* as a list of Hex strings
+"""
+
+        return list(map(self._hex.__getitem__, self.indices(values)))
+
+    def styles(self, values, background=False):
+        """Returns the colors of *values* as a list of ANSI escapes
+
+The strings are the same as `Styles.Fg.rgb` (or `Styles.Bg.rgb`
+with *background*) would return for each color.
+"""
+
+        table = self.gradient.styles(self.size, background)
+
+        return list(map(table.__getitem__, self.indices(values)))
+
+    def fg(self, values):
+        """Returns foreground escapes of *values*, see `styles`
+"""
+
+        return self.styles(values)
+
+    def bg(self, values):
+        """Returns background escapes of *values*, see `styles`
+"""
+
+        return self.styles(values, background=True)
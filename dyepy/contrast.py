@@ -0,0 +1,316 @@
+"""Module with WCAG relative luminance and contrast ratios.
+
+The contrast ratio of two colors, (L1 + 0.05) / (L2 + 0.05) with L1
+the relative luminance of the lighter one, decides if text is
+readable on a background: WCAG 2 asks for 4.5:1 (AA) or 7:1 (AAA)
+for normal text, 3:1 and 4.5:1 for large text.
+
+Luminance is linear light, so every channel must be linearized first.
+Here this is one lookup in a 256-entry table per channel instead of a
+`pow()`, and the batch functions compute the luminance of each color
+only once, then all the ratios of a palette from these numbers.
+
+(WCAG 2 linearizes below 0.03928 where sRGB says 0.04045; no 8-bit
+value lies between the two, so both give the same tables.)
+
+Colors that fail can be fixed with `accessible_color`, which finds
+the nearest lightness reaching a target ratio.
+
+E.g.:
+contrast_ratio('#767676', 'white') -> 4.54...
+for i, j, ratio in contrast_failures(palette, level='AA'):
+    print(palette[i], palette[j], ratio)
+accessible_color('#ff7f50', 'white') -> '#ca4f1c'
+
+Separate documentation for each function and class written with them.
+To read the documentation, type `help(<function/class>)` into the CLI
+"""
+
+
+from array import array
+from functools import lru_cache
+from math import cos, radians, sin
+from operator import add
+
+from dyepy.batch import as_color_array, as_rgb
+from dyepy.converters import _SRGB_TO_LINEAR, _linear2srgb, _oklab2linear, \
+    _type, hsl2rgb, rgb, rgb2hsl, rgb2oklch
+
+
+# Minimum contrast ratios by level, for normal and large text
+WCAG_LEVELS = {
+    'AA': (4.5, 3.0),
+    'AAA': (7.0, 4.5),
+}
+
+# Weighted linear light of each 8-bit value of each channel
+_RED = tuple(0.2126 * value for value in _SRGB_TO_LINEAR)
+_GREEN = tuple(0.7152 * value for value in _SRGB_TO_LINEAR)
+_BLUE = tuple(0.0722 * value for value in _SRGB_TO_LINEAR)
+
+
+# A function to get the WCAG relative luminance of a color
+def relative_luminance(color):
+    """Returns the relative luminance (0 for black to 1 for white) of
+*color*, anything accepted by `as_rgb`
+"""
+
+    red, green, blue = as_rgb(color)
+
+    return _RED[red] + _GREEN[green] + _BLUE[blue]
+
+
+# A function to get the WCAG contrast ratio of two colors
+def contrast_ratio(color1, color2):
+    """Returns the contrast ratio (1 to 21) of two colors
+
+The ratio does not depend on which one is the foreground.
+"""
+
+    lighter = relative_luminance(color1) + 0.05
+    darker = relative_luminance(color2) + 0.05
+
+    if lighter < darker:
+        lighter, darker = darker, lighter
+
+    return lighter / darker
+
+
+# A function to get the relative luminance of many colors at once
+def luminance_array(colors):
+    """Returns the relative luminance of every color as an array('d')
+
+*colors* may be anything accepted by `as_color_array`.
+"""
+
+    data = as_color_array(colors).data
+
+    return array('d', map(add, map(add, map(_RED.__getitem__, data[0::3]),
+                                   map(_GREEN.__getitem__, data[1::3])),
+                          map(_BLUE.__getitem__, data[2::3])))
+
+
+# Hidden function `_offsets` to get luminance + 0.05 of many colors
+def _offsets(colors):
+    """Returns a list of the relative luminance + 0.05 of *colors*
+"""
+
+    return [value + 0.05 for value in luminance_array(colors)]
+
+
+# Hidden function `_threshold` to look up the ratio of a WCAG level
+def _threshold(level, large):
+    """Returns the minimum contrast ratio of *level* ('AA' or 'AAA')
+"""
+
+    if level not in WCAG_LEVELS:
+        raise ValueError(f'\'level\' must be \'AA\' or \'AAA\', not \
+\'{level}\'')
+
+    return WCAG_LEVELS[level][1 if large else 0]
+
+
+# A function to get the contrast ratios of every pair of colors
+def contrast_matrix(colors, backgrounds=None):
+    """Returns the contrast ratios of every color of *colors* (rows)
+on every color of *backgrounds* (columns, default: *colors*), as a
+list of array('d') rows
+
+Each row costs one list comprehension over the precomputed
+luminances, e.g. about 250000 ratios for a palette of 500 colors.
+"""
+
+    rows = _offsets(colors)
+    columns = rows if backgrounds is None else _offsets(backgrounds)
+
+    return [array('d', [row / column if row > column else column / row
+                        for column in columns]) for row in rows]
+
+
+# A function to find the pairs of colors failing a WCAG level
+def contrast_failures(colors, backgrounds=None, level='AA', large=False):
+    """Yields (i, j, ratio) for every pair of colors whose contrast
+ratio is below *level* ('AA' or 'AAA', for *large* text or not)
+
+Without *backgrounds*, pairs within *colors* are checked once each
+(i < j), as the ratio does not depend on which color is the text;
+else every color i of *colors* is checked on every color j of
+*backgrounds*.
+
+E.g.:
+failing = list(contrast_failures(palette, level='AAA'))
+"""
+
+    threshold = _threshold(level, large)
+    rows = _offsets(colors)
+    symmetric = backgrounds is None
+    columns = rows if symmetric else _offsets(backgrounds)
+
+    for i, row in enumerate(rows):
+        start = i + 1 if symmetric else 0
+        low = row / threshold
+        high = row * threshold
+
+        # Failing columns are within a factor *threshold* of the row
+        for j in [j for j, column in enumerate(columns[start:], start)
+                  if low < column < high]:
+            column = columns[j]
+
+            yield i, j, row / column if row > column else column / row
+
+
+# A function to get the best WCAG level a contrast ratio passes
+def wcag_level(ratio, large=False):
+    """Returns 'AAA', 'AA' or None, the best level *ratio* passes, for
+normal or *large* text
+"""
+
+    for level in ('AAA', 'AA'):
+        if ratio >= _threshold(level, large):
+            return level
+
+    return None
+
+
+# Steps of the binary searches of `accessible_color`
+_STEPS = 20
+
+
+# Hidden function `_oklch2rgb` to map an OKLCh color into the gamut
+def _oklch2rgb(lightness, chroma, hue):
+    """Returns the 8-bit RGB of an OKLCh color, lowering its chroma
+(binary search) until it fits in the sRGB gamut, so that its hue and
+lightness are kept
+"""
+
+    cosine, sine = cos(radians(hue)), sin(radians(hue))
+    linear = _oklab2linear(lightness, chroma * cosine, chroma * sine)
+
+    if not all(-1e-7 <= value <= 1 + 1e-7 for value in linear):
+        low, high = 0.0, chroma
+
+        for _ in range(_STEPS):
+            middle = (low + high) / 2
+            candidate = _oklab2linear(lightness, middle * cosine,
+                                      middle * sine)
+
+            if all(-1e-7 <= value <= 1 + 1e-7 for value in candidate):
+                low, linear = middle, candidate
+
+            else:
+                high = middle
+
+        if low == 0:
+            linear = _oklab2linear(lightness, 0, 0)
+
+    return tuple(round(_linear2srgb(min(1, max(0, value))) * 255)
+                 for value in linear)
+
+
+# Hidden function `_accessible` to solve `accessible_color` (cached)
+@lru_cache(maxsize=4096)
+def _accessible(color, background, target, space):
+    """Returns the RGB color nearest to *color* in lightness whose
+contrast ratio on *background* is ≥ *target*, or None
+"""
+
+    backdrop = relative_luminance(background) + 0.05
+
+    def passes(candidate):
+        luminance = relative_luminance(candidate) + 0.05
+
+        return max(luminance, backdrop) / min(luminance, backdrop) >= target
+
+    if passes(color):
+        return color
+
+    if space == 'hsl':
+        hue, saturation, lightness = rgb2hsl(*color)
+
+        def convert(value):
+            return hsl2rgb(hue, saturation, value)
+
+    else:
+        lightness, chroma, hue = rgb2oklch(*color)
+
+        def convert(value):
+            return _oklch2rgb(value, chroma, hue)
+
+    best = None
+
+    # Lighter and darker: the searches keep a passing *end*, moving it
+    # towards *lightness*, then the smaller change wins
+    for end in (1.0, 0.0):
+        candidate = convert(end)
+
+        if not passes(candidate):
+            continue
+
+        start = lightness
+
+        for _ in range(_STEPS):
+            middle = (start + end) / 2
+            moved = convert(middle)
+
+            if passes(moved):
+                end, candidate = middle, moved
+
+            else:
+                start = middle
+
+        if best is None or abs(end - lightness) < best[0]:
+            best = (abs(end - lightness), candidate)
+
+    return None if best is None else best[1]
+
+
+# A function to find the nearest color meeting a contrast ratio
+def accessible_color(color, background, target=4.5, space='oklch'):
+    """Returns the Hex color nearest to *color* in lightness whose
+contrast ratio on *background* is at least *target*, or None if even
+white or black can not reach it
+
+The lightness is binary-searched in *space*, 'oklch' (default) or
+'hsl', both lighter and darker, keeping the hue and chroma (or HSL
+saturation) of *color*; in OKLCh, chroma is only lowered when the
+color would leave the sRGB gamut. A color that already passes is
+returned as it is. Results are cached per (color, background,
+target, space).
+
+E.g.:
+accessible_color('#1d9bf0', 'white') -> '#007bc5'
+accessible_color('gray', '#333', target=7) -> '#c1c1c1'
+"""
+
+    if type(target) not in (int, float):
+        raise TypeError(f'\'{target}\' must be of type \'int\' or \
+\'float\', not {_type(target)}')
+
+    if not 1 <= target <= 21:
+        raise ValueError(f'\'target\' must be ≥ 1 and ≤ 21, not \
+\'{target}\'')
+
+    if space not in ('oklch', 'hsl'):
+        raise ValueError(f'\'space\' must be \'oklch\' or \'hsl\', not \
+\'{space}\'')
+
+    result = _accessible(as_rgb(color), as_rgb(background), float(target),
+                         space)
+
+    return None if result is None else rgb(*result)
+
+
+# A function to fix a whole palette against several backgrounds
+def accessible_palette(colors, backgrounds, target=4.5, space='oklch'):
+    """Returns, for every color of *colors*, the list of its
+`accessible_color` on each of *backgrounds*
+
+E.g.:
+accessible_palette(['#1d9bf0', '#f91880'], ['white', '#15202b'])
+-> [['#007bc5', '#1d9bf0'], ['#e70075', '#fe2184']]
+"""
+
+    backgrounds = list(backgrounds)
+
+    return [[accessible_color(color, background, target, space)
+             for background in backgrounds] for color in colors]
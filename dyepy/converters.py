@@ -0,0 +1,1181 @@
+"""Module with the scalar color constructors and converters.
+
+`clamp`, the Hex constructors (`rgb`, `hsv`, `hsl`, `yiq`, `cmyk`,
+`oklab`, `oklch`) and every `x2y` converter between Hex, RGB, HSV,
+HSL, YIQ, CMYK, OKLab, OKLCh and CIELAB, one color per call. For many
+colors at once, refer to `dyepy.batch`.
+
+Separate documentation for each function and class written with them.
+To read the documentation, type `help(<function/class>)` into the CLI
+"""
+
+
+from math import atan2 as _atan2, cos as _cos, degrees as _degrees, \
+    hypot as _hypot, radians as _radians, sin as _sin
+
+
+# Hidden function `_type` to get the exact type of an object in strings
+def _type(object_or_name):
+    """Returns the exact type of *object_or_name* using `type`
+"""
+
+    type_ = str(type(object_or_name)).replace('<class ', '').replace('>', '')
+
+    return type_
+
+
+# Hidden sRGB transfer functions shared by the perceptual color spaces
+def _srgb2linear(channel):
+    """Returns the linear-light value of an sRGB *channel* in [0, 1]
+"""
+
+    if channel <= 0.04045:
+        return channel / 12.92
+
+    return ((channel + 0.055) / 1.055) ** 2.4
+
+
+def _linear2srgb(channel):
+    """Returns the sRGB value of a linear-light *channel* in [0, 1]
+"""
+
+    if channel <= 0.0031308:
+        return channel * 12.92
+
+    return 1.055 * channel ** (1 / 2.4) - 0.055
+
+
+# Linear-light values of every 8-bit sRGB channel value
+_SRGB_TO_LINEAR = tuple(_srgb2linear(value / 255) for value in range(256))
+
+
+# A function to clamp three values such that the value
+# never crosses the minimum and the maximum value
+def clamp(minimum=0, value=0.5, maximum=1):
+    """Returns the clamped value between *minimum* and *maximum*
+
+A clamped value is the value itself when it lies
+between the minimum and the maximum, and if the
+value crosses the extremes, then the extremity
+closer to the value becomes the clamped value.
+
+E.g.:
+clamp(0, 0.5, 1) -> 0.5;
+clamp(0, 2, 1) -> 1;
+clamp(0, -1, 1) -> 0;
+"""
+
+    for arg in (minimum, value, maximum):
+        if type(arg) not in (int, float):
+            raise TypeError(f'\'{arg}\' must be of type \'int\' or \
+\'float\', not {_type(arg)}')
+
+    return max(minimum, min(value, maximum))
+
+
+# A function to convert RGB values to Hex values
+def rgb(red=0, green=0, blue=0):
+    """Returns the Hex value from an RGB value for many modules use
+Hex values as their default or accepted color code values
+
+Can also be used as a RGB-to-Hex converter
+"""
+
+    # Check if all parameters are perfect or not
+    for color_value in (red, green, blue):
+        if type(color_value) not in (int, float):
+            raise TypeError(f'\'{color_value}\' must be of type \
+\'int\' or \'float\', not {_type(color_value)}')
+
+        elif color_value < 0 or color_value > 255:
+            raise ValueError(f'\'color_value\' must be ≥ 0 and ≤ 255, \
+not \'{color_value}\'')
+
+    red, green, blue = round(red), round(green), round(blue)
+
+    return '#%02x%02x%02x' % (red, green, blue)
+
+
+# A function to convert HSV values to Hex values
+def hsv(hue=0, saturation=0, value=0):
+    """Returns the Hex value from an HSV value for many modules use
+Hex values as their default or accepted color code values
+
+0 ≤ hue ≤ 360; although other values is also acceptable
+0 ≤ saturation, value ≤ 1; any other value will be clamped
+
+Note: both HSB and HSV are the same colorspaces
+
+Can also be used as a HSV-to-Hex converter
+"""
+
+    red, green, blue = hsv2rgb(hue, saturation, value)
+
+    return rgb(red, green, blue)
+
+
+hsb = hsv  # Since both are the same
+
+
+# A function to convert HSL values to Hex values
+def hsl(hue=0, saturation=0, luminance=0):
+    """Returns the Hex value from an HSL value for many modules use
+Hex values as their default or accepted color code values
+
+0 ≤ hue ≤ 360; although a value > 360 is also acceptable
+0 ≤ saturation, luminance ≤ 1; any other value will be clamped
+
+Note: HSV and HSL are different colorspaces, for more information
+refer to:
+  https://en.wikipedia.org/wiki/HSL_and_HSV
+
+Can also be used as a HSL-to-Hex converter
+"""
+
+    red, green, blue = hsl2rgb(hue, saturation, luminance)
+
+    return rgb(red, green, blue)
+
+
+# A function to convert a YIQ color to Hex values
+def yiq(y=0, i=0, q=0):
+    """Returns the Hex value from a YIQ color space for many modules
+use Hex values as their default or accepted color code values
+
+0 ≤ y, i, q ≤ 1, all other values will be clamped
+
+Can also be used as a YIQ-to-Hex converter
+"""
+
+    red, green, blue = yiq2rgb(y, i, q)
+
+    return rgb(red, green, blue)
+
+
+# A function to convert a CMYK color to Hex values
+def cmyk(cyan=0, magenta=0, yellow=0, black_key=0):
+    """Returns the Hex value from a CMYK color space for many modules
+use Hex values as their default or accepted color code values
+
+0 ≤ cyan, magenta, yellow, black_key ≤ 1, other values will be clamped
+
+Can also be used as a CMYK-to-Hex converter
+"""
+
+    red, green, blue = cmyk2rgb(cyan, magenta, yellow, black_key)
+
+    return rgb(red, green, blue)
+
+
+# A function to convert an OKLab color to Hex values
+def oklab(lightness=0, a=0, b=0):
+    """Returns the Hex value from an OKLab color space for many modules
+use Hex values as their default or accepted color code values
+
+0 ≤ lightness ≤ 1; -0.4 ≤ a, b ≤ 0.4 (roughly), colors outside of
+the sRGB gamut will be clamped
+
+Can also be used as an OKLab-to-Hex converter
+"""
+
+    red, green, blue = oklab2rgb(lightness, a, b)
+
+    return rgb(red, green, blue)
+
+
+# A function to convert an OKLCh color to Hex values
+def oklch(lightness=0, chroma=0, hue=0):
+    """Returns the Hex value from an OKLCh color space for many modules
+use Hex values as their default or accepted color code values
+
+0 ≤ lightness ≤ 1; 0 ≤ chroma ≤ 0.4 (roughly);
+0 ≤ hue ≤ 360; although other values is also acceptable
+
+Note: OKLCh is the cylindrical form of OKLab, lightness steps are
+perceptually even, unlike the luminance of HSL
+
+Can also be used as an OKLCh-to-Hex converter
+"""
+
+    red, green, blue = oklch2rgb(lightness, chroma, hue)
+
+    return rgb(red, green, blue)
+
+
+# A function to convert Hex values to RGB colors
+def hex2rgb(hexcode='#000000', as_string=False):
+    """Returns the equivalent RGB values of a hex color *hexcode*
+
+as_string (bool): decides if RGB values are to be returned in
+strings in the format 'rgb(<red>, <green>, <blue>)' or as a tuple.
+Defaults to False (returns a tuple of red, green, blue by default)
+"""
+
+    if len(hexcode) == 4:  # Repetative shortcut
+        hexcode = f'#{hexcode[1]*2}{hexcode[2]*2}{hexcode[3]*2}'
+
+    red = int(hexcode[1:3], 16)
+    green = int(hexcode[3:5], 16)
+    blue = int(hexcode[5:7], 16)
+
+    if as_string:
+        return f'rgb({red}, {green}, {blue})'
+
+    return (red, green, blue)
+
+
+# A function to convert Hex values to HSV colors
+def hex2hsv(hexcode='#000000', as_string=False):
+    """Returns the equivalent HSV/HSB values of a hex color *hexcode*
+
+as_string (bool): decides if HSV values are to be returned in
+strings in the format 'hsv(<hue>, <saturation>, <value>)' or as a tuple.
+Defaults to False (returns a tuple of hue, saturation,
+luminance by default)
+"""
+
+    red, green, blue = hex2rgb(hexcode)
+    hue, saturation, value = rgb2hsv(red, green, blue)
+
+    if as_string:
+        return f'hsv({hue}, {saturation}, {value})'
+
+    return (hue, saturation, value)
+
+
+# A function to convert Hex values to HSL colors
+def hex2hsl(hexcode='#000000', as_string=False):
+    """Returns the equivalent HSL values of a hex color *hexcode*
+
+as_string (bool): decides if HSL values are to be returned in
+strings in the format 'hsl(<hue>, <saturation>, <luminance>)'
+or as a tuple. Defaults to False (returns a tuple of hue, saturation,
+luminance by default)
+"""
+
+    red, green, blue = hex2rgb(hexcode)
+    hue, saturation, luminance = rgb2hsl(red, green, blue)
+
+    if as_string:
+        return f'hsl({hue}, {saturation}, {luminance})'
+
+    return (hue, saturation, luminance)
+
+
+# A function to convert Hex values to YIQ colors
+def hex2yiq(hexcode='#000000', as_string=False):
+    """Returns the equivalent YIQ values of a hex color *hexcode*
+
+as_string (bool): decides if YIQ values are to be returned in
+strings in the format 'yiq(<y>, <i>, <q>)' or as a tuple.
+Defaults to False (returns a tuple of y, i, q by default)
+"""
+
+    red, green, blue = hex2rgb(hexcode)
+    y, i, q = rgb2yiq(red, green, blue)
+
+    if as_string:
+        return f'yiq({y}, {i}, {q})'
+
+    return (y, i, q)
+
+
+# A function to convert Hex values to CMYK colors
+def hex2cmyk(hexcode='#000000', as_string=False):
+    """Returns the equivalent CMYK values of a hex color *hexcode*
+
+as_string (bool): decides if CMYK values are to be returned in
+strings in the format 'cmyk(<cyan>, <magenta>, <yellow>, <black_key>)'
+or as a tuple. Defaults to False (returns a tuple of cyan, magenta,
+yellow, key by default)
+"""
+
+    red, green, blue = hex2rgb(hexcode)
+    cyan, magenta, yellow, black_key = rgb2cmyk(red, green, blue)
+
+    if as_string:
+        return f'cmyk({cyan}, {magenta}, {yellow}, {black_key})'
+
+    return (cyan, magenta, yellow, black_key)
+
+
+# A function to convert Hex values to OKLab colors
+def hex2oklab(hexcode='#000000', as_string=False):
+    """Returns the equivalent OKLab values of a hex color *hexcode*
+
+as_string (bool): decides if OKLab values are to be returned in
+strings in the format 'oklab(<lightness>, <a>, <b>)' or as a tuple.
+Defaults to False (returns a tuple of lightness, a, b by default)
+"""
+
+    red, green, blue = hex2rgb(hexcode)
+
+    return rgb2oklab(red, green, blue, as_string)
+
+
+# A function to convert Hex values to OKLCh colors
+def hex2oklch(hexcode='#000000', as_string=False):
+    """Returns the equivalent OKLCh values of a hex color *hexcode*
+
+as_string (bool): decides if OKLCh values are to be returned in
+strings in the format 'oklch(<lightness>, <chroma>, <hue>)'
+or as a tuple. Defaults to False (returns a tuple of lightness,
+chroma, hue by default)
+"""
+
+    red, green, blue = hex2rgb(hexcode)
+
+    return rgb2oklch(red, green, blue, as_string)
+
+
+# A function to convert RGB colors to HSV colors
+def rgb2hsv(red=0, green=0, blue=0, as_string=False):
+    """Returns the equivalent HSV values of an RGB color value
+
+as_string (bool): decides if HSV values are to be returned in
+strings in the format 'hsv(<hue>, <saturation>, <value>)'
+or as a tuple. Defaults to False (returns a tuple of hue, saturation,
+value by default)
+"""
+
+    for color_value in (red, green, blue):
+        if type(color_value) not in (int, float):
+            raise TypeError(f'\'{color_value}\' must be of type \
+\'int\' or \'float\', not {_type(color_value)}')
+
+        if color_value > 255 or color_value < 0:
+            raise ValueError(f'\'color_value\' must be ≥ 0 and ≤ 255,\
+ not {color_value}')
+
+    red /= 255
+    green /= 255
+    blue /= 255
+
+    cmax = max(red, green, blue)
+    cmin = min(red, green, blue)
+
+    diff = cmax - cmin
+
+    # Hue calculation
+    if diff == 0:
+        hue = 0
+
+    elif cmax == red:
+        hue = 60 * (((green - blue) / diff) % 6)
+
+    elif cmax == green:
+        hue = 60 * (((blue - red) / diff) + 2)
+
+    elif cmax == blue:
+        hue = 60 * (((red - green) / diff) + 4)
+
+    hue = round(hue)
+
+    # Saturation calculation
+    saturation = 0 if cmax == 0 else diff / cmax
+
+    # Value calculation
+    value = cmax
+
+    if as_string:
+        return f'hsv({hue}, {saturation}, {value})'
+
+    return (hue, saturation, value)
+
+
+# A function to convert an RGB color to an HSL color
+def rgb2hsl(red=0, green=0, blue=0, as_string=False):
+    """Returns the equivalent HSL values of an RGB color value
+
+as_string (bool): decides if HSL values are to be returned in
+strings in the format 'hsl(<hue>, <saturation>, <luminance>)'
+or as a tuple. Defaults to False (returns a tuple of hue, saturation,
+luminance by default)
+"""
+
+    red /= 255
+    green /= 255
+    blue /= 255
+
+    cmax = max(red, green, blue)
+    cmin = min(red, green, blue)
+
+    diff = cmax - cmin
+
+    # Luminance calculation
+    luminance = (cmax + cmin) / 2
+
+    # Hue calculation
+    if diff == 0:
+        hue = 0
+
+    elif cmax == red:
+        hue = 60 * (((green - blue) / diff) % 6)
+
+    elif cmax == green:
+        hue = 60 * (((blue - red) / diff) + 2)
+
+    elif cmax == blue:
+        hue = 60 * (((red - green) / diff) + 4)
+
+    hue = round(hue)
+
+    # Saturation calculation
+    saturation = 0 if diff == 0 else diff / (1 - abs(2 * luminance - 1))
+
+    if as_string:
+        return f'hsl({hue}, {saturation}, {luminance})'
+
+    return (hue, saturation, luminance)
+
+
+# A function to convert an RGB color to YIQ color
+def rgb2yiq(red=0, green=0, blue=0, as_string=False):
+    """Returns the equivalent YIQ values of an RGB color value
+
+as_string (bool): decides if YIQ values are to be returned in
+strings in the format 'yiq(<y>, <i>, <q>)' or as a tuple.
+Defaults to False (returns a tuple of y, i, q by default)
+"""
+
+    red /= 255
+    blue /= 255
+    green /= 255
+
+    y = 0.30 * red + 0.59 * green + 0.11 * blue
+    i = 0.74 * (red - y) - 0.27 * (blue - y)
+    q = 0.48 * (red - y) + 0.41 * (blue - y)
+
+    y = round(clamp(value=y) * 255)
+    i = round(clamp(value=i) * 255)
+    q = round(clamp(value=q) * 255)
+
+    if as_string:
+        return f'yiq({y}, {i}, {q})'
+
+    return (y, i, q)
+
+
+# A function to convert an RGB color to CMYK color
+def rgb2cmyk(red=0, green=0, blue=0, as_string=False):
+    """Returns the equivalent CMYK values of an RGB color value
+
+as_string (bool): decides if CMYK values are to be returned in
+strings in the format 'cmyk(<cyan>, <magenta>, <yellow>, <key>)'
+or as a tuple. Defaults to False (returns a tuple of cyan, magenta,
+yellow, key by default)
+"""
+
+    red /= 255
+    green /= 255
+    blue /= 255
+
+    black_key = 1 - max(red, green, blue)
+
+    white_key = 1 - black_key if black_key != 1 else 1
+
+    cyan = (1 - red - black_key) / white_key
+    magenta = (1 - green - black_key) / white_key
+    yellow = (1 - blue - black_key) / white_key
+
+    if black_key == int(black_key):
+        black_key = int(black_key)
+
+    if cyan == int(cyan):
+        cyan = int(cyan)
+
+    if magenta == int(magenta):
+        magenta = int(magenta)
+
+    if yellow == int(yellow):
+        yellow = int(yellow)
+
+    if as_string:
+        return f'cmyk({cyan}, {magenta}, {yellow}, {black_key})'
+
+    return (cyan, magenta, yellow, black_key)
+
+
+# A function to convert an HSV color to an RGB color
+def hsv2rgb(hue=0, saturation=0, value=0, as_string=False):
+    """Returns the equivalent RGB values of an HSV color value
+
+as_string (bool): decides if RGB values are to be returned in
+strings in the format 'rgb(<red>, <green>, <blue>)' or as a tuple.
+Defaults to False (returns a tuple of red, green, blue by default)
+"""
+
+    # Check if parameters are perfect or not
+    if type(hue) not in (int, float):
+        raise TypeError(f'\'{hue}\' must be of type \'int\' or \
+\'float\', not {_type(hue)}')
+
+    hue -= 360 * (hue // 360)  # Cycle clamping *hue* in [0, 360]
+    hue /= 360
+
+    for color_value in (saturation, value):
+        if type(color_value) not in (int, float):
+            raise TypeError(f'\'{color_value}\' must be of type \
+\'int\' or \'float\', not {_type(color_value)}')
+
+    saturation = clamp(value=saturation)
+    value = clamp(value=value)
+
+    if saturation == 0:
+        value *= 255
+        red = green = blue = value
+
+        return (red, green, blue)
+
+    i = int(hue * 6)
+    f = hue * 6 - i
+    p = 255 * (value * (1 - saturation))
+    q = 255 * (value * (1 - saturation * f))
+    t = 255 * (value * (1 - saturation * (1 - f)))
+
+    value *= 255
+    i %= 6
+
+    if i == 0:
+        red, green, blue = (value, t, p)
+
+    elif i == 1:
+        red, green, blue = (q, value, p)
+
+    elif i == 2:
+        red, green, blue = (p, value, t)
+
+    elif i == 3:
+        red, green, blue = (p, q, value)
+
+    elif i == 4:
+        red, green, blue = (t, p, value)
+
+    elif i == 5:
+        red, green, blue = (value, p, q)
+
+    if as_string:
+        return f'rgb({red}, {green}, {blue})'
+
+    return (red, green, blue)
+
+
+# A function to convert an HSV color to an HSL color
+def hsv2hsl(hue=0, saturation=0, value=0, as_string=False):
+    """Returns the equivalent HSL values of an HSV color value
+
+as_string (bool): decides if HSL values are to be returned in
+strings in the format 'hsl(<hue>, <saturation>, <value>)'
+or as a tuple. Defaults to False (returns a tuple of hue, saturation,
+value by default)
+"""
+
+    red, green, value = hsv2rgb(hue, saturation, value)
+    hue, saturation, luminance = rgb2hsl(red, green, value)
+
+    if as_string:
+        return f'hsl({hue}, {saturation}, {luminance})'
+
+    return (hue, saturation, luminance)
+
+
+# A function to convert an HSV color to a YIQ color
+def hsv2yiq(hue=0, saturation=0, value=0, as_string=False):
+    """Returns the equivalent YIQ values of an HSV color value
+
+as_string (bool): decides if YIQ values are to be returned in
+strings in the format 'yiq(<y>, <i>, <q>)' or as a tuple.
+Defaults to False (returns a tuple of y, i, q by default)
+"""
+
+    red, green, blue = hsv2rgb(hue, saturation, value)
+    y, i, q = rgb2yiq(red, green, blue)
+
+    if as_string:
+        return f'yiq({y}, {i}, {q})'
+
+    return (y, i, q)
+
+
+# A function to convert an HSV color to a CMYK color
+def hsv2cmyk(hue=0, saturation=0, value=0, as_string=False):
+    """Returns the equivalent CMYK values of an HSV color value
+
+as_string (bool): decides if CMYK values are to be returned in
+strings in the format 'cmyk(<cyan>, <magenta>, <yellow>, <key>)'
+or as a tuple. Defaults to False (returns a tuple of cyan, magenta,
+yellow, key by default)
+"""
+
+    red, green, blue = hsv2rgb(hue, saturation, value)
+    cyan, magenta, yellow, black_key = rgb2cmyk(red, green, blue)
+
+    if as_string:
+        return f'cmyk({cyan}, {magenta}, {yellow}, {black_key})'
+
+    return (cyan, magenta, yellow, black_key)
+
+
+# A function to convert HSL color to an RGB color
+def hsl2rgb(hue=0, saturation=0, luminance=0, as_string=False):
+    """Returns the equivalent RGB values of an HSL color value
+
+as_string (bool): decides if RGB values are to be returned in
+strings in the format 'rgb(<red>, <green>, <blue>)' or as a tuple.
+Defaults to False (returns a tuple of red, green, blue by default)
+"""
+
+    # Check if parameters are perfect or not
+    if type(hue) not in (int, float):
+        raise TypeError(f'\'{hue}\' must be of type \'int\' or \
+\'float\', not {_type(hue)}')
+
+    hue -= 360 * (hue // 360)
+
+    for color_value in (saturation, luminance):
+        if type(color_value) not in (int, float):
+            raise TypeError(f'\'{color_value}\' must be of type \
+\'int\' or \'float\', not {_type(color_value)}')
+
+    saturation = clamp(value=saturation)
+    luminance = clamp(value=luminance)
+
+    c = (1 - abs(2 * luminance - 1)) * saturation
+    x = c * (1 - abs((hue / 60) % 2 - 1))
+    m = luminance - c / 2
+
+    if 0 <= hue < 60:
+        red, green, blue = (c, x, 0)
+
+    if 60 <= hue < 120:
+        red, green, blue = (x, c, 0)
+
+    if 120 <= hue < 180:
+        red, green, blue = (0, c, x)
+
+    if 180 <= hue < 240:
+        red, green, blue = (0, x, c)
+
+    if 240 <= hue < 300:
+        red, green, blue = (x, 0, c)
+
+    if 300 <= hue < 360:
+        red, green, blue = (c, 0, x)
+
+    red = round((red + m) * 255)
+    green = round((green + m) * 255)
+    blue = round((blue + m) * 255)
+
+    if as_string:
+        return f'rgb({red}, {green}, {blue})'
+
+    return (red, green, blue)
+
+
+# A function to convert an HSL color to an HSV color
+def hsl2hsv(hue=0, saturation=0, luminance=0, as_string=False):
+    """Returns the equivalent HSV values of an HSL color value
+
+as_string (bool): decides if HSV values are to be returned in
+strings in the format 'hsv(<hue>, <saturation>, <value>)'
+or as a tuple. Defaults to False (returns a tuple of hue, saturation,
+value by default)
+"""
+
+    red, green, blue = hsl2rgb(hue, saturation, luminance)
+    hue, saturation, value = rgb2hsv(red, green, blue)
+
+    if as_string:
+        return f'hsv({hue}, {saturation}, {value})'
+
+    return (hue, saturation, value)
+
+
+# A function to convert an HSL color to a YIQ color
+def hsl2yiq(hue=0, saturation=0, luminance=0, as_string=False):
+    """Returns the equivalent YIQ values of an HSL color value
+
+as_string (bool): decides if YIQ values are to be returned in
+strings in the format 'yiq(<y>, <i>, <q>)' or as a tuple.
+Defaults to False (returns a tuple of y, i, q by default)
+"""
+
+    red, green, blue = hsl2rgb(hue, saturation, luminance)
+    y, i, q = rgb2yiq(red, green, blue)
+
+    if as_string:
+        return f'yiq({y}, {i}, {q})'
+
+    return (y, i, q)
+
+
+# A function to convert an HSL color to a CMYK color
+def hsl2cmyk(hue=0, saturation=0, luminance=0, as_string=False):
+    """Returns the equivalent CMYK values of an HSL color value
+
+as_string (bool): decides if CMYK values are to be returned in
+strings in the format 'cmyk(<cyan>, <magenta>, <yellow>, <key>)'
+or as a tuple. Defaults to False (returns a tuple of cyan, magenta,
+yellow, key by default)
+"""
+
+    red, green, blue = hsl2rgb(hue, saturation, luminance)
+    cyan, magenta, yellow, black_key = rgb2cmyk(red, green, blue)
+
+    if as_string:
+        return f'cmyk({cyan}, {magenta}, {yellow}, {black_key})'
+
+    return (cyan, magenta, yellow, black_key)
+
+
+# A function to convert a YIQ color to an RGB color
+def yiq2rgb(y=0, i=0, q=0, as_string=False):
+    """Returns the equivalent RGB values of a YIQ color value
+
+as_string (bool): decides if RGB values are to be returned in
+strings in the format 'rgb(<red>, <green>, <blue>)' or as a tuple.
+Defaults to False (returns a tuple of red, green, blue by default)
+"""
+
+    for value in (y, i, q):
+        if type(value) not in (int, float):
+            raise TypeError(f'\'{value}\' must be of type \'int\' or \
+\'float\', not {_type(value)}')
+
+    y = clamp(0, y, 1)
+    i, q = clamp(0, i, 1), clamp(0, q, 1)
+
+    red = y + 0.9468822170900693 * i + 0.6235565819861433 * q
+    green = y - 0.27478764629897834 * i - 0.6356910791873801 * q
+    blue = y - 1.1085450346420322 * i + 1.7090069284064666 * q
+
+    red = round(clamp(value=red) * 255)
+    green = round(clamp(value=green) * 255)
+    blue = round(clamp(value=blue) * 255)
+
+    if as_string:
+        return f'rgb({red}, {green}, {blue})'
+
+    return (red, green, blue)
+
+
+# A function to convert a YIQ color to an HSV color
+def yiq2hsv(y=0, i=0, q=0, as_string=False):
+    """Returns the equivalent HSV values of a YIQ color value
+
+as_string (bool): decides if HSV values are to be returned in
+strings in the format 'hsv(<hue>, <saturation>, <value>)'
+or as a tuple. Defaults to False (returns a tuple of hue, saturation,
+value by default)
+"""
+
+    red, green, blue = yiq2rgb(y, i, q)
+    hue, saturation, value = rgb2hsv(red, green, blue)
+
+    if as_string:
+        return f'hsv({hue}, {saturation}, {value})'
+
+    return (hue, saturation, value)
+
+
+# A function to convert a YIQ color to an HSL color
+def yiq2hsl(y=0, i=0, q=0, as_string=False):
+    """Returns the equivalent HSL values of a YIQ color value
+
+as_string (bool): decides if HSL values are to be returned in
+strings in the format 'hsl(<hue>, <saturation>, <luminance>)'
+or as a tuple. Defaults to False (returns a tuple of hue, saturation,
+luminance by default)
+"""
+
+    red, green, blue = yiq2rgb(y, i, q)
+    hue, saturation, luminance = rgb2hsl(red, green, blue)
+
+    if as_string:
+        return f'hsl({hue}, {saturation}, {luminance})'
+
+    return (hue, saturation, luminance)
+
+
+# A function to convert a YIQ color to a CMYK color
+def yiq2cmyk(y=0, i=0, q=0, as_string=False):
+    """Returns the equivalent CMYK values of a YIQ color value
+
+as_string (bool): decides if CMYK values are to be returned in
+strings in the format 'cmyk(<cyan>, <magenta>, <yellow>, <key>)'
+or as a tuple. Defaults to False (returns a tuple of cyan, magenta,
+yellow, black_key by default)
+"""
+
+    red, green, blue = yiq2rgb(y, i, q)
+    cyan, magenta, yellow, black_key = rgb2cmyk(red, green, blue)
+
+    if as_string:
+        return f'cmyk({cyan}, {magenta}, {yellow}, {black_key})'
+
+    return (cyan, magenta, yellow, black_key)
+
+
+# A function to convert a CMYK color to an RGB color
+def cmyk2rgb(cyan=0, magenta=0, yellow=0, black_key=0, as_string=False):
+    """Returns the equivalent RGB values of an CMYK color value
+
+as_string (bool): decides if RGB values are to be returned in
+strings in the format 'rgb(<red>, <green>, <blue>)' or as a tuple.
+Defaults to False (returns a tuple of red, green, blue by default)
+"""
+
+    for color in (cyan, magenta, yellow, black_key):
+        if type(color) not in (int, float):
+            raise TypeError(f'\'{color}\' must be of type \'int\' or \
+\'float\', not {_type(color)}')
+
+    cyan = clamp(value=cyan)
+    magenta = clamp(value=magenta)
+    yellow = clamp(value=yellow)
+    black_key = clamp(value=black_key)
+
+    red = 255 * (1 - cyan) * (1 - black_key)
+    green = 255 * (1 - magenta) * (1 - black_key)
+    blue = 255 * (1 - yellow) * (1 - black_key)
+
+    if as_string:
+        return f'rgb({red}, {green}, {blue})'
+
+    return (red, green, blue)
+
+
+# A function to convert a CMYK color to an HSV color
+def cmyk2hsv(cyan=0, magenta=0, yellow=0, black_key=0, as_string=False):
+    """Returns the equivalent HSV values of an CMYK color value
+
+as_string (bool): decides if HSV values are to be returned in
+strings in the format 'hsv(<hue>, <saturation>, <value>)'
+or as a tuple. Defaults to False (returns a tuple of hue, saturation,
+value by default)
+"""
+
+    red, green, blue = cmyk2rgb(cyan, magenta, yellow, black_key)
+    hue, saturation, value = rgb2hsv(red, green, blue)
+
+    if as_string:
+        return f'hsv({hue}, {saturation}, {value})'
+
+    return (hue, saturation, value)
+
+
+# A function to convert a CMYK color to an HSL color
+def cmyk2hsl(cyan=0, magenta=0, yellow=0, black_key=0, as_string=False):
+    """Returns the equivalent HSL values of an CMYK color value
+
+as_string (bool): decides if HSL values are to be returned in
+strings in the format 'hsl(<hue>, <saturation>, <luminance>)'
+or as a tuple. Defaults to False (returns a tuple of hue, saturation,
+value by default)
+"""
+
+    red, green, blue = cmyk2rgb(cyan, magenta, yellow, black_key)
+    hue, saturation, luminance = rgb2hsl(red, green, blue)
+
+    if as_string:
+        return f'hsl({hue}, {saturation}, {luminance})'
+
+    return (hue, saturation, luminance)
+
+
+# A function to convert a CMYK color to a YIQ color
+def cmyk2yiq(cyan=0, magenta=0, yellow=0, black_key=0, as_string=False):
+    """Returns the equivalent YIQ values of an CMYK color value
+
+as_string (bool): decides if YIQ values are to be returned in
+strings in the format 'yiq(<y>, <i>, <q>)' or as a tuple.
+Defaults to False (returns a tuple of y, i, q by default)
+"""
+
+    red, green, blue = cmyk2rgb(cyan, magenta, yellow, black_key)
+    y, i, q = rgb2yiq(red, green, blue)
+
+    if as_string:
+        return f'yiq({y}, {i}, {q})'
+
+    return (y, i, q)
+
+
+# A function to convert an RGB color to an OKLab color
+def rgb2oklab(red=0, green=0, blue=0, as_string=False):
+    """Returns the equivalent OKLab values of an RGB color value
+
+OKLab is a perceptual color space: equal steps in lightness look
+equally different, which HSL luminance does not guarantee.
+For more information refer to:
+  https://bottosson.github.io/posts/oklab/
+
+as_string (bool): decides if OKLab values are to be returned in
+strings in the format 'oklab(<lightness>, <a>, <b>)' or as a tuple.
+Defaults to False (returns a tuple of lightness, a, b by default)
+"""
+
+    for color_value in (red, green, blue):
+        if type(color_value) not in (int, float):
+            raise TypeError(f'\'{color_value}\' must be of type \
+\'int\' or \'float\', not {_type(color_value)}')
+
+        if color_value > 255 or color_value < 0:
+            raise ValueError(f'\'color_value\' must be ≥ 0 and ≤ 255,\
+ not {color_value}')
+
+    red = _srgb2linear(red / 255)
+    green = _srgb2linear(green / 255)
+    blue = _srgb2linear(blue / 255)
+
+    # Linear sRGB to cone responses (LMS)
+    long_ = 0.4122214708 * red + 0.5363325363 * green + 0.0514459929 * blue
+    medium = 0.2119034982 * red + 0.6806995451 * green + 0.1073969566 * blue
+    short = 0.0883024619 * red + 0.2817188376 * green + 0.6299787005 * blue
+
+    long_ **= 1 / 3
+    medium **= 1 / 3
+    short **= 1 / 3
+
+    lightness = 0.2104542553 * long_ + 0.7936177850 * medium \
+        - 0.0040720468 * short
+    a = 1.9779984951 * long_ - 2.4285922050 * medium \
+        + 0.4505937099 * short
+    b = 0.0259040371 * long_ + 0.7827717662 * medium \
+        - 0.8086757660 * short
+
+    if as_string:
+        return f'oklab({lightness}, {a}, {b})'
+
+    return (lightness, a, b)
+
+
+# A function to convert an RGB color to an OKLCh color
+def rgb2oklch(red=0, green=0, blue=0, as_string=False):
+    """Returns the equivalent OKLCh values of an RGB color value
+
+as_string (bool): decides if OKLCh values are to be returned in
+strings in the format 'oklch(<lightness>, <chroma>, <hue>)'
+or as a tuple. Defaults to False (returns a tuple of lightness,
+chroma, hue by default)
+"""
+
+    lightness, a, b = rgb2oklab(red, green, blue)
+    lightness, chroma, hue = oklab2oklch(lightness, a, b)
+
+    if as_string:
+        return f'oklch({lightness}, {chroma}, {hue})'
+
+    return (lightness, chroma, hue)
+
+
+# Hidden function `_oklab2linear` to convert OKLab to linear sRGB
+def _oklab2linear(lightness, a, b):
+    """Returns the linear-light (red, green, blue) of an OKLab color,
+not clamped: channels out of [0, 1] are out of the sRGB gamut
+"""
+
+    long_ = lightness + 0.3963377774 * a + 0.2158037573 * b
+    medium = lightness - 0.1055613458 * a - 0.0638541728 * b
+    short = lightness - 0.0894841775 * a - 1.2914855480 * b
+
+    long_ **= 3
+    medium **= 3
+    short **= 3
+
+    return (
+        4.0767416621 * long_ - 3.3077115913 * medium + 0.2309699292 * short,
+        -1.2684380046 * long_ + 2.6097574011 * medium - 0.3413193965 * short,
+        -0.0041960863 * long_ - 0.7034186147 * medium + 1.7076147010 * short,
+    )
+
+
+# A function to convert an OKLab color to an RGB color
+def oklab2rgb(lightness=0, a=0, b=0, as_string=False):
+    """Returns the equivalent RGB values of an OKLab color value
+
+Colors outside of the sRGB gamut are clamped channel-wise
+
+as_string (bool): decides if RGB values are to be returned in
+strings in the format 'rgb(<red>, <green>, <blue>)' or as a tuple.
+Defaults to False (returns a tuple of red, green, blue by default)
+"""
+
+    for value in (lightness, a, b):
+        if type(value) not in (int, float):
+            raise TypeError(f'\'{value}\' must be of type \'int\' or \
+\'float\', not {_type(value)}')
+
+    red, green, blue = _oklab2linear(lightness, a, b)
+
+    red = round(_linear2srgb(clamp(value=red)) * 255)
+    green = round(_linear2srgb(clamp(value=green)) * 255)
+    blue = round(_linear2srgb(clamp(value=blue)) * 255)
+
+    if as_string:
+        return f'rgb({red}, {green}, {blue})'
+
+    return (red, green, blue)
+
+
+# A function to convert an OKLab color to an OKLCh color
+def oklab2oklch(lightness=0, a=0, b=0, as_string=False):
+    """Returns the equivalent OKLCh values of an OKLab color value
+
+as_string (bool): decides if OKLCh values are to be returned in
+strings in the format 'oklch(<lightness>, <chroma>, <hue>)'
+or as a tuple. Defaults to False (returns a tuple of lightness,
+chroma, hue by default)
+"""
+
+    chroma = _hypot(a, b)
+    hue = _degrees(_atan2(b, a)) % 360 if chroma > 1e-7 else 0
+
+    if as_string:
+        return f'oklch({lightness}, {chroma}, {hue})'
+
+    return (lightness, chroma, hue)
+
+
+# A function to convert an OKLCh color to an RGB color
+def oklch2rgb(lightness=0, chroma=0, hue=0, as_string=False):
+    """Returns the equivalent RGB values of an OKLCh color value
+
+as_string (bool): decides if RGB values are to be returned in
+strings in the format 'rgb(<red>, <green>, <blue>)' or as a tuple.
+Defaults to False (returns a tuple of red, green, blue by default)
+"""
+
+    lightness, a, b = oklch2oklab(lightness, chroma, hue)
+
+    return oklab2rgb(lightness, a, b, as_string)
+
+
+# A function to convert an OKLCh color to an OKLab color
+def oklch2oklab(lightness=0, chroma=0, hue=0, as_string=False):
+    """Returns the equivalent OKLab values of an OKLCh color value
+
+as_string (bool): decides if OKLab values are to be returned in
+strings in the format 'oklab(<lightness>, <a>, <b>)' or as a tuple.
+Defaults to False (returns a tuple of lightness, a, b by default)
+"""
+
+    for value in (lightness, chroma, hue):
+        if type(value) not in (int, float):
+            raise TypeError(f'\'{value}\' must be of type \'int\' or \
+\'float\', not {_type(value)}')
+
+    hue -= 360 * (hue // 360)  # Cycle clamping *hue* in [0, 360]
+    hue = _radians(hue)
+
+    a = chroma * _cos(hue)
+    b = chroma * _sin(hue)
+
+    if as_string:
+        return f'oklab({lightness}, {a}, {b})'
+
+    return (lightness, a, b)
+
+
+# CIE standard illuminant D65 reference white (X, Y, Z)
+_D65 = (0.95047, 1.0, 1.08883)
+
+
+# A function to convert an RGB color to a CIELAB color
+def rgb2lab(red=0, green=0, blue=0, as_string=False):
+    """Returns the equivalent CIELAB (L*a*b*, D65) values of an RGB color
+
+0 ≤ lightness ≤ 100; a and b are roughly within -128 and 127
+
+as_string (bool): decides if CIELAB values are to be returned in
+strings in the format 'lab(<lightness>, <a>, <b>)' or as a tuple.
+Defaults to False (returns a tuple of lightness, a, b by default)
+"""
+
+    for color_value in (red, green, blue):
+        if type(color_value) not in (int, float):
+            raise TypeError(f'\'{color_value}\' must be of type \
+\'int\' or \'float\', not {_type(color_value)}')
+
+        if color_value > 255 or color_value < 0:
+            raise ValueError(f'\'color_value\' must be ≥ 0 and ≤ 255,\
+ not {color_value}')
+
+    red = _srgb2linear(red / 255)
+    green = _srgb2linear(green / 255)
+    blue = _srgb2linear(blue / 255)
+
+    # Linear sRGB to CIE XYZ, relative to the reference white
+    x = (0.4124564 * red + 0.3575761 * green + 0.1804375 * blue) / _D65[0]
+    y = (0.2126729 * red + 0.7151522 * green + 0.0721750 * blue) / _D65[1]
+    z = (0.0193339 * red + 0.1191920 * green + 0.9503041 * blue) / _D65[2]
+
+    x, y, z = _lab_f(x), _lab_f(y), _lab_f(z)
+
+    lightness = 116 * y - 16
+    a = 500 * (x - y)
+    b = 200 * (y - z)
+
+    if as_string:
+        return f'lab({lightness}, {a}, {b})'
+
+    return (lightness, a, b)
+
+
+# A function to convert a CIELAB color to an RGB color
+def lab2rgb(lightness=0, a=0, b=0, as_string=False):
+    """Returns the equivalent RGB values of a CIELAB (D65) color value
+
+Colors outside of the sRGB gamut are clamped channel-wise
+
+as_string (bool): decides if RGB values are to be returned in
+strings in the format 'rgb(<red>, <green>, <blue>)' or as a tuple.
+Defaults to False (returns a tuple of red, green, blue by default)
+"""
+
+    for value in (lightness, a, b):
+        if type(value) not in (int, float):
+            raise TypeError(f'\'{value}\' must be of type \'int\' or \
+\'float\', not {_type(value)}')
+
+    y = (lightness + 16) / 116
+    x = y + a / 500
+    z = y - b / 200
+
+    x = _lab_finv(x) * _D65[0]
+    y = _lab_finv(y) * _D65[1]
+    z = _lab_finv(z) * _D65[2]
+
+    red = 3.2404542 * x - 1.5371385 * y - 0.4985314 * z
+    green = -0.9692660 * x + 1.8760108 * y + 0.0415560 * z
+    blue = 0.0556434 * x - 0.2040259 * y + 1.0572252 * z
+
+    red = round(_linear2srgb(clamp(value=red)) * 255)
+    green = round(_linear2srgb(clamp(value=green)) * 255)
+    blue = round(_linear2srgb(clamp(value=blue)) * 255)
+
+    if as_string:
+        return f'rgb({red}, {green}, {blue})'
+
+    return (red, green, blue)
+
+
+# Hidden CIELAB companding functions used by `rgb2lab` and `lab2rgb`
+def _lab_f(t):
+    """Returns the CIELAB companded value of a relative XYZ value *t*
+"""
+
+    if t > 216 / 24389:  # (6 / 29) ** 3
+        return t ** (1 / 3)
+
+    return t * 841 / 108 + 4 / 29
+
+
+def _lab_finv(t):
+    """Returns the relative XYZ value of a CIELAB companded value *t*
+"""
+
+    if t > 6 / 29:
+        return t ** 3
+
+    return 108 / 841 * (t - 4 / 29)
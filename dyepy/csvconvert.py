@@ -0,0 +1,300 @@
+"""Module to add converted color columns to CSV and TSV files.
+
+Each named source column (of colors: Hex codes, names, functional
+strings like 'rgb(0, 120, 215)') gets new columns, one per channel of
+each target space, e.g. the column 'color' converted to hex and hsl
+gets 'color_hex', 'color_hsl_h', 'color_hsl_s' and 'color_hsl_l'.
+
+The file is split into byte ranges of about `chunk_size` bytes, each
+ending at a line boundary, and every range is read, parsed, converted
+(each distinct color once, with the batch converters) and formatted by
+a process of a pool, which only gets the offsets of its range, not the
+data. The results are written back in the original order, with only
+a few chunks in flight at once, so memory stays bounded whatever the
+file size.
+
+Fields must not contain line breaks (even quoted), as chunks are cut
+at any line boundary.
+
+From the command line:
+python -m dyepy csv colors.csv --columns color --to hex hsl -o out.csv
+
+E.g.:
+convert_csv('colors.tsv', 'out.tsv', ['fg', 'bg'], ['oklch'], workers=8)
+
+Separate documentation for each function and class written with them.
+To read the documentation, type `help(<function/class>)` into the CLI
+"""
+
+
+import csv
+import io
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from dyepy.batch import ColorArray, as_rgb, convert_array
+from dyepy.converters import _type
+
+
+# Names of the channels of every space, ending the new column names
+_CHANNELS = {
+    'rgb': 'rgb',
+    'hsv': 'hsv',
+    'hsl': 'hsl',
+    'yiq': 'yiq',
+    'cmyk': 'cmyk',
+    'oklab': 'lab',
+    'oklch': 'lch',
+    'lab': 'lab',
+}
+
+
+# Hidden function `_ranges` to split a file into chunks of whole lines
+def _ranges(path, start, chunk_size):
+    """Yields (start, end) byte offsets of the chunks of the file *path*
+from the offset *start*, each ending just after a line break (or at the
+end of the file)
+"""
+
+    with open(path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+
+        while start < size:
+            file.seek(start + chunk_size)
+            # Up to the end of the line the chunk stops in
+            file.readline()
+            end = min(file.tell(), size)
+
+            yield start, end
+            start = end
+
+
+# Hidden function `_cells` to make the new cells of distinct colors
+def _cells(values, targets, precision):
+    """Returns {value: list of new cells} of the distinct color *values*;
+empty values get empty cells
+"""
+
+    colors = [value for value in values if value.strip()]
+    rgb = ColorArray.fromcolors(colors)
+    columns = []
+
+    for space in targets:
+        if space == 'hex':
+            columns.append([[code] for code in rgb.hex()])
+            continue
+
+        converted = convert_array(rgb, space)
+        data, channels = converted.data, converted.channels
+
+        if space != 'rgb':
+            data = [repr(round(value, precision) + 0.0) for value in data]
+
+        columns.append([data[index:index + channels]
+                        for index in range(0, len(data), channels)])
+
+    blank = [''] * sum(len(_CHANNELS[space]) if space != 'hex' else 1
+                       for space in targets)
+    cells = dict.fromkeys(values, blank)
+    cells.update((value, [cell for group in row for cell in group])
+                 for value, row in zip(colors, zip(*columns)))
+
+    return cells
+
+
+# Hidden pool task: converts one chunk of a file
+def _convert_chunk(path, start, end, encoding, delimiter, lineterminator,
+                   columns, targets, precision):
+    """Returns (rows, lines, output bytes, error) of the byte range
+*start*-*end* of the file *path*, with the new cells of the (index,
+name) *columns*
+
+Empty lines are skipped. *error* is None, or (line, message) of the
+first invalid row, *line* counting from 0 at *start*; the caller, which
+knows the lines before the chunk, raises it.
+"""
+
+    with open(path, 'rb') as file:
+        file.seek(start)
+        text = file.read(end - start).decode(encoding)
+
+    # Fields have no line breaks, so every row is one line
+    rows = list(csv.reader(io.StringIO(text, newline=''),
+                           delimiter=delimiter))
+    lines = len(rows)
+    numbers = [number for number, row in enumerate(rows) if row]
+    rows = [rows[number] for number in numbers]
+    new = [[] for _ in rows]
+
+    for index, name in columns:
+        for number, row in zip(numbers, rows):
+            if len(row) <= index:
+                return 0, lines, b'', (number, f'no column \'{name}\'')
+
+        values = [row[index] for row in rows]
+
+        try:
+            cells = _cells(list(dict.fromkeys(values)), targets, precision)
+
+        except (OverflowError, TypeError, ValueError):
+            # Find the first faulty row to report it
+            for number, value in zip(numbers, values):
+                try:
+                    if value.strip():
+                        as_rgb(value)
+
+                except (OverflowError, TypeError, ValueError) as error:
+                    return 0, lines, b'', (number, f'column \'{name}\': \
+{error}')
+
+            raise
+
+        for row, value in zip(new, values):
+            row += cells[value]
+
+    output = io.StringIO()
+    writer = csv.writer(output, delimiter=delimiter,
+                        lineterminator=lineterminator)
+    writer.writerows(row + cells for row, cells in zip(rows, new))
+
+    return len(rows), lines, output.getvalue().encode(encoding), None
+
+
+# A function to add converted color columns to a CSV or TSV file
+def convert_csv(source, output, columns, targets=('hex',), workers=None,
+                chunk_size=1 << 20, delimiter=None, precision=4,
+                encoding='utf-8'):
+    """Writes the CSV file *source* to *output* with new columns of the
+colors of *columns* converted to every target space; returns the number
+of rows (the header excluded)
+
+Empty lines are skipped. A row without one of the *columns*, or with an
+invalid color, raises a ValueError giving its row number (the line of
+the file, the header being row 1); the rows before it are already
+written.
+
+source: path of the file, whose first line is the header.
+output: path of the output, or a binary file (e.g. sys.stdout.buffer).
+columns (iterable): names of the source columns.
+targets (iterable): 'hex' or any space of `ColorArray`; new columns are
+    named '<column>_hex' and '<column>_<space>_<channel>'.
+workers (int): number of processes; 1 converts in this process, None
+    uses every CPU.
+chunk_size (int): bytes per chunk (rounded up to whole lines).
+delimiter (str): field delimiter; None is a tab for '.tsv' files, a
+    comma otherwise.
+precision (int): decimals of the values of the spaces other than hex
+    and rgb.
+"""
+
+    columns, targets = list(columns), list(targets)
+
+    for space in targets:
+        if space != 'hex' and space not in _CHANNELS:
+            raise ValueError(f'unknown color space \'{space}\'')
+
+    if type(chunk_size) is not int:
+        raise TypeError(f'\'{chunk_size}\' must be of type \'int\', not \
+{_type(chunk_size)}')
+
+    if chunk_size < 1:
+        raise ValueError(f'\'chunk_size\' must be ≥ 1, not \'{chunk_size}\'')
+
+    if delimiter is None:
+        delimiter = '\t' if os.fspath(source).lower().endswith('.tsv') \
+            else ','
+
+    with open(source, 'rb') as file:
+        line = file.readline()
+
+    lineterminator = '\r\n' if line.endswith(b'\r\n') else '\n'
+    header = next(csv.reader([line.decode(encoding).rstrip('\r\n')],
+                             delimiter=delimiter), [])
+
+    for name in columns:
+        if name not in header:
+            raise ValueError(f'no column \'{name}\' in \'{source}\'')
+
+    indexes = [(header.index(name), name) for name in columns]
+
+    for name in columns:
+        for space in targets:
+            if space == 'hex':
+                header.append(f'{name}_hex')
+
+            else:
+                header += [f'{name}_{space}_{channel}'
+                           for channel in _CHANNELS[space]]
+
+    arguments = (encoding, delimiter, lineterminator, indexes, targets,
+                 precision)
+
+    workers = workers or os.cpu_count() or 1
+    file = open(output, 'wb') if isinstance(output, (str, os.PathLike)) \
+        else output
+    pool = None
+    count = 0
+    lines = 1  # The header
+
+    def submit(start, end):
+        if pool is None:
+            future = Future()
+            future.set_result(_convert_chunk(source, start, end,
+                                             *arguments))
+
+            return future
+
+        return pool.submit(_convert_chunk, source, start, end, *arguments)
+
+    def write(future):
+        nonlocal count, lines
+
+        rows, chunk_lines, data, error = future.result()
+
+        if error is not None:
+            number, message = error
+
+            raise ValueError(f'row {lines + number + 1}: {message}')
+
+        file.write(data)
+        count += rows
+        lines += chunk_lines
+
+    try:
+        text = io.StringIO()
+        csv.writer(text, delimiter=delimiter,
+                   lineterminator=lineterminator).writerow(header)
+        file.write(text.getvalue().encode(encoding))
+
+        pending = deque()
+
+        if workers > 1:
+            pool = ProcessPoolExecutor(workers)
+
+        for start, end in _ranges(source, len(line), chunk_size):
+            pending.append(submit(start, end))
+
+            # Keeps every worker busy, without reading far ahead
+            while len(pending) > workers * 2:
+                write(pending.popleft())
+
+        while pending:
+            write(pending.popleft())
+
+    finally:
+        if pool is not None:
+            # Chunks not written yet are of no use after an error
+            # (`shutdown(cancel_futures=True)` needs Python 3.9)
+            for future in pending:
+                future.cancel()
+
+            pool.shutdown()
+
+        if file is not output:
+            file.close()
+
+        else:
+            file.flush()
+
+    return count
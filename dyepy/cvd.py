@@ -0,0 +1,154 @@
+"""Module to simulate color vision deficiencies (CVD).
+
+Protanomaly, deuteranomaly and tritanomaly (up to protanopia,
+deuteranopia and tritanopia at full severity) are simulated with the
+linear-RGB matrices of Machado, Oliveira and Fernandes (2009). Between
+0 (normal vision) and 1, the matrix is interpolated linearly from the
+identity.
+
+The matrix is fused with the linearisation: each of its 9 weights is
+folded into a 256-entry table of the linearised 8-bit values, so one
+simulated channel is 3 lookups and 2 sums, and it is encoded back to
+8 bits by bisection. Every step runs as `map` over whole channels of
+packed pixels, without any per-pixel Python code.
+
+E.g.:
+simulate_cvd(['#ff0000', '#00ff00'], 'deutan').hex()
+-> ['#a39000', '#efd63a']
+cvd_distinguishable(palette) -> False  # Some colors get confused
+for deficiency, i, j, distance in cvd_confusions(palette):
+    ...
+
+Separate documentation for each function and class written with them.
+To read the documentation, type `help(<function/class>)` into the CLI
+"""
+
+
+from bisect import bisect
+from functools import lru_cache, partial
+from operator import add
+
+from dyepy.batch import ColorArray, _LINEAR_BOUNDS, as_color_array
+from dyepy.deltae import delta_e_pairs
+from dyepy.converters import _SRGB_TO_LINEAR, _type
+
+
+# Simulation matrices of full deficiencies, on linear RGB
+CVD_MATRICES = {
+    'protan': (
+        (0.152286, 1.052583, -0.204868),
+        (0.114503, 0.786281, 0.099216),
+        (-0.003882, -0.048116, 1.051998),
+    ),
+    'deutan': (
+        (0.367322, 0.860646, -0.227968),
+        (0.280085, 0.672501, 0.047413),
+        (-0.011820, 0.042940, 0.968881),
+    ),
+    'tritan': (
+        (1.255528, -0.076749, -0.178779),
+        (-0.078411, 0.930809, 0.147602),
+        (0.004733, 0.691367, 0.303900),
+    ),
+}
+
+# Encodes a linear value to 8 bits (below 0 and above 1 are clamped)
+_encode = partial(bisect, _LINEAR_BOUNDS)
+
+
+# A function to get the simulation matrix of a deficiency
+def cvd_matrix(deficiency, severity=1.0):
+    """Returns the 3×3 linear-RGB matrix (tuple of rows) simulating
+*deficiency* ('protan', 'deutan' or 'tritan') at *severity* (0 to 1)
+"""
+
+    if deficiency not in CVD_MATRICES:
+        raise ValueError(f'\'deficiency\' must be one of \
+{", ".join(CVD_MATRICES)}, not \'{deficiency}\'')
+
+    if type(severity) not in (int, float):
+        raise TypeError(f'\'{severity}\' must be of type \'int\' or \
+\'float\', not {_type(severity)}')
+
+    if not 0 <= severity <= 1:
+        raise ValueError(f'\'severity\' must be ≥ 0 and ≤ 1, not \
+\'{severity}\'')
+
+    return tuple(
+        tuple(severity * weight + (1 - severity) * (i == j)
+              for j, weight in enumerate(row))
+        for i, row in enumerate(CVD_MATRICES[deficiency]))
+
+
+# Hidden function `_tables` to fuse a matrix with the linearisation
+@lru_cache(maxsize=64)
+def _tables(deficiency, severity):
+    """Returns, for each row of the matrix, the 3 tables of its weights
+times every linearised 8-bit value
+"""
+
+    return tuple(
+        tuple(tuple(weight * linear for linear in _SRGB_TO_LINEAR)
+              for weight in row)
+        for row in cvd_matrix(deficiency, severity))
+
+
+# A function to simulate a color vision deficiency on many colors
+def simulate_cvd(colors, deficiency, severity=1.0):
+    """Returns an RGB `ColorArray` of *colors* as seen with
+*deficiency* ('protan', 'deutan' or 'tritan') at *severity* (0 to 1)
+
+*colors* may be anything accepted by `as_color_array`, e.g. packed
+8-bit RGB pixels (bytes, bytearray, memoryview); `tobytes` gives the
+simulated pixels back in the same layout.
+"""
+
+    data = as_color_array(colors).data
+    channels = data[0::3], data[1::3], data[2::3]
+    out = bytearray(len(data))
+
+    for index, row in enumerate(_tables(deficiency, float(severity))):
+        red, green, blue = (map(table.__getitem__, channel)
+                            for table, channel in zip(row, channels))
+        out[index::3] = bytes(map(_encode, map(add, map(add, red, green),
+                                               blue)))
+
+    return ColorArray.frombuffer(out)
+
+
+# A function to find the colors of a palette confused with a CVD
+def cvd_confusions(colors, deficiencies=('protan', 'deutan', 'tritan'),
+                   severity=1.0, threshold=10, method='ciede2000'):
+    """Yields (deficiency, i, j, distance) for every pair of *colors*
+(i < j) within *threshold* (Delta E) of each other once simulated with
+each of *deficiencies*
+
+For the *method* and the scale of *threshold*, refer to `delta_e`;
+the default (10) asks for colors that look clearly different, e.g.
+the categories of a chart.
+"""
+
+    if isinstance(deficiencies, str):
+        deficiencies = (deficiencies,)
+
+    for deficiency in deficiencies:
+        simulated = simulate_cvd(colors, deficiency, severity)
+
+        for i, j, distance in delta_e_pairs(simulated, threshold,
+                                            method=method):
+            yield deficiency, i, j, distance
+
+
+# A function to check if a palette stays distinguishable with CVD
+def cvd_distinguishable(colors, deficiencies=('protan', 'deutan',
+                                              'tritan'),
+                        severity=1.0, threshold=10, method='ciede2000'):
+    """Returns whether every pair of *colors* stays more than *threshold*
+apart (Delta E) with each of *deficiencies*
+
+Stops at the first confused pair; to list them all, refer to
+`cvd_confusions`.
+"""
+
+    return next(cvd_confusions(colors, deficiencies, severity, threshold,
+                               method), None) is None
@@ -0,0 +1,347 @@
+"""Module with batched color-difference (Delta E) calculations.
+
+Delta E is the perceptual distance between two colors in CIELAB.
+This module implements the three common CIE formulas (CIE76, CIE94
+and CIEDE2000) for one pair, one-to-many and many-to-many, where the
+many-to-many forms work on square tiles of a configurable size, so
+comparing 50k colors with each other never needs the full N×N matrix
+in memory.
+
+E.g.:
+delta_e('#ff0000', '#fe0000') -> 0.207...
+for i, j, distance in delta_e_pairs(catalogue, threshold=1.0):
+    print(f'{i} and {j} look the same ({distance:.2f})')
+
+Separate documentation for each function written with them.
+To read the documentation, type `help(<function>)` into the CLI
+"""
+
+
+from array import array
+from functools import lru_cache
+from math import atan2, cos, exp, hypot, pi, sin, sqrt
+
+from dyepy.batch import ColorArray, as_color_array, as_rgb, rgb2lab_array
+from dyepy.colors import Colors
+from dyepy.converters import _type, rgb2lab
+from dyepy.dither import XTERM_PALETTE
+
+
+# 25 ** 7, used by the chroma terms of CIEDE2000
+_POW25_7 = 6103515625
+
+_TAU = 2 * pi
+
+
+# Hidden CIE76 kernel: one color against columns of L, a, b values
+def _cie76(lightness, a, b, lightnesses, as_, bs):
+    """Returns a list of CIE76 distances (Euclidean in CIELAB)
+"""
+
+    return [sqrt((lightness - l2) ** 2 + (a - a2) ** 2 + (b - b2) ** 2)
+            for l2, a2, b2 in zip(lightnesses, as_, bs)]
+
+
+# Hidden CIE94 kernel (graphic arts weights), the first color is
+# the reference, so the formula is not symmetric
+def _cie94(lightness, a, b, lightnesses, as_, bs):
+    """Returns a list of CIE94 distances (kL = kC = kH = 1)
+"""
+
+    chroma = hypot(a, b)
+    sc = 1 + 0.045 * chroma
+    sh = 1 + 0.015 * chroma
+    distances = []
+    append = distances.append
+
+    for l2, a2, b2 in zip(lightnesses, as_, bs):
+        dc = chroma - hypot(a2, b2)
+        dh2 = (a - a2) ** 2 + (b - b2) ** 2 - dc * dc
+        dc /= sc
+
+        append(sqrt((lightness - l2) ** 2 + dc * dc
+                    + (dh2 if dh2 > 0 else 0) / (sh * sh)))
+
+    return distances
+
+
+# Hidden CIEDE2000 kernel, following Sharma, Wu and Dalal (2005)
+def _ciede2000(lightness, a, b, lightnesses, as_, bs):
+    """Returns a list of CIEDE2000 distances (kL = kC = kH = 1)
+"""
+
+    chroma = hypot(a, b)
+    distances = []
+    append = distances.append
+
+    for l2, a2, b2 in zip(lightnesses, as_, bs):
+        chroma_mean = (chroma + hypot(a2, b2)) / 2
+        chroma_mean **= 7
+        g = 1.5 - 0.5 * sqrt(chroma_mean / (chroma_mean + _POW25_7))
+
+        a1p = a * g
+        a2p = a2 * g
+        c1p = hypot(a1p, b)
+        c2p = hypot(a2p, b2)
+        h1p = atan2(b, a1p) % _TAU if c1p else 0.0
+        h2p = atan2(b2, a2p) % _TAU if c2p else 0.0
+
+        dl = l2 - lightness
+        dc = c2p - c1p
+        product = c1p * c2p
+
+        if product:
+            dh = h2p - h1p
+
+            if dh > pi:
+                dh -= _TAU
+
+            elif dh < -pi:
+                dh += _TAU
+
+            dh = 2 * sqrt(product) * sin(dh / 2)
+
+            h_mean = h1p + h2p
+
+            if abs(h1p - h2p) > pi:
+                h_mean += _TAU if h_mean < _TAU else -_TAU
+
+            h_mean /= 2
+
+        else:
+            dh = 0.0
+            h_mean = h1p + h2p
+
+        l_mean = (lightness + l2) / 2 - 50
+        l_mean *= l_mean
+        c_mean = (c1p + c2p) / 2
+
+        t = (1 - 0.17 * cos(h_mean - 0.5235987755982988)
+             + 0.24 * cos(2 * h_mean)
+             + 0.32 * cos(3 * h_mean + 0.10471975511965977)
+             - 0.20 * cos(4 * h_mean - 1.0995574287564276))
+
+        # 275° and 25° in radians
+        rotation = (h_mean - 4.799655442984406) / 0.4363323129985824
+        rotation = 1.0471975511965976 * exp(-rotation * rotation)
+
+        c_mean7 = c_mean ** 7
+        rt = -2 * sqrt(c_mean7 / (c_mean7 + _POW25_7)) * sin(rotation)
+
+        dl /= 1 + 0.015 * l_mean / sqrt(20 + l_mean)
+        dc /= 1 + 0.045 * c_mean
+        dh /= 1 + 0.015 * c_mean * t
+
+        append(sqrt(dl * dl + dc * dc + dh * dh + rt * dc * dh))
+
+    return distances
+
+
+_METHODS = {
+    'cie76': _cie76,
+    'cie94': _cie94,
+    'ciede2000': _ciede2000,
+}
+
+
+# Hidden function `_kernel` to look up a Delta E formula by name
+def _kernel(method):
+    """Returns the one-to-many kernel of the Delta E *method*
+"""
+
+    try:
+        return _METHODS[method.lower()]
+
+    except (KeyError, AttributeError):
+        raise ValueError(f'\'method\' must be one of \
+{", ".join(_METHODS)}, not \'{method}\'') from None
+
+
+# Hidden function `_lab` to turn any colors to CIELAB columns
+def _lab(colors):
+    """Returns the L, a, b columns of *colors* as three arrays
+
+*colors* may be a CIELAB `ColorArray` (used as it is) or anything
+accepted by `as_color_array`
+"""
+
+    if not (isinstance(colors, ColorArray) and colors.space == 'lab'):
+        colors = rgb2lab_array(as_color_array(colors))
+
+    return colors.channel(0), colors.channel(1), colors.channel(2)
+
+
+# Hidden function `_lab_color` to turn any single color to CIELAB
+def _lab_color(color):
+    """Returns *color* (anything accepted by `as_rgb`) in CIELAB
+"""
+
+    return rgb2lab(*as_rgb(color))
+
+
+# A function to calculate the Delta E between two colors
+def delta_e(color1, color2, method='ciede2000'):
+    """Returns the Delta E (perceptual distance) of two colors
+
+*color1* and *color2* may be anything accepted by `as_rgb`
+(Hex strings, names, functional strings, RGB tuples, packed ints).
+
+method (str): 'cie76', 'cie94' or 'ciede2000' (default).
+A Delta E below 1 is not noticeable, around 2-3 is only
+noticeable side by side, and above 10 the colors look different.
+"""
+
+    lightness, a, b = _lab_color(color1)
+    lightness2, a2, b2 = _lab_color(color2)
+
+    return _kernel(method)(lightness, a, b, (lightness2,), (a2,), (b2,))[0]
+
+
+# A function to calculate the Delta E between one color and many
+def delta_e_one_to_many(color, colors, method='ciede2000'):
+    """Returns an array('d') of Delta E values from *color* to *colors*
+
+*color* may be anything accepted by `as_rgb`, *colors* may be a
+CIELAB `ColorArray` or anything accepted by `as_color_array`
+"""
+
+    kernel = _kernel(method)
+
+    return array('d', kernel(*_lab_color(color), *_lab(colors)))
+
+
+# A function to calculate a many-to-many Delta E matrix in tiles
+def delta_e_matrix(colors, others=None, method='ciede2000', tile=1024):
+    """Yields the Delta E matrix of *colors* × *others* tile by tile
+
+Each item is a tuple (row, column, block) where *block* is a list of
+array('d') rows of at most *tile* × *tile* distances, and *row* and
+*column* are the indexes of its top-left distance in the full matrix.
+Only one block is held in memory at any time: 1024 × 1024 doubles
+are 8 MB, whereas 50k × 50k doubles would be 20 GB.
+
+*others* defaults to *colors* itself (a square, symmetric matrix).
+"""
+
+    if type(tile) is not int:
+        raise TypeError(f'\'{tile}\' must be of type \'int\', not \
+{_type(tile)}')
+
+    if tile < 1:
+        raise ValueError(f'\'tile\' must be ≥ 1, not \'{tile}\'')
+
+    kernel = _kernel(method)
+    rows = _lab(colors)
+    columns = rows if others is None else _lab(others)
+
+    for row in range(0, len(rows[0]), tile):
+        tile_rows = [channel[row:row + tile] for channel in rows]
+
+        for column in range(0, len(columns[0]), tile):
+            tile_columns = [channel[column:column + tile]
+                            for channel in columns]
+
+            yield row, column, [
+                array('d', kernel(lightness, a, b, *tile_columns))
+                for lightness, a, b in zip(*tile_rows)
+            ]
+
+
+# A function to find all pairs of colors closer than a threshold
+def delta_e_pairs(colors, threshold, others=None, method='ciede2000',
+                  tile=1024):
+    """Yields (i, j, distance) for every pair with Delta E ≤ *threshold*
+
+Without *others*, pairs within *colors* are compared once each
+(i < j) which halves the work, else every color i of *colors* is
+compared with every color j of *others*. Works tile by tile like
+`delta_e_matrix`, so memory stays bounded by *tile*.
+
+E.g. (deduplicating a palette):
+duplicates = {j for i, j, _ in delta_e_pairs(palette, threshold=1)}
+"""
+
+    if type(tile) is not int:
+        raise TypeError(f'\'{tile}\' must be of type \'int\', not \
+{_type(tile)}')
+
+    if tile < 1:
+        raise ValueError(f'\'tile\' must be ≥ 1, not \'{tile}\'')
+
+    kernel = _kernel(method)
+    rows = _lab(colors)
+    symmetric = others is None
+    columns = rows if symmetric else _lab(others)
+
+    for row in range(0, len(rows[0]), tile):
+        tile_rows = [channel[row:row + tile] for channel in rows]
+
+        # In the symmetric case only the upper triangle of tiles is used
+        for column in range(row if symmetric else 0, len(columns[0]), tile):
+            tile_columns = [channel[column:column + tile]
+                            for channel in columns]
+
+            for i, (lightness, a, b) in enumerate(zip(*tile_rows), row):
+                skip = i - column + 1 if symmetric and column == row else 0
+
+                if skip:
+                    distances = kernel(lightness, a, b, *(
+                        channel[skip:] for channel in tile_columns))
+
+                else:
+                    distances = kernel(lightness, a, b, *tile_columns)
+
+                for j, distance in enumerate(distances, column + skip):
+                    if distance <= threshold:
+                        yield i, j, distance
+
+
+# A function to match colors to their nearest colors of a palette
+def delta_e_nearest(colors, palette, method='ciede2000'):
+    """Returns the nearest *palette* color of each of *colors*
+
+Returns a tuple of two arrays: the indexes of the nearest palette
+colors (array('L')) and their Delta E distances (array('d')).
+"""
+
+    kernel = _kernel(method)
+    palette = _lab(palette)
+
+    if not palette[0]:
+        raise ValueError('\'palette\' must not be empty')
+
+    indexes = array('L')
+    distances = array('d')
+
+    for lightness, a, b in zip(*_lab(colors)):
+        row = kernel(lightness, a, b, *palette)
+        distance = min(row)
+
+        indexes.append(row.index(distance))
+        distances.append(distance)
+
+    return indexes, distances
+
+
+# A function to get a named palette to match colors to
+@lru_cache(None)
+def named_palette(name):
+    """Returns (names, Hex codes) of the palette *name*: 'css' (the
+lowercase names of `Colors`) or 'xterm' (the 256 terminal colors, named
+by their index)
+"""
+
+    if name == 'xterm':
+        return tuple(map(str, range(len(XTERM_PALETTE)))), XTERM_PALETTE
+
+    if name != 'css':
+        raise ValueError(f'unknown palette \'{name}\'')
+
+    # One name per color: the first in alphabetical order
+    codes = {}
+
+    for color in sorted(vars(Colors)):
+        if color.isupper():
+            codes.setdefault(getattr(Colors, color), color.lower())
+
+    return tuple(codes.values()), tuple(codes)
@@ -0,0 +1,307 @@
+"""Module with row-streaming dithering of images to a palette.
+
+Mapping every pixel to its nearest palette color (e.g. the 256 colors
+of `Styles.Fg.n`) gives visible banding on gradients. Dithering hides
+it: Floyd-Steinberg error diffusion pushes each pixel's error onto its
+neighbours, and ordered (Bayer) dithering adds a fixed threshold
+pattern before the lookup.
+
+Both work one scanline at a time: rows go in as packed RGB bytes and
+come out as bytes of palette indexes, and only one row of error is
+carried along, so even huge images are dithered in constant memory.
+Nearest-color lookups use a `PaletteIndex` instead of a linear scan
+of the palette.
+
+E.g.:
+index = PaletteIndex(XTERM_PALETTE)
+for indexes in floyd_steinberg(rows, width, index):
+    print(''.join(Styles.Bg.n(value) + ' ' for value in indexes))
+
+Separate documentation for each function and class written with them.
+To read the documentation, type `help(<function/class>)` into the CLI
+"""
+
+
+from dyepy.batch import ColorArray, as_color_array
+from dyepy.converters import _type, rgb
+
+
+# Levels of the 6×6×6 color cube of the 256-color terminal palette
+_CUBE = (0, 95, 135, 175, 215, 255)
+
+# The 256 colors of `Styles.Fg.n` and `Styles.Bg.n` as Hex strings
+# (the 16 system colors use the xterm defaults)
+XTERM_PALETTE = tuple(
+    [
+        '#000000', '#800000', '#008000', '#808000',
+        '#000080', '#800080', '#008080', '#c0c0c0',
+        '#808080', '#ff0000', '#00ff00', '#ffff00',
+        '#0000ff', '#ff00ff', '#00ffff', '#ffffff',
+    ]
+    + [rgb(_CUBE[value // 36], _CUBE[value // 6 % 6], _CUBE[value % 6])
+       for value in range(216)]
+    + [rgb(8 + 10 * value, 8 + 10 * value, 8 + 10 * value)
+       for value in range(24)]
+)
+
+
+# Hidden function `_bayer` to build a Bayer threshold matrix
+def _bayer(size):
+    """Returns the *size* × *size* Bayer matrix (values 0 to size² - 1)
+"""
+
+    matrix = [[0]]
+
+    while len(matrix) < size:
+        matrix = [[4 * value for value in row]
+                  + [4 * value + 2 for value in row] for row in matrix] \
+            + [[4 * value + 3 for value in row]
+               + [4 * value + 1 for value in row] for row in matrix]
+
+    return matrix
+
+
+_BAYER = {size: _bayer(size) for size in (2, 4, 8)}
+
+
+# A class to find the nearest color of a palette quickly
+class PaletteIndex:
+    """PaletteIndex class
+
+A lookup structure for the nearest color (Euclidean RGB distance) of
+a palette of up to 256 colors. The RGB cube is split into 16×16×16
+cells; for each cell, the palette colors that could be the nearest of
+any point in it are found once (on first use) and cached, so a lookup
+only compares a handful of colors instead of the whole palette.
+
+E.g.:
+index = PaletteIndex(['#000000', '#ffffff', '#ff0000'])
+index.nearest(200, 30, 40) -> 2
+"""
+
+    def __init__(self, palette):
+        palette = as_color_array(palette)
+
+        if not 1 <= len(palette) <= 256:
+            raise ValueError(f'\'palette\' must have 1 to 256 colors, \
+not {len(palette)}')
+
+        self.palette = palette
+        self.colors = list(palette)
+        self._cells = [None] * 4096
+        self._rows = [bytes(color) for color in self.colors]
+
+    def __len__(self):
+        return len(self.colors)
+
+    def _candidates(self, cell):
+        """Returns the (index, red, green, blue) that may be nearest
+to any point of *cell*, and caches them
+"""
+
+        low = (cell >> 8 << 4, (cell >> 4 & 15) << 4, (cell & 15) << 4)
+        bounds = []
+
+        for color in self.colors:
+            nearest = farthest = 0
+
+            # Floats up to (but excluding) the next cell fall in it
+            for value, start in zip(color, low):
+                end = start + 16
+
+                if value < start:
+                    nearest += (start - value) ** 2
+
+                elif value > end:
+                    nearest += (value - end) ** 2
+
+                farthest += max(value - start, end - value) ** 2
+
+            bounds.append((nearest, farthest))
+
+        limit = min(farthest for _, farthest in bounds)
+        candidates = tuple(
+            (index, *color)
+            for index, (color, (nearest, _)) in enumerate(zip(self.colors,
+                                                              bounds))
+            if nearest <= limit
+        )
+        self._cells[cell] = candidates
+
+        return candidates
+
+    def nearest(self, red, green, blue):
+        """Returns the index of the palette color nearest to an RGB color
+
+0 ≤ red, green, blue ≤ 255 (floats are accepted too)
+"""
+
+        cell = (int(red) >> 4 << 8) | (int(green) >> 4 << 4) \
+            | (int(blue) >> 4)
+        candidates = self._cells[cell] or self._candidates(cell)
+        best = 195076  # 3 × 255² + 1
+
+        for index, pr, pg, pb in candidates:
+            distance = (red - pr) ** 2 + (green - pg) ** 2 \
+                + (blue - pb) ** 2
+
+            if distance < best:
+                best = distance
+                nearest = index
+
+        return nearest
+
+    def map_row(self, row):
+        """Returns bytes of the nearest palette indexes of a row of
+packed RGB bytes (no dithering)
+"""
+
+        nearest = self.nearest
+
+        return bytes(map(nearest, row[0::3], row[1::3], row[2::3]))
+
+    def rgb_row(self, indexes):
+        """Returns packed RGB bytes of a row of palette *indexes*
+"""
+
+        return b''.join(map(self._rows.__getitem__, indexes))
+
+
+# Hidden function `_as_index` to accept a palette or a PaletteIndex
+def _as_index(palette):
+    """Returns *palette* as a `PaletteIndex`
+"""
+
+    if isinstance(palette, PaletteIndex):
+        return palette
+
+    return PaletteIndex(palette)
+
+
+# Hidden function `_check_row` to validate a row of packed RGB bytes
+def _check_row(row, width):
+    """Returns *row* as bytes-like of *width* RGB pixels, else raises
+"""
+
+    if isinstance(row, ColorArray):
+        row = row.data
+
+    if len(row) != width * 3:
+        raise ValueError(f'rows must have {width * 3} bytes \
+({width} RGB pixels), not {len(row)}')
+
+    return row
+
+
+# A function to dither rows of pixels with Floyd-Steinberg diffusion
+def floyd_steinberg(rows, width, palette=XTERM_PALETTE):
+    """Yields bytes of palette indexes for each row of *rows*
+
+*rows* is any iterable (e.g. a generator reading a file) of rows of
+*width* packed 8-bit RGB pixels (bytes, bytearray, memoryview or an
+RGB `ColorArray`). *palette* may be a `PaletteIndex` (reuse one for
+many images) or colors accepted by `as_color_array`.
+
+The error of every pixel is spread to its neighbours:
+          x    7/16
+    3/16 5/16  1/16
+Only the errors for the next row are carried between rows.
+"""
+
+    if type(width) is not int:
+        raise TypeError(f'\'{width}\' must be of type \'int\', not \
+{_type(width)}')
+
+    index = _as_index(palette)
+    nearest = index.nearest
+    colors = index.colors
+
+    # Errors carried to the current and next rows, with one spare
+    # pixel on both sides to avoid bound checks at the edges
+    current = [0.0] * (width * 3 + 6)
+    below = [0.0] * (width * 3 + 6)
+
+    for row in rows:
+        row = _check_row(row, width)
+        out = bytearray(width)
+        right_r = right_g = right_b = 0.0
+
+        for x in range(width):
+            offset = x * 3
+            error = offset + 3
+
+            red = row[offset] + current[error] + right_r
+            green = row[offset + 1] + current[error + 1] + right_g
+            blue = row[offset + 2] + current[error + 2] + right_b
+
+            red = 0 if red < 0 else 255 if red > 255 else red
+            green = 0 if green < 0 else 255 if green > 255 else green
+            blue = 0 if blue < 0 else 255 if blue > 255 else blue
+
+            value = out[x] = nearest(red, green, blue)
+            pr, pg, pb = colors[value]
+
+            red -= pr
+            green -= pg
+            blue -= pb
+
+            right_r = red * 0.4375
+            right_g = green * 0.4375
+            right_b = blue * 0.4375
+
+            below[error - 3] += red * 0.1875
+            below[error - 2] += green * 0.1875
+            below[error - 1] += blue * 0.1875
+            below[error] += red * 0.3125
+            below[error + 1] += green * 0.3125
+            below[error + 2] += blue * 0.3125
+            below[error + 3] = red * 0.0625
+            below[error + 4] = green * 0.0625
+            below[error + 5] = blue * 0.0625
+
+        current, below = below, current
+        below[0:6] = (0.0,) * 6
+
+        yield bytes(out)
+
+
+# A function to dither rows of pixels with a Bayer threshold matrix
+def ordered_dither(rows, width, palette=XTERM_PALETTE, size=4, spread=48):
+    """Yields bytes of palette indexes for each row of *rows*
+
+*rows*, *width* and *palette* are as in `floyd_steinberg`.
+size (int): 2, 4 or 8, the side of the Bayer matrix.
+spread (float): amplitude of the threshold pattern in 0-255 units,
+    roughly the distance between neighbouring palette colors (about
+    40-50 for the 256-color terminal palette).
+
+Unlike error diffusion, every row is dithered on its own, so rows
+can also be processed out of order or in parallel.
+"""
+
+    if size not in _BAYER:
+        raise ValueError(f'\'size\' must be 2, 4 or 8, not \'{size}\'')
+
+    index = _as_index(palette)
+    nearest = index.nearest
+
+    # Threshold offsets of each row of the matrix, repeated to *width*
+    pattern = [
+        [(value + 0.5) / (size * size) * spread - spread / 2
+         for value in matrix_row] * (width // size + 1)
+        for matrix_row in _BAYER[size]
+    ]
+
+    for y, row in enumerate(rows):
+        row = _check_row(row, width)
+        offsets = pattern[y % size]
+
+        yield bytes(map(
+            nearest,
+            [min(255, max(0, value + offset))
+             for value, offset in zip(row[0::3], offsets)],
+            [min(255, max(0, value + offset))
+             for value, offset in zip(row[1::3], offsets)],
+            [min(255, max(0, value + offset))
+             for value, offset in zip(row[2::3], offsets)],
+        ))
@@ -0,0 +1,293 @@
+"""Module with the `extract_*` functions, parsing colors of any form.
+
+Each of them reads an RGB, HSV, HSL, YIQ or CMYK color written as a
+functional string, a set, a list, a tuple or a dict, into a tuple.
+
+Separate documentation for each function and class written with them.
+To read the documentation, type `help(<function/class>)` into the CLI
+"""
+
+
+from dyepy.converters import _type
+
+
+# A function to extract red, green, blue values from an RGB color
+def extract_rgb(rgb='rgb(0, 0, 0)'):
+    """Extracts and returns red, green, blue values from an RGB
+string, set, list, tuple, or a dictionary, as a tuple object.
+
+E.g.:
+rgb = 'rgb(69, 69, 69)'
+rgb = {69, 69, 69}  # Order: red, green, blue
+rgb = [69, 69, 69]  # Order: red, green, blue
+rgb = (69, 69, 69)  # Order: red, green, blue
+rgb = {
+    'red': 69,
+    'green': 69,
+    'blue': 69
+}
+
+Note: Dictionary keys may be different but also unique,
+and, the color values order is: red, green, blue
+"""
+
+    # Extraction from a `str` object (string)
+    if isinstance(rgb, str):
+        rgb = rgb.replace(' ', '')  # Remove whitespaces
+        rgb = rgb.replace('rgb(', '').replace(')', '')  # Remove non-ints
+        rgb = rgb.split(',')  # Extract RGB values to a list
+        rgb = list(map(float, rgb))  # Convert strings to numbers
+        rgb = tuple(map(round, rgb))  # Round floating-points to ints
+
+        return rgb
+
+    # Extraction from a `set` object (set)
+    if isinstance(rgb, set):
+        return tuple(round(float(value)) for value in rgb)
+
+    # Extraction from a `list` object (list)
+    if isinstance(rgb, list):
+        rgb = list(map(float, rgb))
+        rgb = tuple(map(round, rgb))
+
+        return rgb
+
+    # Extraction from a `tuple` object (tuple)
+    if isinstance(rgb, tuple):
+        rgb = list(map(float, list(rgb)))
+        rgb = tuple(map(round, rgb))
+
+        return rgb
+
+    # Extraction from a `dict` object (dict.values)
+    if isinstance(rgb, dict):
+        return tuple(round(float(value)) for value in rgb.values())
+
+    else:
+        raise TypeError(f'unacceptable type {_type(rgb)} recieved')
+
+
+# A function to extract hue, saturation, value values from an RGB color
+def extract_hsv(hsv='hsv(0, 0, 0)'):
+    """Extracts and returns hue, saturation, value values from an HSV
+string, set, list, tuple, or a dictionary, as a tuple object.
+
+E.g.:
+hsv = 'hsv(0, 1, 1)'
+hsv = {0, 1, 1}  # Order: hue, saturation, value
+hsv = [0, 1, 1]  # Order: hue, saturation, value
+hsv = (0, 1, 1)  # Order: hue, saturation, value
+hsv = {
+    'hue': 0,
+    'saturation': 1,
+    'value': 1
+}
+
+Note: Dictionary keys may be different but also unique,
+and, the color values order is: hue, saturation, value
+"""
+
+    # Extraction from a `str` object (string)
+    if isinstance(hsv, str):
+        hsv = hsv.replace(' ', '')  # Remove whitespaces
+        hsv = hsv.replace('hsv(', '').replace(')', '')  # Remove non-ints
+        hsv = hsv.split(',')  # Extract HSV values to a list
+        hsv = list(map(float, hsv))  # Convert strings to numbers
+        hsv = tuple(map(round, hsv))  # Round floating-points to ints
+
+        return hsv
+
+    # Extraction from a `set` object (set)
+    if isinstance(hsv, set):
+        return tuple(round(float(value)) for value in hsv)
+
+    # Extraction from a `list` object (list)
+    if isinstance(hsv, list):
+        hsv = list(map(float, hsv))
+        hsv = tuple(map(round, hsv))
+
+        return hsv
+
+    # Extraction from a `tuple` object (tuple)
+    if isinstance(hsv, tuple):
+        hsv = list(map(float, list(hsv)))
+        hsv = tuple(map(round, hsv))
+
+        return hsv
+
+    # Extraction from a `dict` object (dict.values)
+    if isinstance(hsv, dict):
+        return tuple(round(float(value)) for value in hsv.values())
+
+    else:
+        raise TypeError(f'unacceptable type {_type(hsv)} recieved')
+
+
+# A function to extract hue, saturation,
+# luminance values from an HSL color
+def extract_hsl(hsl='hsl(0, 0, 0)'):
+    """Extracts and returns hue, saturation, luminance values from an
+HSL string, set, list, tuple, or a dictionary, as a tuple object.
+
+E.g.:
+hsl = 'hsl(0, 1, 0.5)'
+hsl = {0, 1, 0.5}  # Order: hue, saturation, luminance
+hsl = [0, 1, 0.5]  # Order: hue, saturation, luminance
+hsl = (0, 1, 0.5)  # Order: hue, saturation, luminance
+hsl = {
+    'hue': 0,
+    'saturation': 1,
+    'luminance': 0.5
+}
+
+Note: Dictionary keys may be different but also unique,
+and, the color values order is: hue, saturation, luminance
+"""
+
+    # Extraction from a `str` object (string)
+    if isinstance(hsl, str):
+        hsl = hsl.replace(' ', '')  # Remove whitespaces
+        hsl = hsl.replace('hsl(', '').replace(')', '')  # Remove non-ints
+        hsl = hsl.split(',')  # Extract HSL values to a list
+        hsl = list(map(float, hsl))  # Convert strings to numbers
+        hsl = tuple(map(round, hsl))  # Round floating-points to ints
+
+        return hsl
+
+    # Extraction from a `set` object (set)
+    if isinstance(hsl, set):
+        return tuple(round(float(value)) for value in hsl)
+
+    # Extraction from a `list` object (list)
+    if isinstance(hsl, list):
+        hsl = list(map(float, hsl))
+        hsl = tuple(map(round, hsl))
+
+        return hsl
+
+    # Extraction from a `tuple` object (tuple)
+    if isinstance(hsl, tuple):
+        hsl = list(map(float, list(hsl)))
+        hsl = tuple(map(round, hsl))
+
+        return hsl
+
+    # Extraction from a `dict` object (dict.values)
+    if isinstance(hsl, dict):
+        return tuple(round(float(value)) for value in hsl.values())
+
+    else:
+        raise TypeError(f'unacceptable type {_type(hsl)} recieved')
+
+
+# A function to extract hue, saturation, value values from an RGB color
+def extract_yiq(yiq='yiq(255, 127, 127)'):
+    """Extracts and returns y, i, q values from a YIQ string,
+set, list, tuple, or a dictionary, as a tuple object.
+
+E.g.:
+yiq = 'yiq(255, 127, 127)'
+yiq = {255, 127, 127}  # Order: y, i, q
+yiq = [255, 127, 127]  # Order: y, i, q
+yiq = (255, 127, 127)  # Order: y, i, q
+yiq = {
+    'y': 255,
+    'i': 127,
+    'q': 127
+}
+
+Note: Dictionary keys may be different but also unique,
+and, the color values order is: y, i, q
+"""
+
+    # Extraction from a `str` object (string)
+    if isinstance(yiq, str):
+        yiq = yiq.replace(' ', '')  # Remove whitespaces
+        yiq = yiq.replace('yiq(', '').replace(')', '')  # Remove non-ints
+        yiq = yiq.split(',')  # Extract YIQ values to a list
+        yiq = list(map(float, yiq))  # Convert strings to numbers
+        yiq = tuple(map(round, yiq))  # Round floating-points to ints
+
+        return yiq
+
+    # Extraction from a `set` object (set)
+    if isinstance(yiq, set):
+        return tuple(round(float(value)) for value in yiq)
+
+    # Extraction from a `list` object (list)
+    if isinstance(yiq, list):
+        yiq = list(map(float, yiq))
+        yiq = tuple(map(round, yiq))
+
+        return yiq
+
+    # Extraction from a `tuple` object (tuple)
+    if isinstance(yiq, tuple):
+        yiq = list(map(float, list(yiq)))
+        yiq = tuple(map(round, yiq))
+
+        return yiq
+
+    # Extraction from a `dict` object (dict.values)
+    if isinstance(yiq, dict):
+        return tuple(round(float(value)) for value in yiq.values())
+
+    else:
+        raise TypeError(f'unacceptable type {_type(yiq)} recieved')
+
+
+# A function to extract hue, saturation, value values from an RGB color
+def extract_cmyk(cmyk='cmyk(0, 1, 1, 0)'):
+    """Extracts and returns cyan, magenta, yellow, key values from
+a CMYK string, set, list, tuple, or a dictionary, as a tuple object.
+
+E.g.:
+cmyk = 'cmyk(0, 1, 1, 0)'
+cmyk = {0, 1, 1, 0}  # Order: cyan, magenta, yellow, key
+cmyk = [0, 1, 1, 0]  # Order: cyan, magenta, yellow, key
+cmyk = (0, 1, 1, 0)  # Order: cyan, magenta, yellow, key
+cmyk = {
+    'cyan': 0,
+    'magenta': 1,
+    'yellow': 1,
+    'key': 0
+}
+
+Note: Dictionary keys may be different but also unique,
+and, the color values order is: cyan, magenta, yellow, key
+"""
+
+    # Extraction from a `str` object (string)
+    if isinstance(cmyk, str):
+        cmyk = cmyk.replace(' ', '')  # Remove whitespaces
+        cmyk = cmyk.replace('cmyk(', '').replace(')', '')
+        cmyk = cmyk.split(',')  # Extract CMYK values to a list
+        cmyk = list(map(float, cmyk))  # Convert strings to numbers
+        cmyk = tuple(map(round, cmyk))  # Round floating-points to ints
+
+        return cmyk
+
+    # Extraction from a `set` object (set)
+    if isinstance(cmyk, set):
+        return tuple(round(float(value)) for value in cmyk)
+
+    # Extraction from a `list` object (list)
+    if isinstance(cmyk, list):
+        cmyk = list(map(float, cmyk))
+        cmyk = tuple(map(round, cmyk))
+
+        return cmyk
+
+    # Extraction from a `tuple` object (tuple)
+    if isinstance(cmyk, tuple):
+        cmyk = list(map(float, list(cmyk)))
+        cmyk = tuple(map(round, cmyk))
+
+        return cmyk
+
+    # Extraction from a `dict` object (dict.values)
+    if isinstance(cmyk, dict):
+        return tuple(round(float(value)) for value in cmyk.values())
+
+    else:
+        raise TypeError(f'unacceptable type {_type(cmyk)} recieved')
@@ -0,0 +1,241 @@
+"""Module with color gradients (ramps) and their precomputed tables.
+
+A gradient interpolates between color stops in a chosen color space.
+Hue-based spaces (hsv, hsl, oklch) take the shorter way around the
+hue circle, so a ramp from hue 350 to hue 10 passes through red, not
+through every other hue. N samples are computed in one pass over all
+channels and cached per (stops, space, N), so asking for the same
+4096-step ramp again is only a lookup.
+
+E.g.:
+ramp = Gradient(['#0078d7', 'hsl(50, 1, 0.5)', 'crimson'], 'oklch')
+ramp.hex(5) -> ('#0078d7', ...)
+ramp.styles(4096) -> ('\\x1b[38;2;0;120;215m', ...)
+ramp(0.5) -> '#...'
+
+Separate documentation for each function and class written with them.
+To read the documentation, type `help(<function/class>)` into the CLI
+"""
+
+
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+
+from dyepy.batch import _EXACT, _SPACES, ColorArray, _exact_from_rgb, \
+    _exact_to_rgb, as_rgb, convert_array
+from dyepy.converters import _type
+
+
+# Index of the hue channel of the spaces that have one
+_HUE = {'hsv': 0, 'hsl': 0, 'oklch': 2}
+
+# Index of the channel below which the hue of a color is meaningless
+_CHROMA = {'hsv': 1, 'hsl': 1, 'oklch': 1}
+
+
+# A class to interpolate colors between stops
+class Gradient:
+    """Gradient class
+
+A color gradient through *stops*, interpolated in the space *space*
+('rgb', 'hsv', 'hsl', 'yiq', 'cmyk', 'oklab' (default), 'oklch' or
+'lab'). OKLab and OKLCh give perceptually even ramps.
+
+stops: colors accepted by `as_rgb`, so any dyepy notation works:
+    ['#ff0000', 'hsl(120, 1, 0.5)', 'oklch(0.6, 0.1, 250)', 'navy']
+positions: optional positions of the stops in [0, 1], in ascending
+    order; the stops are evenly spaced by default.
+
+Samples are returned by `rgb`, `packed`, `hex` and `styles`, which
+share one cached table per (stops, space, count). Calling the
+gradient with a position in [0, 1] returns the Hex color there.
+"""
+
+    def __init__(self, stops, space='oklab', positions=None):
+        if space not in _SPACES:
+            raise ValueError(f'unknown color space \'{space}\'')
+
+        stops = tuple(as_rgb(stop) for stop in stops)
+
+        if not stops:
+            raise ValueError('\'stops\' must have at least one color')
+
+        if positions is None:
+            positions = tuple(index / max(1, len(stops) - 1)
+                              for index in range(len(stops)))
+
+        else:
+            positions = tuple(float(position) for position in positions)
+
+            if len(positions) != len(stops):
+                raise ValueError(f'expected {len(stops)} positions, not \
+{len(positions)}')
+
+            if list(positions) != sorted(positions):
+                raise ValueError('\'positions\' must be in ascending order')
+
+        self.stops = stops
+        self.space = space
+        self.positions = positions
+
+    def __repr__(self):
+        return f'Gradient({list(self.stops)!r}, {self.space!r})'
+
+    def __call__(self, position):
+        """Returns the Hex color at *position* (0 ≤ position ≤ 1)
+"""
+
+        data = _sample(self.stops, self.space, self.positions,
+                       (float(position),))
+
+        return '#%02x%02x%02x' % tuple(data)
+
+    def _table(self, count):
+        """Returns the cached packed RGB bytes of *count* samples
+"""
+
+        if type(count) is not int:
+            raise TypeError(f'\'{count}\' must be of type \'int\', not \
+{_type(count)}')
+
+        if count < 1:
+            raise ValueError(f'\'count\' must be ≥ 1, not \'{count}\'')
+
+        return _table(self.stops, self.space, self.positions, count)
+
+    def rgb(self, count=256):
+        """Returns *count* evenly spaced samples as an RGB `ColorArray`
+"""
+
+        return ColorArray.frombuffer(self._table(count))
+
+    def packed(self, count=256):
+        """Returns *count* samples as an array('I') of 0xRRGGBB ints
+"""
+
+        return self.rgb(count).packed()
+
+    def hex(self, count=256):
+        """Returns *count* samples as a tuple of Hex strings, like `rgb`
+"""
+
+        self._table(count)  # Checks *count*
+
+        return _hex_table(self.stops, self.space, self.positions, count)
+
+    def styles(self, count=256, background=False):
+        """Returns *count* samples as a tuple of ANSI escape strings
+
+The strings are the same as `Styles.Fg.rgb` (or `Styles.Bg.rgb`
+with *background*) would return for each sample.
+"""
+
+        self._table(count)  # Checks *count*
+
+        return _styles_table(self.stops, self.space, self.positions, count,
+                             bool(background))
+
+
+# Hidden function `_sample` to interpolate a gradient at some positions
+def _sample(stops, space, positions, samples):
+    """Returns packed RGB bytes of the gradient at each of *samples*
+"""
+
+    rgb = ColorArray('rgb', [value for stop in stops for value in stop])
+
+    # Rounded or clamped values would move the stops
+    if space in _EXACT:
+        points = _exact_from_rgb(rgb, space)
+
+    else:
+        points = convert_array(rgb, space)
+
+    channels = points.channels
+    values = list(points)
+
+    # Hue of achromatic stops is meaningless: borrow a neighbour's
+    if space in _HUE:
+        hue, chroma = _HUE[space], _CHROMA[space]
+        known = [index for index, value in enumerate(values)
+                 if value[chroma] > 1e-6]
+
+        for index, value in enumerate(values):
+            if known and value[chroma] <= 1e-6:
+                nearest = min(known, key=lambda other: abs(other - index))
+                value = list(value)
+                value[hue] = values[nearest][hue]
+                values[index] = tuple(value)
+
+    # Segment of each sample and its local position in that segment
+    last = len(stops) - 1
+    segments = []
+    weights = []
+
+    for position in samples:
+        segment = min(max(bisect_right(positions, position) - 1, 0),
+                      max(last - 1, 0))
+        start = positions[segment]
+        span = positions[min(segment + 1, last)] - start
+        weight = (position - start) / span if span > 0 else 0.0
+
+        segments.append(segment)
+        weights.append(min(max(weight, 0.0), 1.0))
+
+    out = array('d', bytes(8 * channels * len(samples)))
+
+    for channel in range(channels):
+        starts = [value[channel] for value in values]
+        deltas = [values[min(index + 1, last)][channel] - start
+                  for index, start in enumerate(starts)]
+
+        if _HUE.get(space) == channel:
+            # Shorter way around the hue circle
+            deltas = [(delta + 180) % 360 - 180 for delta in deltas]
+            out[channel::channels] = array('d', [
+                (starts[segment] + deltas[segment] * weight) % 360
+                for segment, weight in zip(segments, weights)])
+
+        else:
+            out[channel::channels] = array('d', [
+                starts[segment] + deltas[segment] * weight
+                for segment, weight in zip(segments, weights)])
+
+    if space == 'rgb':
+        return bytes(min(255, max(0, round(value))) for value in out)
+
+    if space in _EXACT:
+        return _exact_to_rgb(ColorArray(space, out)).tobytes()
+
+    return convert_array(ColorArray(space, out), 'rgb').tobytes()
+
+
+# Hidden, cached gradient tables keyed on (stops, space, positions, N)
+@lru_cache(maxsize=64)
+def _table(stops, space, positions, count):
+    """Returns packed RGB bytes of *count* evenly spaced samples
+"""
+
+    return _sample(stops, space, positions,
+                   [index / max(1, count - 1) for index in range(count)])
+
+
+@lru_cache(maxsize=64)
+def _hex_table(stops, space, positions, count):
+    """Returns a tuple of Hex strings of *count* samples
+"""
+
+    return tuple(ColorArray.frombuffer(
+        _table(stops, space, positions, count)).hex())
+
+
+@lru_cache(maxsize=64)
+def _styles_table(stops, space, positions, count, background):
+    """Returns a tuple of ANSI escape strings of *count* samples
+"""
+
+    data = _table(stops, space, positions, count)
+    code = 48 if background else 38
+
+    return tuple(f'\x1b[{code};2;{red};{green};{blue}m' for red, green, blue
+                 in zip(data[0::3], data[1::3], data[2::3]))
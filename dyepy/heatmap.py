@@ -0,0 +1,216 @@
+"""Module to render numeric matrices as heatmaps on a terminal.
+
+Every cell of the matrix becomes a blank with a background color of a
+`Colormap`, using the same `48;2` (24-bit) or `48;5` (256-color)
+escapes `Styles.Bg.rgb` and `Styles.Bg.n` produce. Runs of cells with
+the same color share one escape, matrices larger than the terminal are
+downsampled (by mean or max of each block) to fit it, and the whole
+heatmap is written with a single write.
+
+E.g.:
+heatmap(latencies)  # fits the terminal, auto-scaled colors
+heatmap(correlations, ['navy', 'white', 'crimson'], vmin=-1, vmax=1)
+text = render_heatmap(matrix, truecolor=False, size=(80, 24))
+
+Separate documentation for each function and class written with them.
+To read the documentation, type `help(<function/class>)` into the CLI
+"""
+
+
+import sys
+from itertools import groupby
+from operator import add
+from shutil import get_terminal_size
+
+from dyepy.colormap import Colormap
+from dyepy.dither import XTERM_PALETTE, PaletteIndex
+from dyepy.converters import _type
+from dyepy.styles import Styles
+
+
+# Default colors of heatmaps: dark blue over green to yellow
+HEATMAP_STOPS = ('#440154', '#3b528b', '#21918c', '#5ec962', '#fde725')
+
+# `PaletteIndex` (built on first use) of the 6×6×6 cube and the grays
+# of the 256-color palette; the first 16 colors are left out, as
+# terminals change them with their theme
+_XTERM_INDEX = None
+
+
+# Hidden function `_spans` to split a length into nearly equal blocks
+def _spans(length, blocks):
+    """Returns (start, stop) of *blocks* consecutive blocks of *length*
+"""
+
+    return [(index * length // blocks, (index + 1) * length // blocks)
+            for index in range(blocks)]
+
+
+# Hidden function `_downsample` to shrink a matrix by blocks
+def _downsample(rows, width, columns, lines, reduce):
+    """Returns *rows* shrunk to at most *columns* × *lines* cells
+
+Each cell of the result is the mean (or max) of its block of *rows*.
+"""
+
+    height = len(rows)
+    columns = min(columns, width)
+    lines = min(lines, height)
+
+    if columns == width and lines == height:
+        return rows
+
+    column_spans = _spans(width, columns)
+    grid = []
+
+    for start, stop in _spans(height, lines):
+        if reduce == 'max':
+            cells = None
+
+            for row in rows[start:stop]:
+                block = [max(row[low:high]) for low, high in column_spans]
+                cells = block if cells is None else list(map(max, cells,
+                                                             block))
+
+        else:
+            cells = [0.0] * columns
+
+            for row in rows[start:stop]:
+                cells = list(map(add, cells, [sum(row[low:high])
+                                              for low, high in column_spans]))
+
+            area = stop - start
+            cells = [value / (area * (high - low))
+                     for value, (low, high) in zip(cells, column_spans)]
+
+        grid.append(cells)
+
+    return grid
+
+
+# Hidden function `_escapes` to build the background escape of each color
+def _escapes(colormap, truecolor):
+    """Returns the background escape of every color of *colormap*
+"""
+
+    global _XTERM_INDEX
+
+    if truecolor:
+        return colormap.gradient.styles(colormap.size, True)
+
+    if _XTERM_INDEX is None:
+        _XTERM_INDEX = PaletteIndex(XTERM_PALETTE[16:])
+
+    return [Styles.Bg.n(_XTERM_INDEX.nearest(*color) + 16)
+            for color in colormap.table]
+
+
+# A function to render a matrix as a heatmap
+def render_heatmap(matrix, colormap=None, vmin=None, vmax=None,
+                   truecolor=True, size=None, cell=2, reduce='mean'):
+    """Returns the heatmap of *matrix* as a string of ANSI escapes
+
+matrix: rows of numbers (lists, tuples, array.array...), all of the
+    same length.
+colormap: a `Colormap`, a `Gradient` or stops (default
+    `HEATMAP_STOPS`).
+vmin, vmax: numbers mapped to the first and last colors. They default
+    to the range of the `Colormap` if one is given, else to the range
+    of the (downsampled) values.
+truecolor (bool): 24-bit `48;2` escapes if true, else 256-color
+    `48;5` escapes (the nearest color of the palette).
+size: (columns, lines) to fit the heatmap into, by default the size
+    of the terminal (one line is left for the prompt).
+cell (int): number of columns of each cell (2 looks square).
+reduce: 'mean' or 'max', how cells are merged when downsampling.
+
+NaN cells get the first color.
+"""
+
+    if type(cell) is not int:
+        raise TypeError(f'\'{cell}\' must be of type \'int\', not \
+{_type(cell)}')
+
+    if cell < 1:
+        raise ValueError(f'\'cell\' must be ≥ 1, not \'{cell}\'')
+
+    if reduce not in ('mean', 'max'):
+        raise ValueError(f'\'reduce\' must be \'mean\' or \'max\', not \
+\'{reduce}\'')
+
+    rows = [row if hasattr(row, '__getitem__') else list(row)
+            for row in matrix]
+
+    if not rows:
+        return ''
+
+    width = len(rows[0])
+
+    if any(len(row) != width for row in rows):
+        raise ValueError('all the rows of \'matrix\' must have the same \
+length')
+
+    if not width:
+        return ''
+
+    if size is None:
+        columns, lines = get_terminal_size()
+        lines -= 1
+
+    else:
+        columns, lines = size
+
+    grid = _downsample(rows, width, max(1, columns // cell), max(1, lines),
+                       reduce)
+
+    if isinstance(colormap, Colormap):
+        if vmin is not None or vmax is not None:
+            colormap = Colormap(colormap.gradient, colormap.size,
+                                colormap.vmin if vmin is None else vmin,
+                                colormap.vmax if vmax is None else vmax)
+
+    else:
+        if vmin is None or vmax is None:
+            values = [value for row in grid for value in row
+                      if value == value]
+            low, high = (min(values), max(values)) if values else (0, 1)
+            vmin = low if vmin is None else vmin
+            vmax = high if vmax is None else vmax
+
+        if not vmin < vmax:
+            vmax = vmin + 1  # Constant matrices get the first color
+
+        colormap = Colormap(HEATMAP_STOPS if colormap is None else colormap,
+                            256, vmin, vmax)
+
+    escapes = _escapes(colormap, truecolor)
+    blank = ' ' * cell
+    end = Styles.RESET + '\n'
+    parts = []
+
+    for row in grid:
+        # Neighbouring colors may share an escape (e.g. in 256 colors)
+        for escape, run in groupby(map(escapes.__getitem__,
+                                       colormap.indices(row))):
+            parts.append(escape)
+            parts.append(blank * sum(1 for _ in run))
+
+        parts.append(end)
+
+    return ''.join(parts)
+
+
+# A function to print a matrix as a heatmap
+def heatmap(matrix, colormap=None, vmin=None, vmax=None, truecolor=True,
+            size=None, cell=2, reduce='mean', file=None):
+    """Writes the heatmap of *matrix* to *file* (default: sys.stdout)
+
+The heatmap is rendered completely first and written with a single
+write and flush. For the arguments, refer to `render_heatmap`.
+"""
+
+    file = sys.stdout if file is None else file
+
+    file.write(render_heatmap(matrix, colormap, vmin, vmax, truecolor,
+                              size, cell, reduce))
+    file.flush()
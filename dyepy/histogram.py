@@ -0,0 +1,255 @@
+"""Module with exact color histograms over the full 24-bit RGB space.
+
+Pixels are counted as packed 0xRRGGBB ints, never as (r, g, b)
+tuples. A histogram starts sparse (a `Counter`, filled at C speed)
+and turns into a dense array of 2^24 counters (64 MiB, whatever the
+number of pixels) once it holds more distinct colors than a sparse
+one could store in about that much memory.
+
+The most frequent colors are found by partial selection (a bounded
+heap, `heapq.nlargest`) instead of sorting every distinct color.
+
+E.g.:
+histogram = ColorHistogram()
+for row in rows:
+    histogram.feed(row)  # Bytes of packed RGB pixels
+histogram.top(3) -> [('#ffffff', 81234), ('#000000', 5120), ...]
+
+Separate documentation for each function and class written with them.
+To read the documentation, type `help(<function/class>)` into the CLI
+"""
+
+
+from array import array
+from collections import Counter
+from heapq import nlargest
+from itertools import compress, islice
+
+from dyepy.batch import ColorArray, as_rgb
+from dyepy.converters import _type
+
+
+# Number of colors of the RGB space
+_SIZE = 1 << 24
+
+# Pixels converted to packed ints at once
+_CHUNK = 1 << 20
+
+
+# A class to count the colors of a stream of pixels exactly
+class ColorHistogram:
+    """ColorHistogram class
+
+An exact histogram of the colors of the pixels fed with `feed`.
+
+dense_after (int): number of distinct colors above which the
+    histogram switches from a sparse `Counter` to a dense array of
+    2^24 counters; 0 makes it dense from the start.
+
+E.g.:
+histogram = ColorHistogram().feed(pixels)
+histogram['#ff0000'] -> 1250
+len(histogram) -> 48213  # Distinct colors
+histogram.top(5) -> [('#e8e2d9', 9123), ...]
+"""
+
+    def __init__(self, dense_after=1 << 19):
+        if type(dense_after) is not int:
+            raise TypeError(f'\'{dense_after}\' must be of type \'int\', \
+not {_type(dense_after)}')
+
+        if dense_after < 0:
+            raise ValueError(f'\'dense_after\' must be ≥ 0, not \
+\'{dense_after}\'')
+
+        self.dense_after = dense_after
+        self.total = 0  # Number of pixels
+        self._counts = Counter()
+        self._dense = None
+
+        if not dense_after:
+            self._densify()
+
+    def __len__(self):
+        if self._dense is not None:
+            return _SIZE - self._dense.count(0)
+
+        return len(self._counts)
+
+    def __getitem__(self, color):
+        """Returns the count of *color* (any color accepted by `as_rgb`)
+"""
+
+        red, green, blue = as_rgb(color)
+        value = red << 16 | green << 8 | blue
+
+        if self._dense is not None:
+            return self._dense[value]
+
+        return self._counts[value]
+
+    def __repr__(self):
+        kind = 'dense' if self.dense else 'sparse'
+
+        return f'ColorHistogram({len(self)} colors, {self.total} pixels, \
+{kind})'
+
+    @property
+    def dense(self):
+        """Whether the histogram is a dense array of 2^24 counters
+"""
+
+        return self._dense is not None
+
+    def _densify(self):
+        """Moves the counts into a dense array of 2^24 counters
+"""
+
+        dense = array('I', [0]) * _SIZE
+
+        for value, count in self._counts.items():
+            dense[value] = count
+
+        self._dense = dense
+        self._counts = None
+
+    def _add(self, packed):
+        """Counts the colors of an array('I') of packed colors
+"""
+
+        self.total += len(packed)
+
+        if self._dense is None:
+            self._counts.update(packed)  # Counted in C
+
+            if len(self._counts) > self.dense_after:
+                self._densify()
+
+            return
+
+        # Quicker than counting first: a `Counter` alone costs more
+        dense = self._dense
+
+        for value in packed:
+            dense[value] += 1
+
+    def feed(self, pixels):
+        """Counts *pixels* and returns the histogram
+
+*pixels* may be an RGB `ColorArray`, an array('I') of packed 0xRRGGBB
+colors, a bytes-like object of packed 8-bit RGB pixels (bytes,
+bytearray, memoryview, mmap), or any iterable of colors accepted by
+`as_rgb`
+"""
+
+        if isinstance(pixels, array) and pixels.typecode == 'I':
+            self._add(pixels)
+
+            return self
+
+        if isinstance(pixels, ColorArray):
+            if pixels.space != 'rgb':
+                raise ValueError(f'expected \'rgb\' colors, not \
+\'{pixels.space}\'')
+
+            pixels = pixels.data
+
+        try:
+            view = memoryview(pixels).cast('B')
+
+        except TypeError:
+            iterator = iter(pixels)
+
+            while True:
+                chunk = ColorArray.fromcolors(islice(iterator, _CHUNK))
+
+                if not len(chunk):
+                    return self
+
+                self._add(chunk.packed())
+
+        if len(view) % 3:
+            raise ValueError('buffer length must be a multiple of 3')
+
+        for start in range(0, len(view), _CHUNK * 3):
+            self._add(ColorArray.frombuffer(
+                view[start:start + _CHUNK * 3]).packed())
+
+        return self
+
+    def merge(self, other):
+        """Adds the counts of the histogram *other* and returns this one
+"""
+
+        if not isinstance(other, ColorHistogram):
+            raise TypeError(f'\'other\' must be of type \'ColorHistogram\', \
+not {_type(other)}')
+
+        self.total += other.total
+
+        if self._dense is None and other._dense is None:
+            self._counts.update(other._counts)
+
+            if len(self._counts) > self.dense_after:
+                self._densify()
+
+            return self
+
+        if self._dense is None:
+            self._densify()
+
+        dense = self._dense
+
+        for value, count in other.items():
+            dense[value] += count
+
+        return self
+
+    def items(self):
+        """Yields (packed 0xRRGGBB color, count) of every counted color
+"""
+
+        if self._dense is None:
+            yield from self._counts.items()
+            return
+
+        dense = self._dense
+
+        # `compress` skips the empty counters at C speed
+        for value in compress(range(_SIZE), dense):
+            yield value, dense[value]
+
+    def top(self, k=10):
+        """Returns the *k* most frequent colors as a list of (Hex string,
+count), from the most frequent (ties: the smallest color first)
+"""
+
+        if type(k) is not int:
+            raise TypeError(f'\'{k}\' must be of type \'int\', not \
+{_type(k)}')
+
+        if self._dense is None:
+            # Ties go to the smallest colors (negated in the key)
+            best = nlargest(k, self._counts.items(),
+                            key=lambda item: (item[1], -item[0]))
+
+        else:
+            # Colors come in ascending order and `nlargest` is stable,
+            # so ties already go to the smallest colors
+            dense = self._dense
+            values = nlargest(k, compress(range(_SIZE), dense),
+                              key=dense.__getitem__)
+            best = [(value, dense[value]) for value in values]
+
+        return [('#%06x' % value, count) for value, count in best]
+
+
+# A function to get the most frequent colors of some pixels
+def top_colors(pixels, k=10):
+    """Returns the *k* most frequent colors of *pixels* as a list of
+(Hex string, count), using a `ColorHistogram`
+
+*pixels* may be anything accepted by `ColorHistogram.feed`.
+"""
+
+    return ColorHistogram().feed(pixels).top(k)
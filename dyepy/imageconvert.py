@@ -0,0 +1,226 @@
+"""Module to convert whole images between color spaces, tile by tile.
+
+An RGB image (PNG, PPM or PGM) is split into square tiles, every tile
+is converted with the batch converters in a process pool, and the
+results are reassembled band by band, as they come, into one gray
+image per channel of the target space (e.g. the C, M, Y and K planes
+of CMYK, or the luma map of YIQ). Only a few bands of tiles are in
+flight at once, so memory stays bounded whatever the image size.
+
+From the command line:
+python -m dyepy image-convert photo.png --space cmyk --workers 8
+-> photo.c.pgm, photo.m.pgm, photo.y.pgm, photo.k.pgm
+
+E.g.:
+convert_image('photo.png', 'photo', 'hsv', workers=8)
+
+Separate documentation for each function and class written with them.
+To read the documentation, type `help(<function/class>)` into the CLI
+"""
+
+
+import sys
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from os import cpu_count
+
+from dyepy.batch import _EXACT, ColorArray, _exact_from_rgb, convert_array
+from dyepy.converters import _type
+from dyepy.netpbm import PNMWriter, read_pnm
+from dyepy.png import PNGReader, PNGWriter, _SIGNATURE
+
+
+# Name and range of values of each channel of each space, mapped to
+# 0-maxval in the planes. I and Q of YIQ are signed (up to ±152.7 and
+# ±133.9 in the 0-255 units of `rgb2yiq`), so 0 is the middle gray
+PLANES = {
+    'rgb': (('r', 0, 255), ('g', 0, 255), ('b', 0, 255)),
+    'hsv': (('h', 0, 360), ('s', 0, 1), ('v', 0, 1)),
+    'hsl': (('h', 0, 360), ('s', 0, 1), ('l', 0, 1)),
+    'yiq': (('y', 0, 255), ('i', -153, 153), ('q', -134, 134)),
+    'cmyk': (('c', 0, 1), ('m', 0, 1), ('y', 0, 1), ('k', 0, 1)),
+    'oklab': (('l', 0, 1), ('a', -0.4, 0.4), ('b', -0.4, 0.4)),
+    'oklch': (('l', 0, 1), ('c', 0, 0.4), ('h', 0, 360)),
+    'lab': (('l', 0, 100), ('a', -128, 127), ('b', -128, 127)),
+}
+
+
+# Hidden pool task: converts one tile into its channel planes
+def _convert_tile(data, space, maxval):
+    """Returns the planes (bytes, one per channel) of a tile of packed
+RGB *data* converted to *space*, scaled to 0-*maxval*
+
+16-bit planes are big-endian, as in PGM and PNG files.
+"""
+
+    colors = ColorArray.frombuffer(data)
+
+    # Unclamped I and Q, and hues not rounded to whole degrees
+    if space in _EXACT:
+        colors = _exact_from_rgb(colors, space)
+
+    else:
+        colors = convert_array(colors, space)
+
+    limit = maxval + 0.5
+    planes = []
+
+    for index, (_, low, high) in enumerate(PLANES[space]):
+        scale = maxval / (high - low)
+        offset = 0.5 - low * scale
+        values = [int(x) if 0 < x < limit else 0 if not x > 0 else maxval
+                  for x in [value * scale + offset
+                            for value in colors.channel(index)]]
+
+        if maxval == 255:
+            planes.append(bytes(values))
+            continue
+
+        values = array('H', values)
+
+        if sys.byteorder == 'little':
+            values.byteswap()
+
+        planes.append(values.tobytes())
+
+    return planes
+
+
+# Hidden function `_open` to read the rows of an RGB image
+def _open(path):
+    """Returns (width, height, rows, close) of the image at *path*
+
+*rows* yields the rows as packed 8-bit RGB bytes.
+"""
+
+    with open(path, 'rb') as file:
+        signature = file.read(8)
+
+    if signature == _SIGNATURE:
+        image = PNGReader(path)
+
+        return image.width, image.height, image.rows(), image.close
+
+    image = read_pnm(path)
+
+    # Rows are copied, so no view of the mapped file outlives `close`
+    return image.width, image.height, \
+        (bytes(row) for row in image.rgb_rows()), image.close
+
+
+# A function to convert an image into one gray image per channel
+def convert_image(source, output, space, tile=256, workers=None,
+                  depth=8, image_format='pgm'):
+    """Converts the RGB image *source* to the space *space* and writes
+each channel to '<output>.<channel>.<image_format>', returning their
+paths
+
+source: path of a PNG, PPM or PGM image.
+space: 'rgb', 'hsv', 'hsl', 'yiq', 'cmyk', 'oklab', 'oklch' or 'lab';
+    the range of each channel (see `PLANES`) is scaled to the full
+    range of the planes, e.g. I and Q of YIQ from -153-153 and
+    -134-134, so that a value of 0 is the middle of the range.
+tile (int): side of the tiles, in pixels.
+workers (int): number of processes; 1 converts in this process, None
+    uses every CPU.
+depth (int): 8 or 16 bits per sample of the planes.
+image_format: 'pgm' or 'png'.
+"""
+
+    if space not in PLANES:
+        raise ValueError(f'unknown color space \'{space}\'')
+
+    if type(tile) is not int:
+        raise TypeError(f'\'{tile}\' must be of type \'int\', not \
+{_type(tile)}')
+
+    if tile < 1:
+        raise ValueError(f'\'tile\' must be ≥ 1, not \'{tile}\'')
+
+    if depth not in (8, 16):
+        raise ValueError(f'\'depth\' must be 8 or 16, not \'{depth}\'')
+
+    if image_format not in ('pgm', 'png'):
+        raise ValueError(f'\'image_format\' must be \'pgm\' or \'png\', \
+not \'{image_format}\'')
+
+    workers = workers or cpu_count() or 1
+    maxval = (1 << depth) - 1
+    width, height, rows, close = _open(source)
+    paths = [f'{output}.{name}.{image_format}'
+             for name, _, _ in PLANES[space]]
+    writers = []
+    pool = None
+
+    # Columns of the tiles of every band, and bytes per plane sample
+    columns = [(start, min(start + tile, width))
+               for start in range(0, width, tile)]
+    size = depth // 8
+
+    def submit(data):
+        if pool is None:
+            future = Future()
+            future.set_result(_convert_tile(data, space, maxval))
+
+            return future
+
+        return pool.submit(_convert_tile, data, space, maxval)
+
+    def write(band):
+        count, futures = band
+        tiles = [future.result() for future in futures]
+
+        for plane, writer in enumerate(writers):
+            for y in range(count):
+                writer.write_row(b''.join(
+                    planes[plane][y * (stop - start) * size:
+                                  (y + 1) * (stop - start) * size]
+                    for planes, (start, stop) in zip(tiles, columns)))
+
+    try:
+        for path in paths:
+            if image_format == 'png':
+                writers.append(PNGWriter(path, width, height, 1, depth,
+                                         'up'))
+
+            else:
+                writers.append(PNMWriter(path, width, height, 1, maxval))
+
+        if workers > 1:
+            pool = ProcessPoolExecutor(workers)
+
+        pending = deque()
+        band = []
+
+        for count, row in enumerate(rows, 1):
+            band.append(row)
+
+            if len(band) == tile or count == height:
+                pending.append((len(band), [
+                    submit(b''.join(line[start * 3:stop * 3]
+                                    for line in band))
+                    for start, stop in columns]))
+                band = []
+
+            # Keeps every worker busy, without reading far ahead
+            while len(pending) * len(columns) > workers * 2 \
+                    and len(pending) > 1:
+                write(pending.popleft())
+
+        while pending:
+            write(pending.popleft())
+
+        for writer in writers:
+            writer.close()
+
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+        close()
+
+        for writer in writers:
+            writer.close(check=False)
+
+    return paths
@@ -0,0 +1,194 @@
+"""Module to count and time the calls of the scalar `dyepy` functions.
+
+Instrumentation is opt-in: nothing is wrapped until `enable` is
+called, and `disable` puts the original functions back, so a disabled
+registry costs nothing at all (not even a flag check).
+
+Once enabled, every public function of `dyepy.converters` (the `x2y`
+converters, constructors, `clamp`), `dyepy.extract` and the
+`Styles.Fg`/`Styles.Bg` helpers is replaced by a wrapper that counts
+its calls, errors, total and maximum time. The wrappers also replace
+the copies of these functions held by the other `dyepy` modules (as
+globals or in their dispatch dicts), so calls made from the batch
+converters or the package namespace are counted too; references taken
+by user code (`from dyepy import rgb2hsl`) before `enable` are not.
+
+Times include nested calls: `hex2hsl` counts the time of the
+`hex2rgb` and `rgb2hsl` calls it makes, which are counted on their
+own as well.
+
+E.g.:
+from dyepy import instrument
+instrument.enable()
+...  # Run the code to measure
+instrument.snapshot()
+-> {'hex2rgb': {'calls': 1200, 'total': 0.0031, 'max': 2.1e-05,
+                'errors': 0}, ...}
+instrument.disable()
+
+Separate documentation for each function and class written with them.
+To read the documentation, type `help(<function/class>)` into the CLI
+"""
+
+
+import sys
+from functools import wraps
+from inspect import getattr_static
+from time import perf_counter
+from types import FunctionType
+
+import dyepy.converters as _converters
+import dyepy.extract as _extract
+from dyepy.styles import Styles as _Styles
+
+
+# Name: [calls, total time, maximum time, errors] of every function
+_stats = {}
+
+# Name: (owner, attribute, raw attribute, function, wrapper) of every
+# function wrapped by `enable`
+_wrapped = {}
+
+
+# Hidden function `_targets` to list the functions to instrument
+def _targets():
+    """Yields (name, owner, attribute) of every instrumented function
+"""
+
+    for module in (_converters, _extract):
+        for name, value in vars(module).items():
+            # Aliases (e.g. `hsb`) are rebound with their function
+            if not name.startswith('_') \
+                    and isinstance(value, FunctionType) \
+                    and value.__module__ == module.__name__ \
+                    and value.__name__ == name:
+                yield name, module, name
+
+    for kind, owner in (('Fg', _Styles.Foreground),
+                        ('Bg', _Styles.Background)):
+        for attribute in ('n', 'rgb'):
+            yield f'Styles.{kind}.{attribute}', owner, attribute
+
+
+# Hidden function `_wrap` to make the counting wrapper of a function
+def _wrap(function, stat):
+    """Returns a wrapper of *function* updating its *stat* list
+"""
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+
+        try:
+            return function(*args, **kwargs)
+
+        except Exception:
+            stat[3] += 1
+            raise
+
+        finally:
+            elapsed = perf_counter() - start
+            stat[0] += 1
+            stat[1] += elapsed
+
+            if elapsed > stat[2]:
+                stat[2] = elapsed
+
+    return wrapper
+
+
+# Hidden function `_rebind` to swap functions in every dyepy module
+def _rebind(replacements):
+    """Replaces, in every loaded `dyepy` module, each global (or value
+of a global dispatch dict) found in *replacements* ({id(old): new}) by
+its replacement
+"""
+
+    for name, module in list(sys.modules.items()):
+        if module is None or not (name == 'dyepy'
+                                  or name.startswith('dyepy.')):
+            continue
+
+        for attribute, value in list(vars(module).items()):
+            if isinstance(value, dict):
+                for key, item in list(value.items()):
+                    if id(item) in replacements and \
+                            isinstance(item, FunctionType):
+                        value[key] = replacements[id(item)]
+
+            elif id(value) in replacements and \
+                    isinstance(value, FunctionType):
+                setattr(module, attribute, replacements[id(value)])
+
+
+# A function to start counting and timing the dyepy functions
+def enable():
+    """Wraps every instrumented function (see the module documentation)
+
+Calling it again while enabled does nothing; counts are kept until
+`reset`.
+"""
+
+    if _wrapped:
+        return
+
+    for name, owner, attribute in list(_targets()):
+        raw = getattr_static(owner, attribute)
+        function = raw.__func__ if isinstance(raw, staticmethod) else raw
+        wrapper = _wrap(function, _stats.setdefault(name, [0, 0.0, 0.0, 0]))
+
+        setattr(owner, attribute, staticmethod(wrapper)
+                if isinstance(raw, staticmethod) else wrapper)
+        _wrapped[name] = (owner, attribute, raw, function, wrapper)
+
+    _rebind({id(function): wrapper
+             for _, _, _, function, wrapper in _wrapped.values()})
+
+
+# A function to stop counting and put the original functions back
+def disable():
+    """Restores every wrapped function, so that calls cost nothing more
+than without instrumentation; the counts are kept
+"""
+
+    for owner, attribute, raw, _, _ in _wrapped.values():
+        setattr(owner, attribute, raw)
+
+    _rebind({id(wrapper): function
+             for _, _, _, function, wrapper in _wrapped.values()})
+    _wrapped.clear()
+
+
+# A function to know if the dyepy functions are instrumented
+def is_enabled():
+    """Returns whether `enable` was called (and not `disable` since)
+"""
+
+    return bool(_wrapped)
+
+
+# A function to get the counts and times of the instrumented functions
+def snapshot():
+    """Returns {name: {'calls', 'total', 'max', 'errors'}} of every
+function called at least once, the longest total time first
+
+'total' and 'max' are in seconds. The dict is a copy: it does not
+change with later calls.
+"""
+
+    return {
+        name: {'calls': calls, 'total': total, 'max': maximum,
+               'errors': errors}
+        for name, (calls, total, maximum, errors) in sorted(
+            _stats.items(), key=lambda item: item[1][1], reverse=True)
+        if calls
+    }
+
+
+# A function to reset the counts and times
+def reset():
+    """Sets every count and time back to 0
+"""
+
+    for stat in _stats.values():
+        stat[:] = [0, 0.0, 0.0, 0]
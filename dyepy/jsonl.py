@@ -0,0 +1,247 @@
+"""Module to add converted color fields to a stream of JSON lines.
+
+Every record (one JSON object per line) has a color field, e.g.
+{"id": 1, "rgb": [0, 120, 215]}, which is converted into new fields,
+one per target space:
+{"id": 1, "rgb": [0, 120, 215], "hex": "#0078d7", "hsl": [...]}
+
+The input is read in large chunks and handled in micro-batches of
+lines: a batch is parsed by a single `json.loads` call, its colors
+are packed into one `ColorArray`, each distinct color is converted
+once by the batch converters (and remembered for the next batches),
+and the new fields are appended to the original text of the lines, so
+records are never re-serialized and keep their formatting and key
+order. The output goes through a buffered writer, one write per batch.
+
+From the command line:
+python -m dyepy jsonl --field rgb --to hex hsl < in.jsonl > out.jsonl
+
+E.g.:
+with open('in.jsonl', 'rb') as source, open('out.jsonl', 'wb') as output:
+    convert_jsonl(source, output, 'rgb', ('hex', 'hsl'))
+
+Separate documentation for each function and class written with them.
+To read the documentation, type `help(<function/class>)` into the CLI
+"""
+
+
+import io
+import json
+from itertools import chain
+
+from dyepy.batch import _SPACES, ColorArray, convert_array
+from dyepy.converters import _type
+
+
+# Bytes read from the input at once
+_CHUNK = 1 << 20
+
+# Most colors whose new fields are remembered between batches
+_CACHE = 1 << 16
+
+
+# Hidden function `_colors` to pack the color field of a batch
+def _colors(values):
+    """Returns an RGB ColorArray of the color *values* of a batch
+
+[r, g, b] lists of ints, the usual case, are packed directly;
+anything else (Hex codes, names, functional strings, packed ints, float
+channels) goes through `as_rgb`, so both agree on what is valid.
+"""
+
+    # Hex codes like '#07d' also have 3 items, but no int ones, and
+    # bools are not ints to `as_rgb`
+    try:
+        if set(map(len, values)) == {3} and \
+                set(map(type, chain.from_iterable(values))) == {int}:
+            return ColorArray('rgb', chain.from_iterable(values))
+
+    except (OverflowError, TypeError):
+        pass    # Ints, out-of-range or non-int channels: `as_rgb` tells
+
+    return ColorArray.fromcolors(values)
+
+
+# Hidden function `_fields` to make the new fields of distinct colors
+def _fields(packed, targets, precision):
+    """Returns the JSON text (bytes) of the new fields of each of the
+distinct *packed* colors, with the end of their record, e.g.
+b', "hex": "#0078d7", "hsl": [...]}\\n'
+"""
+
+    colors = ColorArray.frompacked(packed)
+    columns = []
+
+    for name, space in targets:
+        key = json.dumps(name)
+
+        if space == 'hex':
+            template = key.replace('%', '%%') + ': "#%06x"'
+            columns.append(map(template.__mod__, packed))
+            continue
+
+        converted = convert_array(colors, space)
+        data, channels = converted.data, converted.channels
+
+        if space == 'rgb':
+            columns.append([f'{key}: [{data[index]}, {data[index + 1]}, \
+{data[index + 2]}]' for index in range(0, len(data), 3)])
+            continue
+
+        values = [repr(round(value, precision) + 0.0) for value in data]
+        columns.append([f'{key}: [{", ".join(values[index:index + channels])}]'
+                        for index in range(0, len(values), channels)])
+
+    # Encoded at once, then split between the colors
+    rows = '}\n\0, '.join(map(', '.join, zip(*columns)))
+
+    return f', {rows}}}\n'.encode().split(b'\0')
+
+
+# Hidden function `_check_lines` to report the first invalid line
+def _check_lines(lines, first):
+    """Raises a ValueError giving the number of the first of *lines* (the
+first one being the record number *first*) that is not exactly one JSON
+object
+"""
+
+    for number, line in enumerate(lines, first):
+        try:
+            record = json.loads(line)
+
+        except ValueError as error:
+            raise ValueError(f'record {number}: {error}') from None
+
+        if type(record) is not dict:
+            raise ValueError(f'record {number}: not a JSON object')
+
+
+# Hidden function `_batch` to convert a batch of lines
+def _batch(lines, first, field, targets, precision, cache):
+    """Returns the output (bytes) of the *lines* of a batch, the first
+one being the record number *first* of the input
+"""
+
+    try:
+        records = json.loads(b'[' + b','.join(lines) + b']')
+
+    except ValueError:
+        _check_lines(lines, first)  # Finds the faulty line to report it
+
+        raise
+
+    # Lines like '{...}, {...}', or a record split over two lines,
+    # parse too, but not into one object per line
+    if len(records) != len(lines) or set(map(type, records)) != {dict}:
+        _check_lines(lines, first)
+
+    try:
+        colors = _colors([record[field] for record in records])
+
+    except (KeyError, OverflowError, TypeError, ValueError):
+        for number, record in enumerate(records, first):
+            try:
+                _colors([record[field]])
+
+            except KeyError:
+                raise ValueError(f'record {number}: no field \
+\'{field}\'') from None
+
+            except (OverflowError, TypeError, ValueError) as error:
+                raise ValueError(f'record {number}: {error}') from None
+
+        raise
+
+    packed = colors.packed()
+    distinct = dict.fromkeys(packed)
+    new = [color for color in distinct if color not in cache]
+
+    if len(cache) + len(new) > _CACHE:
+        cache.clear()
+        new = list(distinct)
+
+    if new:
+        cache.update(zip(new, _fields(new, targets, precision)))
+
+    # Every record has the color field, so none is empty: the new
+    # fields go after a comma, before the closing brace. Lines have no
+    # '\n' in them, so '}\n' only ends them: splitting on it cuts the
+    # braces of all of them at once
+    output = [b''] * (2 * len(lines))
+    output[0::2] = b'\n'.join(lines)[:-1].split(b'}\n')
+    output[1::2] = map(cache.__getitem__, packed)
+
+    return b''.join(output)
+
+
+# A function to add converted color fields to JSON lines
+def convert_jsonl(source, output, field='rgb', targets=('hex',),
+                  batch_size=8192, precision=4):
+    """Reads JSON lines from *source* and writes them to *output* with
+a new field per target space, converted from the color *field*; returns
+the number of records
+
+source, output: binary files (e.g. `sys.stdin.buffer`, or files opened
+    with 'rb' and 'wb')
+field (str): name of the color field of the records: [r, g, b] lists
+    or anything accepted by `as_rgb` (Hex codes, names, functional
+    strings, packed ints)
+targets (iterable): target spaces ('hex' or any space of
+    `ColorArray`), or (field name, space) pairs, e.g.
+    ('hex', ('color_hsl', 'hsl')); a space alone names its field
+batch_size (int): lines per micro-batch
+precision (int): decimals of the values of the spaces other than hex
+    and rgb (as JSON arrays, e.g. "hsl": [207.0, 1.0, 0.4216])
+
+Records must be JSON objects, one per line; blank lines are skipped.
+A new field named like an existing one is added again (most JSON
+parsers keep the last one). An invalid record raises a ValueError giving
+its number; the batches before it are already written.
+"""
+
+    if not isinstance(batch_size, int):
+        raise TypeError(f'\'batch_size\' must be of type \'int\', not \
+{_type(batch_size)}')
+
+    if batch_size < 1:
+        raise ValueError(f'\'batch_size\' must be ≥ 1, not \'{batch_size}\'')
+
+    targets = [(target, target) if isinstance(target, str) else
+               tuple(target) for target in targets]
+
+    for _, space in targets:
+        if space != 'hex' and space not in _SPACES:
+            raise ValueError(f'unknown color space \'{space}\'')
+
+    if not isinstance(output, io.BufferedIOBase):
+        output = io.BufferedWriter(output, _CHUNK)
+
+    cache = {}
+    lines = []
+    count = 0
+    rest = b''
+
+    while True:
+        chunk = source.read(_CHUNK)
+        parts = (rest + chunk).split(b'\n')
+        # The last part is incomplete, unless the input ended
+        rest = parts.pop() if chunk else b''
+        lines.extend(filter(None, map(bytes.rstrip, parts)))
+
+        # Full batches, and the last one at the end of the input
+        end = len(lines) - len(lines) % batch_size if chunk else len(lines)
+
+        for start in range(0, end, batch_size):
+            batch = lines[start:start + batch_size]
+            output.write(_batch(batch, count + 1, field, targets, precision,
+                                cache))
+            count += len(batch)
+
+        del lines[:end]
+
+        if not chunk:
+            break
+
+    output.flush()
+
+    return count
@@ -0,0 +1,317 @@
+"""Module with k-means palette extraction over large sets of pixels.
+
+k-means finds the *k* colors that best summarise a set of pixels: it
+starts from *k* well spread colors (k-means++) and then repeatedly
+assigns every pixel to its closest center and moves each center to the
+mean of its pixels, until the centers stop moving.
+
+Pixels are first counted into distinct colors with weights, which are
+then split into shards across a `concurrent.futures` process pool.
+Every iteration, each worker returns per-center partial sums of its
+shard, and only these are reduced in the calling process.
+
+E.g.:
+for hexcode, hsl, count in kmeans_palette(pixels, k=5, workers=4):
+    print(hexcode, hsl, count)
+
+Separate documentation for each function and class written with them.
+To read the documentation, type `help(<function/class>)` into the CLI
+"""
+
+
+from array import array
+from bisect import bisect
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+from math import inf
+from os import cpu_count
+from random import Random
+
+from dyepy.batch import ColorArray, as_color_array, rgb2lab_array
+from dyepy.converters import _type, clamp, lab2rgb, rgb, rgb2hsl
+
+
+# Distinct colors of the current process' pool worker (see `_initialize`)
+_POINTS = _WEIGHTS = None
+
+# Points sampled for the k-means++ initialisation
+_SEED_SAMPLE = 20000
+
+
+# Hidden pool initializer to keep the points in every worker process
+def _initialize(points, weights):
+    """Stores *points* and *weights* as the data of this worker
+"""
+
+    global _POINTS, _WEIGHTS
+
+    _POINTS = array('d', points)
+    _WEIGHTS = array('d', weights)
+
+
+# Hidden k-means step: partial sums of one shard of the points
+def _partial_sums(start, stop, centers, points=None, weights=None):
+    """Returns (sums, counts, inertia) of points *start* to *stop*
+
+*sums* holds the weighted x, y, z sums of the points closest to each
+center, *counts* their weights and *inertia* the weighted sum of
+squared distances. *points* and *weights* default to the data of
+this pool worker.
+"""
+
+    if points is None:
+        points, weights = _POINTS, _WEIGHTS
+
+    k = len(centers) // 3
+    columns = list(zip(centers[0::3], centers[1::3], centers[2::3]))
+    sums = [0.0] * (k * 3)
+    counts = [0.0] * k
+    inertia = 0.0
+
+    for x, y, z, weight in zip(points[start * 3:stop * 3:3],
+                               points[start * 3 + 1:stop * 3:3],
+                               points[start * 3 + 2:stop * 3:3],
+                               weights[start:stop]):
+        best = inf
+
+        for index, (cx, cy, cz) in enumerate(columns):
+            distance = (x - cx) ** 2 + (y - cy) ** 2 + (z - cz) ** 2
+
+            if distance < best:
+                best = distance
+                nearest = index
+
+        counts[nearest] += weight
+        nearest *= 3
+        sums[nearest] += x * weight
+        sums[nearest + 1] += y * weight
+        sums[nearest + 2] += z * weight
+        inertia += best * weight
+
+    return sums, counts, inertia
+
+
+# Hidden k-means++ initialisation on a weighted sample of the points
+def _seed_centers(points, weights, k, rng):
+    """Returns *k* initial centers as a flat list, using k-means++
+
+The first center is drawn by weight, every next one with a
+probability proportional to weight × squared distance to the
+closest center chosen so far.
+"""
+
+    count = len(weights)
+
+    if count > _SEED_SAMPLE:
+        chosen = rng.choices(range(count), weights, k=_SEED_SAMPLE)
+        sample = Counter(chosen)
+        indexes = list(sample)
+        weights = [sample[index] for index in indexes]
+
+    else:
+        indexes = range(count)
+
+    sample = [tuple(points[index * 3:index * 3 + 3]) for index in indexes]
+    distances = [inf] * len(sample)
+    centers = []
+    cumulative = list(accumulate(weights))
+
+    for _ in range(k):
+        if cumulative[-1] <= 0:
+            break  # Fewer distinct colors than centers
+
+        cx, cy, cz = sample[bisect(cumulative,
+                                   rng.random() * cumulative[-1])]
+        centers.extend((cx, cy, cz))
+
+        distances = [min(best, (x - cx) ** 2 + (y - cy) ** 2
+                         + (z - cz) ** 2)
+                     for best, (x, y, z) in zip(distances, sample)]
+        cumulative = list(accumulate(
+            weight * distance for weight, distance in zip(weights,
+                                                          distances)))
+
+    return centers
+
+
+# A class to find the k most representative colors of some pixels
+class KMeans:
+    """KMeans class
+
+Clusters pixels into *k* colors with k-means (k-means++ seeding)
+in the 'rgb' or 'lab' (CIELAB, perceptually more even) space.
+
+workers (int): number of processes; 1 runs in this process, None
+    uses every CPU. Every worker receives all the distinct colors
+    once, when the pool starts; then each iteration only sends the
+    bounds of a shard and the centers, and gets partial sums back.
+max_iterations (int): upper bound on the number of iterations.
+tolerance (float): stop as soon as no center moves further than
+    this (in units of the space: 0-255 for rgb, 0-100 for lab).
+seed: seed of the random initialisation, for repeatable palettes.
+
+E.g.:
+model = KMeans(k=6, space='lab', workers=4).fit(pixels)
+model.hex() -> ['#e8e2d9', '#27211d', ...]
+model.hsl() -> [(36, 0.29..., 0.87...), ...]
+"""
+
+    def __init__(self, k=8, space='rgb', workers=1, max_iterations=50,
+                 tolerance=0.1, seed=None):
+        if type(k) is not int:
+            raise TypeError(f'\'{k}\' must be of type \'int\', not \
+{_type(k)}')
+
+        if k < 1:
+            raise ValueError(f'\'k\' must be ≥ 1, not \'{k}\'')
+
+        if space not in ('rgb', 'lab'):
+            raise ValueError(f'\'space\' must be \'rgb\' or \'lab\', \
+not \'{space}\'')
+
+        if workers is not None and (type(workers) is not int
+                                    or workers < 1):
+            raise ValueError(f'\'workers\' must be an int ≥ 1 or None, \
+not \'{workers}\'')
+
+        if type(max_iterations) is not int:
+            raise TypeError(f'\'{max_iterations}\' must be of type \'int\', \
+not {_type(max_iterations)}')
+
+        if max_iterations < 1:
+            raise ValueError(f'\'max_iterations\' must be ≥ 1, not \
+\'{max_iterations}\'')
+
+        if type(tolerance) not in (int, float):
+            raise TypeError(f'\'{tolerance}\' must be of type \'int\' or \
+\'float\', not {_type(tolerance)}')
+
+        if not tolerance >= 0:
+            raise ValueError(f'\'tolerance\' must be ≥ 0, not \
+\'{tolerance}\'')
+
+        self.k = k
+        self.space = space
+        self.workers = workers or cpu_count() or 1
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance
+        self.seed = seed
+
+        self.centers = []  # (x, y, z) of each center, in *space*
+        self.counts = []  # Number of pixels of each center
+        self.inertia = 0.0
+        self.iterations = 0
+
+    def fit(self, pixels):
+        """Clusters *pixels* and returns the model
+
+*pixels* may be anything accepted by `as_color_array`. The
+centers are sorted from the most to the least frequent.
+"""
+
+        packed = Counter(as_color_array(pixels).packed())
+
+        if not packed:
+            raise ValueError('\'pixels\' must not be empty')
+
+        distinct = ColorArray.frompacked(list(packed))
+        weights = array('d', packed.values())
+        points = rgb2lab_array(distinct).data if self.space == 'lab' \
+            else array('d', distinct.data)
+
+        centers = _seed_centers(points, weights, self.k,
+                                Random(self.seed))
+        tolerance = self.tolerance ** 2
+        count = len(weights)
+        workers = min(self.workers, count)
+        step = -(-count // workers)
+        shards = [(start, min(start + step, count))
+                  for start in range(0, count, step)]
+
+        if workers > 1:
+            pool = ProcessPoolExecutor(workers, initializer=_initialize,
+                                       initargs=(points, weights))
+
+        try:
+            for self.iterations in range(1, self.max_iterations + 1):
+                if workers > 1:
+                    partials = list(pool.map(
+                        _partial_sums, *zip(*shards),
+                        [centers] * len(shards)))
+
+                else:
+                    partials = [_partial_sums(0, count, centers, points,
+                                              weights)]
+
+                sums = [sum(values) for values in
+                        zip(*(partial[0] for partial in partials))]
+                counts = [sum(values) for values in
+                          zip(*(partial[1] for partial in partials))]
+                self.inertia = sum(partial[2] for partial in partials)
+
+                moved = 0.0
+                new_centers = list(centers)
+
+                for index, weight in enumerate(counts):
+                    if weight:  # Empty clusters keep their center
+                        for axis in range(index * 3, index * 3 + 3):
+                            new_centers[axis] = sums[axis] / weight
+
+                    moved = max(moved, sum(
+                        (new_centers[axis] - centers[axis]) ** 2
+                        for axis in range(index * 3, index * 3 + 3)))
+
+                centers = new_centers
+
+                if moved <= tolerance:
+                    break
+
+        finally:
+            if workers > 1:
+                pool.shutdown()
+
+        order = sorted(range(len(counts)), key=counts.__getitem__,
+                       reverse=True)
+        self.centers = [tuple(centers[index * 3:index * 3 + 3])
+                        for index in order]
+        self.counts = [round(counts[index]) for index in order]
+
+        return self
+
+    def rgb(self):
+        """Returns the centers as a list of (red, green, blue) tuples
+"""
+
+        if self.space == 'lab':
+            return [lab2rgb(*center) for center in self.centers]
+
+        return [tuple(round(clamp(0, value, 255)) for value in center)
+                for center in self.centers]
+
+    def hex(self):
+        """Returns the centers as a list of Hex strings, using `rgb`
+"""
+
+        return [rgb(*color) for color in self.rgb()]
+
+    def hsl(self):
+        """Returns the centers as a list of HSL tuples, using `rgb2hsl`
+"""
+
+        return [rgb2hsl(*color) for color in self.rgb()]
+
+
+# A function to extract a palette of some pixels with k-means
+def kmeans_palette(pixels, k=8, space='rgb', workers=1, max_iterations=50,
+                   tolerance=0.1, seed=None):
+    """Returns a list of (Hex string, HSL tuple, count) of *pixels*
+
+The *k* colors are sorted from the most to the least frequent.
+For the other arguments, refer to `KMeans`.
+"""
+
+    model = KMeans(k, space, workers, max_iterations, tolerance,
+                   seed).fit(pixels)
+
+    return list(zip(model.hex(), model.hsl(), model.counts))
@@ -0,0 +1,465 @@
+"""Module to read and write PPM and PGM (Netpbm) images.
+
+Binary images (P6 for PPM, P5 for PGM) are memory-mapped: their pixels
+are exposed as a memoryview over the file itself, so opening even a
+huge image costs no memory and no copy, and rows are read only when
+they are used. ASCII images (P3, P2) are parsed into the same layout.
+Both 8-bit and 16-bit (big-endian, as in the files) samples are
+supported.
+
+Writing streams one row at a time, so images can be produced (e.g.
+converted or dithered) row by row without ever being held in memory.
+
+E.g.:
+with read_pnm('photo.ppm') as image:
+    colors = image.colors()  # RGB ColorArray, 8-bit
+    for row in image.rows():  # memoryviews of raw samples
+        ...
+
+with PNMWriter('out.ppm', width, height) as writer:
+    for row in rows:
+        writer.write_row(row)
+
+Separate documentation for each function and class written with them.
+To read the documentation, type `help(<function/class>)` into the CLI
+"""
+
+
+import mmap
+import re
+import sys
+from array import array
+
+from dyepy.batch import ColorArray
+from dyepy.converters import _type
+
+
+# Channels and encoding of the supported magic numbers
+_FORMATS = {
+    b'P2': (1, False),
+    b'P3': (3, False),
+    b'P5': (1, True),
+    b'P6': (3, True),
+}
+
+# Whitespace of Netpbm headers
+_WHITESPACE = b' \t\n\v\f\r'
+
+# Samples per line of ASCII images (lines must stay under 70 chars)
+_PER_LINE = 10
+
+_COMMENT = re.compile(rb'#[^\r\n]*')
+
+
+# Hidden function `_header` to parse the header of a PNM image
+def _header(buffer):
+    """Returns (magic, width, height, maxval, offset of the raster)
+"""
+
+    magic = bytes(buffer[:2])
+
+    if magic not in _FORMATS:
+        raise ValueError(f'not a PPM or PGM image (magic number \
+{magic!r})')
+
+    values = []
+    position = 2
+    size = len(buffer)
+
+    while len(values) < 3:
+        # Whitespace and comments between the fields
+        while position < size:
+            char = buffer[position:position + 1]
+
+            if char == b'#':
+                while position < size and \
+                        buffer[position:position + 1] not in b'\r\n':
+                    position += 1
+
+            elif char in _WHITESPACE:
+                position += 1
+
+            else:
+                break
+
+        start = position
+
+        while position < size and buffer[position:position + 1].isdigit():
+            position += 1
+
+        if start == position:
+            raise ValueError('invalid or truncated PPM/PGM header')
+
+        values.append(int(buffer[start:position]))
+
+    # A single whitespace character separates the header from the raster
+    position += 1
+    width, height, maxval = values
+
+    if width < 1 or height < 1:
+        raise ValueError(f'\'width\' and \'height\' must be ≥ 1, not \
+\'{width}\' and \'{height}\'')
+
+    if not 0 < maxval < 65536:
+        raise ValueError(f'\'maxval\' must be ≥ 1 and ≤ 65535, not \
+\'{maxval}\'')
+
+    return magic, width, height, maxval, position
+
+
+# A class holding an image read by `read_pnm`
+class PNMImage:
+    """PNMImage class
+
+A PPM or PGM image, as returned by `read_pnm`.
+
+width, height (int): size of the image in pixels.
+channels (int): 3 for PPM (RGB), 1 for PGM (gray).
+maxval (int): the largest sample value; above 255, samples take two
+    bytes (big-endian).
+data: memoryview of the raw samples, row after row. For binary
+    images, it is a view of the memory-mapped file (no copy).
+
+Views returned by `data`, `row` and `rows` must be released (or
+dropped) before the image is closed.
+"""
+
+    def __init__(self, magic, width, height, maxval, data, mapping=None):
+        self.magic = magic
+        self.width = width
+        self.height = height
+        self.maxval = maxval
+        self.channels = _FORMATS[magic][0]
+        self.sample_size = 1 if maxval < 256 else 2
+        self.data = data
+        self._mapping = mapping
+
+    def __repr__(self):
+        return f'PNMImage({self.magic.decode()}, {self.width}×\
+{self.height}, maxval={self.maxval})'
+
+    def __len__(self):
+        return self.height
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def stride(self):
+        """Number of bytes of each row
+"""
+
+        return self.width * self.channels * self.sample_size
+
+    def row(self, y):
+        """Returns a memoryview of the raw samples of row *y*
+"""
+
+        if not 0 <= y < self.height:
+            raise IndexError(f'row {y} out of range for an image of \
+{self.height} rows')
+
+        stride = self.stride
+
+        return self.data[y * stride:(y + 1) * stride]
+
+    def rows(self):
+        """Yields a memoryview of the raw samples of each row
+"""
+
+        stride = self.stride
+
+        for start in range(0, self.height * stride, stride):
+            yield self.data[start:start + stride]
+
+    def samples(self):
+        """Returns all the samples as an array('B') or array('H') of
+native integers (a copy)
+"""
+
+        return self._samples(self.data)
+
+    def _samples(self, data):
+        """Returns raw samples *data* as an array of native integers
+"""
+
+        samples = array('B' if self.sample_size == 1 else 'H')
+        samples.frombytes(data)
+
+        if self.sample_size == 2 and sys.byteorder == 'little':
+            samples.byteswap()
+
+        return samples
+
+    def _rgb(self, data):
+        """Returns raw samples *data* as packed 8-bit RGB (bytes-like)
+"""
+
+        maxval = self.maxval
+
+        if self.sample_size == 1:
+            if maxval != 255:
+                data = bytes(data).translate(bytes(
+                    min(255, (value * 255 + maxval // 2) // maxval)
+                    for value in range(256)))
+
+        else:
+            data = bytes([
+                255 if value >= maxval
+                else (value * 255 + maxval // 2) // maxval
+                for value in self._samples(data)])
+
+        if self.channels == 1:
+            gray = data
+            data = bytearray(len(gray) * 3)
+            data[0::3] = data[1::3] = data[2::3] = gray
+
+        return data
+
+    def rgb_rows(self):
+        """Yields each row as packed 8-bit RGB, see `colors`
+"""
+
+        for row in self.rows():
+            yield self._rgb(row)
+
+    def colors(self):
+        """Returns the pixels as an RGB `ColorArray` of 8-bit values
+
+Gray pixels are expanded to RGB, and samples are scaled from
+0-maxval to 0-255.
+"""
+
+        return ColorArray.frombuffer(self._rgb(self.data))
+
+    def close(self):
+        """Unmaps the file of a binary image
+"""
+
+        if isinstance(self.data, memoryview):
+            self.data.release()
+
+        if self._mapping is not None:
+            self._mapping.close()
+            self._mapping = None
+
+
+# A function to read a PPM or PGM image
+def read_pnm(path):
+    """Returns the PPM/PGM image at *path* as a `PNMImage`
+
+Binary images (P5, P6) are memory-mapped and their pixels are not
+copied; ASCII images (P2, P3) are parsed into memory.
+"""
+
+    with open(path, 'rb') as file:
+        if file.read(2) in (b'P5', b'P6'):
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        else:
+            file.seek(0)
+            mapping = None
+            content = file.read()
+
+    if mapping is not None:
+        try:
+            magic, width, height, maxval, offset = _header(mapping)
+            size = width * height * _FORMATS[magic][0] \
+                * (1 if maxval < 256 else 2)
+
+            if len(mapping) - offset < size:
+                raise ValueError(f'truncated image: expected {size} bytes \
+of pixels, found {len(mapping) - offset}')
+
+        except ValueError:
+            mapping.close()
+            raise
+
+        data = memoryview(mapping)[offset:offset + size]
+
+        return PNMImage(magic, width, height, maxval, data, mapping)
+
+    magic, width, height, maxval, offset = _header(content)
+    sample_size = 1 if maxval < 256 else 2
+    size = width * height * _FORMATS[magic][0]
+
+    raster = content[offset:]
+
+    if b'#' in raster:
+        raster = _COMMENT.sub(b' ', raster)
+
+    values = raster.split()
+
+    if len(values) < size:
+        raise ValueError(f'truncated image: expected {size} samples, \
+found {len(values)}')
+
+    samples = array('B' if sample_size == 1 else 'H',
+                    map(int, values[:size]))
+
+    if sample_size == 2 and sys.byteorder == 'little':
+        samples.byteswap()
+
+    return PNMImage(magic, width, height, maxval,
+                    memoryview(samples.tobytes()))
+
+
+# A class to write a PPM or PGM image row by row
+class PNMWriter:
+    """PNMWriter class
+
+Writes a PPM (*channels* = 3) or PGM (*channels* = 1) image of
+*width* × *height* pixels to *file* (a path or a binary file), one
+row at a time; binary (P6/P5) by default, ASCII (P3/P2) otherwise.
+
+Rows may be bytes-like objects of raw samples (big-endian for 16-bit
+images, i.e. rows of another `PNMImage`), an RGB `ColorArray`, or
+sequences of integers (lists, array('H')...).
+
+E.g.:
+with PNMWriter('gray.pgm', 256, 1, channels=1) as writer:
+    writer.write_row(range(256))
+"""
+
+    def __init__(self, file, width, height, channels=3, maxval=255,
+                 binary=True):
+        for value in (width, height, maxval):
+            if type(value) is not int:
+                raise TypeError(f'\'{value}\' must be of type \'int\', \
+not {_type(value)}')
+
+        if width < 1 or height < 1:
+            raise ValueError(f'\'width\' and \'height\' must be ≥ 1, not \
+\'{width}\' and \'{height}\'')
+
+        if channels not in (1, 3):
+            raise ValueError(f'\'channels\' must be 1 or 3, not \
+\'{channels}\'')
+
+        if not 0 < maxval < 65536:
+            raise ValueError(f'\'maxval\' must be ≥ 1 and ≤ 65535, not \
+\'{maxval}\'')
+
+        self.width = width
+        self.height = height
+        self.channels = channels
+        self.maxval = maxval
+        self.binary = binary
+        self.sample_size = 1 if maxval < 256 else 2
+        self.rows_written = 0
+
+        if isinstance(file, (str, bytes)) or hasattr(file, '__fspath__'):
+            self._file = open(file, 'wb')
+            self._owned = True
+
+        else:
+            self._file = file
+            self._owned = False
+
+        magic = {(3, True): 'P6', (1, True): 'P5',
+                 (3, False): 'P3', (1, False): 'P2'}[channels, binary]
+
+        self._file.write(f'{magic}\n{width} {height}\n{maxval}\n'.encode())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, kind, *args):
+        # Do not hide the exception that interrupted the writing
+        self.close(check=kind is None)
+
+    def _raw(self, row):
+        """Returns *row* as bytes-like raw samples (big-endian)
+"""
+
+        if isinstance(row, ColorArray):
+            row = row.data
+
+        if isinstance(row, (bytes, bytearray, memoryview)):
+            return row
+
+        if self.sample_size == 1:
+            return bytes(row)
+
+        samples = array('H', row)
+
+        if sys.byteorder == 'little':
+            samples.byteswap()
+
+        return samples.tobytes()
+
+    def write_row(self, row):
+        """Writes the next row of the image
+"""
+
+        if self.rows_written >= self.height:
+            raise ValueError(f'the image already has all its {self.height} \
+rows')
+
+        raw = self._raw(row)
+        stride = self.width * self.channels * self.sample_size
+
+        if len(raw) != stride:
+            raise ValueError(f'rows must have {stride} bytes \
+({self.width} pixels), not {len(raw)}')
+
+        if self.binary:
+            self._file.write(raw)
+
+        else:
+            samples = array('B' if self.sample_size == 1 else 'H')
+            samples.frombytes(raw)
+
+            if self.sample_size == 2 and sys.byteorder == 'little':
+                samples.byteswap()
+
+            self._file.write(''.join(
+                ' '.join(map(str, samples[start:start + _PER_LINE])) + '\n'
+                for start in range(0, len(samples), _PER_LINE)).encode())
+
+        self.rows_written += 1
+
+    def write_rows(self, rows):
+        """Writes every row of the iterable *rows*
+"""
+
+        for row in rows:
+            self.write_row(row)
+
+    def close(self, check=True):
+        """Flushes and closes the file (if opened from a path)
+
+Raises ValueError if *check* and fewer than *height* rows were
+written.
+"""
+
+        if self._file is None:
+            return
+
+        if self._owned:
+            self._file.close()
+
+        else:
+            self._file.flush()
+
+        self._file = None
+
+        if check and self.rows_written != self.height:
+            raise ValueError(f'expected {self.height} rows, only \
+{self.rows_written} written')
+
+
+# A function to write a PPM or PGM image in one call
+def write_pnm(file, rows, width, height, channels=3, maxval=255,
+              binary=True):
+    """Writes *rows* as a PPM/PGM image to *file*, streaming them
+
+For the arguments, refer to `PNMWriter`.
+"""
+
+    with PNMWriter(file, width, height, channels, maxval,
+                   binary) as writer:
+        writer.write_rows(rows)
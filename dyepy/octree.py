@@ -0,0 +1,292 @@
+"""Module with a streaming octree color quantizer.
+
+Color quantization reduces the colors of an image (or any stream of
+pixels) to a small palette, e.g. 16 colors for `Styles.Fg.n` output
+or 256 colors for GIF/PNG-8 files. The octree quantizer here takes
+pixels incrementally, so memory depends on the number of octree
+leaves (at most *max_leaves*), never on the number of pixels.
+
+E.g.:
+quantizer = OctreeQuantizer(colors=16)
+for row in rows:
+    quantizer.feed(row)  # Bytes of packed RGB pixels
+quantizer.palette() -> ['#f2efe8', '#1d1b19', ...]
+
+Separate documentation for each function and class written with them.
+To read the documentation, type `help(<function/class>)` into the CLI
+"""
+
+
+from collections import Counter
+from itertools import islice
+
+from dyepy.batch import ColorArray
+from dyepy.converters import _type, rgb
+
+
+# Pixels counted at once before being added to the octree
+_CHUNK = 1 << 16
+
+# Masks of the top *depth* bits of each channel of a packed code
+_MASKS = tuple((0xff >> 8 - depth) * 0x010101 for depth in range(9))
+
+
+# A class to build a palette of a stream of pixels with an octree
+class OctreeQuantizer:
+    """OctreeQuantizer class
+
+Builds a palette of at most *colors* colors from pixels fed with
+`feed`, using an octree: a tree where every level splits the RGB cube
+in 8 by the next bit of red, green and blue. Each leaf sums the
+pixels that fall into it; when there are more than *max_leaves*
+leaves, the deepest leaves with the fewest pixels are merged into
+their parents. `palette` then reduces a copy of the tree to *colors*
+leaves, whose average colors make up the palette.
+
+Pixels are counted in chunks first, so the tree is only updated once
+per distinct color of each chunk.
+
+E.g.:
+quantizer = OctreeQuantizer(colors=256)
+quantizer.feed(pixels)  # A ColorArray, packed RGB bytes or colors
+quantizer.feed(more_pixels)
+palette = quantizer.palette()
+"""
+
+    def __init__(self, colors=256, max_leaves=4096):
+        for value in (colors, max_leaves):
+            if type(value) is not int:
+                raise TypeError(f'\'{value}\' must be of type \'int\', \
+not {_type(value)}')
+
+        if colors < 1:
+            raise ValueError(f'\'colors\' must be ≥ 1, not \'{colors}\'')
+
+        if max_leaves < colors:
+            raise ValueError(f'\'max_leaves\' must be ≥ \'colors\' \
+({colors}), not \'{max_leaves}\'')
+
+        self.colors = colors
+        self.max_leaves = max_leaves
+        self._pixels = 0  # Number of pixels in the octree
+
+        # Leaves by depth (0 to 8): {code: [count, red, green, blue]}
+        # where a code holds the top *depth* bits of each channel,
+        # packed like 0xRRGGBB
+        self._leaves = [{} for _ in range(9)]
+        self._depth = 8  # Depth of new leaves
+        self._count = 0  # Number of leaves
+        self._pending = bytearray()  # Pixels not yet in the octree
+
+    def __len__(self):
+        self._flush()
+
+        return self._count
+
+    @property
+    def pixels(self):
+        """Number of pixels fed to the quantizer so far
+"""
+
+        return self._pixels + len(self._pending) // 3
+
+    def feed(self, pixels):
+        """Adds *pixels* to the octree and returns the quantizer
+
+*pixels* may be an RGB `ColorArray`, a bytes-like object of packed
+8-bit RGB pixels (bytes, bytearray, memoryview, mmap), or any
+iterable (e.g. a generator) of colors accepted by `as_rgb`
+"""
+
+        if isinstance(pixels, ColorArray):
+            if pixels.space != 'rgb':
+                raise ValueError(f'expected \'rgb\' colors, not \
+\'{pixels.space}\'')
+
+            pixels = pixels.data
+
+        try:
+            view = memoryview(pixels).cast('B')
+
+        except TypeError:
+            iterator = iter(pixels)
+
+            while True:
+                chunk = ColorArray.fromcolors(islice(iterator, _CHUNK))
+
+                if not len(chunk):
+                    break
+
+                self._pending += chunk.data
+
+                if len(self._pending) >= _CHUNK * 3:
+                    self._flush()
+
+            return self
+
+        if len(view) % 3:
+            raise ValueError('buffer length must be a multiple of 3')
+
+        # Small feeds (e.g. rows) are gathered up to a whole chunk, so
+        # that colors repeated across them are only counted once
+        if len(self._pending) + len(view) < _CHUNK * 3:
+            self._pending += view
+
+            return self
+
+        self._flush()
+
+        for start in range(0, len(view), _CHUNK * 3):
+            chunk = view[start:start + _CHUNK * 3]
+
+            if len(chunk) < _CHUNK * 3:
+                self._pending += chunk
+
+            else:
+                self._add(Counter(ColorArray.frombuffer(chunk).packed()))
+
+        return self
+
+    def _flush(self):
+        """Adds the pixels gathered by `feed` to the octree
+"""
+
+        if self._pending:
+            self._add(Counter(ColorArray.frombuffer(self._pending).packed()))
+            self._pending = bytearray()
+
+    def _add(self, counts):
+        """Adds the pixel *counts* ({0xRRGGBB: count}) to the octree
+"""
+
+        leaves = self._leaves
+        top = self._depth
+
+        for value, count in counts.items():
+            # A color belongs to the one leaf on its path, which is
+            # usually at the deepest level, so look there first
+            for depth in range(top, -1, -1):
+                leaf = leaves[depth].get(value >> 8 - depth & _MASKS[depth])
+
+                if leaf is not None:
+                    break
+
+            else:
+                leaf = leaves[top][value >> 8 - top & _MASKS[top]] = \
+                    [0, 0, 0, 0]
+                self._count += 1
+
+            leaf[0] += count
+            leaf[1] += (value >> 16) * count
+            leaf[2] += (value >> 8 & 255) * count
+            leaf[3] += (value & 255) * count
+
+        self._pixels += sum(counts.values())
+
+        if self._count > self.max_leaves:
+            # Reduce a quarter below the limit, to reduce less often
+            self._reduce(self.max_leaves - self.max_leaves // 4)
+
+    def _reduce(self, target):
+        """Merges the smallest deepest leaves until at most *target*
+"""
+
+        self._depth, self._count = _reduce(self._leaves, self._depth,
+                                           self._count, target)
+
+    def palette(self, colors=None):
+        """Returns the palette as a list of Hex strings, like `rgb`
+
+The colors are sorted from the most to the least frequent.
+*colors* defaults to the *colors* given to the quantizer, and
+the quantizer is not changed, so more pixels can be fed later.
+"""
+
+        return [hexcode for hexcode, _ in self.histogram(colors)]
+
+    def histogram(self, colors=None):
+        """Returns the palette as a list of (Hex string, count) tuples
+
+The colors are sorted from the most to the least frequent.
+"""
+
+        colors = self.colors if colors is None else colors
+
+        if type(colors) is not int:
+            raise TypeError(f'\'{colors}\' must be of type \'int\', not \
+{_type(colors)}')
+
+        if colors < 1:
+            raise ValueError(f'\'colors\' must be ≥ 1, not \'{colors}\'')
+
+        self._flush()
+        leaves = [{code: list(leaf) for code, leaf in level.items()}
+                  for level in self._leaves]
+        _reduce(leaves, self._depth, self._count, colors)
+
+        palette = []
+
+        for level in leaves:
+            for count, red, green, blue in level.values():
+                palette.append((rgb(red / count, green / count,
+                                    blue / count), count))
+
+        palette.sort(key=lambda item: item[1], reverse=True)
+
+        return palette
+
+
+# Hidden function `_reduce` to merge octree leaves into their parents
+def _reduce(leaves, depth, count, target):
+    """Reduces *leaves* to at most *target*, returns (depth, count)
+
+*leaves* are merged from the deepest level up; on each level the
+parents with the fewest pixels are merged first.
+"""
+
+    while count > target and depth:
+        level = leaves[depth]
+        parents = {}
+
+        for code, leaf in level.items():
+            parents.setdefault(code >> 1 & 0x7f7f7f, []).append(code)
+
+        # Parents whose children hold the fewest pixels go first
+        order = sorted(parents.items(), key=lambda item: sum(
+            level[code][0] for code in item[1]))
+
+        above = leaves[depth - 1]
+
+        for parent, codes in order:
+            if count <= target:
+                break
+
+            merged = above.get(parent)
+
+            if merged is None:
+                merged = above[parent] = [0, 0, 0, 0]
+                count += 1
+
+            for code in codes:
+                leaf = level.pop(code)
+
+                for index in range(4):
+                    merged[index] += leaf[index]
+
+            count -= len(codes)
+
+        if not level:
+            depth -= 1
+
+    return depth, count
+
+
+# A function to build the palette of some pixels in one call
+def quantize(pixels, colors=256, max_leaves=4096):
+    """Returns a palette of at most *colors* Hex strings of *pixels*
+
+*pixels* may be anything accepted by `OctreeQuantizer.feed`.
+Same as: OctreeQuantizer(colors, max_leaves).feed(pixels).palette()
+"""
+
+    return OctreeQuantizer(colors, max_leaves).feed(pixels).palette()
@@ -0,0 +1,184 @@
+"""Module with `convert_many`, a batch conversion over processes.
+
+`convert_many` converts any number of colors between two spaces with
+the batch converters, spread over a process pool that is created once
+and reused by the next calls. How the work is split depends on its
+size and cost: a first sample of the colors is converted in this
+process and timed, and
+
+    if the whole conversion would take less than a few tens of
+    milliseconds (or only one worker is asked for), the rest is
+    converted here too: starting tasks, pickling and copying the
+    colors would cost more than they save;
+    else the rest is cut into 4 chunks per worker (so that workers
+    finishing early pick up more), or fewer, larger ones if these
+    would be under ~20 ms of work each (so the overhead of a task
+    stays small).
+
+Chunks travel as the raw bytes of `ColorArray`s, not as lists of
+tuples, and the results are put back in the order of the input.
+
+E.g.:
+convert_many(hsl_colors, 'hsl', 'hex', workers=8)
+-> ['#0078d7', '#ff0000', ...]
+convert_many(open('image.rgb', 'rb').read(), 'rgb', 'oklab')
+-> ColorArray('oklab', <1048576 colors>)
+
+Separate documentation for each function and class written with them.
+To read the documentation, type `help(<function/class>)` into the CLI
+"""
+
+
+import atexit
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+from time import perf_counter
+
+from dyepy.batch import _SPACES, ColorArray, as_color_array, convert_array
+from dyepy.converters import _type
+
+
+# Colors converted (and timed) in this process before choosing
+_SAMPLE = 512
+
+# Estimated time (s) below which everything is converted in process
+_SERIAL_TIME = 0.05
+
+# Least time (s) of work per pool task
+_TASK_TIME = 0.02
+
+# Tasks per worker, to balance uneven chunks (fewer for little work)
+_TASKS_PER_WORKER = 4
+
+# The reusable pool, and its number of workers
+_pool = None
+_pool_workers = 0
+
+
+# Hidden function `_get_pool` to get the reusable process pool
+def _get_pool(workers):
+    """Returns the process pool of *workers* processes, (re)created
+only when there is none of that size
+"""
+
+    global _pool, _pool_workers
+
+    if _pool is None or _pool_workers != workers:
+        _shutdown()
+        _pool = ProcessPoolExecutor(workers)
+        _pool_workers = workers
+
+    return _pool
+
+
+# Hidden function `_shutdown` to stop the reusable process pool
+@atexit.register
+def _shutdown():
+    """Shuts the process pool down, if there is one
+"""
+
+    global _pool, _pool_workers
+
+    if _pool is not None:
+        _pool.shutdown()
+        _pool, _pool_workers = None, 0
+
+
+# Hidden function `_chunk_size` to split the work of the pool
+def _chunk_size(count, cost, workers):
+    """Returns the number of colors per chunk of *count* colors costing
+*cost* seconds each: `_TASKS_PER_WORKER` chunks per worker, unless
+that makes chunks of less than `_TASK_TIME`
+"""
+
+    return max(int(_TASK_TIME / cost) if cost else count,
+               -(-count // (workers * _TASKS_PER_WORKER)), 1)
+
+
+# Hidden pool task: converts one chunk of colors
+def _convert_chunk(data, source, target):
+    """Returns the raw bytes of the *source* colors of raw bytes *data*
+converted to *target*
+"""
+
+    return convert_array(ColorArray.frombuffer(data, source),
+                         target).tobytes()
+
+
+# A function to convert many colors, in a process pool if worth it
+def convert_many(values, src, dst, workers=None):
+    """Returns *values* (colors of the space *src*) converted to the
+space *dst*, in the order of *values*
+
+values: a list (or any iterable) of colors: Hex strings or anything
+    accepted by `as_rgb` for 'hex' and 'rgb', tuples of channel values
+    for the other spaces; or packed colors: a `ColorArray`, a
+    bytes-like object of raw machine values (e.g. 8-bit RGB pixels)
+    or an `array.array` of channel values.
+src, dst: 'hex' or any space of `ColorArray` ('rgb', 'hsv', 'hsl',
+    'yiq', 'cmyk', 'oklab', 'oklch', 'lab').
+workers (int): most processes to use; None uses every CPU, 1 never
+    starts any. The pool is kept for the next calls (with the same
+    number of workers).
+
+Returns a list (of Hex strings for 'hex', else tuples) for a list
+input, and a `ColorArray` for packed input (a list of Hex strings for
+'hex'). Small inputs are always converted in this process.
+"""
+
+    for name, space in (('src', src), ('dst', dst)):
+        if space != 'hex' and space not in _SPACES:
+            raise ValueError(f'\'{name}\' must be \'hex\' or a color \
+space, not \'{space}\'')
+
+    if workers is None:
+        workers = cpu_count() or 1
+
+    if type(workers) is not int:
+        raise TypeError(f'\'{workers}\' must be of type \'int\', not \
+{_type(workers)}')
+
+    if workers < 1:
+        raise ValueError(f'\'workers\' must be ≥ 1, not \'{workers}\'')
+
+    source = 'rgb' if src == 'hex' else src
+    target = 'rgb' if dst == 'hex' else dst
+    packed = isinstance(values, (ColorArray, bytes, bytearray, memoryview,
+                                 array))
+
+    if isinstance(values, array):
+        colors = ColorArray(source, values)
+
+    else:
+        colors = as_color_array(values, source)
+
+    count = len(colors)
+
+    # The sample tells the cost of a color (distinct colors included)
+    start = perf_counter()
+    head = convert_array(colors[:_SAMPLE], target)
+    cost = (perf_counter() - start) / max(min(count, _SAMPLE), 1)
+    rest = colors[_SAMPLE:]
+
+    if workers == 1 or cost * len(rest) < _SERIAL_TIME:
+        tail = convert_array(rest, target)
+
+    else:
+        size = _chunk_size(len(rest), cost, workers)
+        starts = range(0, len(rest), size)
+        tail = ColorArray(target)
+
+        # `map` yields the results in the order of the chunks
+        for data in _get_pool(workers).map(
+                _convert_chunk,
+                [rest[index:index + size].tobytes() for index in starts],
+                [source] * len(starts), [target] * len(starts)):
+            tail.data.frombytes(data)
+
+    result = ColorArray(target, head.data + tail.data)
+
+    if dst == 'hex':
+        return result.hex()
+
+    return result if packed else list(result)
@@ -0,0 +1,690 @@
+"""Module to read and write PNG images, using only `zlib`.
+
+Decoding streams: compressed data is read chunk by chunk and
+decompressed in bounded pieces, and each scanline is unfiltered
+(None, Sub, Up, Average or Paeth) against the previous one as soon as
+it is complete. Only two rows are ever held decoded, so huge images
+can be recolored row by row in little memory.
+
+Encoding streams too: every row is filtered (with a fixed filter, or
+the best of them per row), compressed and written in IDAT chunks of
+at most 64 KiB.
+
+Filters that only combine whole rows (Sub and Up, and Average when
+encoding) run on each row as one big int, at C speed; Paeth, and the
+decoding of Average, need a Python loop per byte and are the slowest.
+
+E.g.:
+with PNGReader('photo.png') as image:
+    for row in image.rows():  # packed 8-bit RGB bytes
+        ...
+
+with PNGWriter('out.png', width, height, filter='up') as writer:
+    writer.write_rows(rows)
+
+Separate documentation for each function and class written with them.
+To read the documentation, type `help(<function/class>)` into the CLI
+"""
+
+
+import struct
+import sys
+import zlib
+from array import array
+from functools import lru_cache
+
+from dyepy.batch import ColorArray
+from dyepy.converters import _type
+
+
+_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Samples per pixel and allowed bit depths of each color type
+_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+_DEPTHS = {0: (1, 2, 4, 8, 16), 2: (8, 16), 3: (1, 2, 4, 8), 4: (8, 16),
+           6: (8, 16)}
+
+# Color type written for 1 (gray), 2 (gray, alpha), 3 (RGB), 4 (RGBA)
+_COLOR_TYPES = {1: 0, 2: 4, 3: 2, 4: 6}
+
+_FILTERS = {'none': 0, 'sub': 1, 'up': 2, 'average': 3, 'paeth': 4}
+
+# Filter types tried per row by the 'adaptive' and 'fast' strategies
+_STRATEGIES = {'adaptive': (0, 1, 2, 3, 4), 'fast': (0, 1, 2)}
+
+# |x| of filtered bytes read as signed, to pick the filter of a row
+_SIGNED = bytes(min(value, 256 - value) for value in range(256))
+
+# Uncompressed bytes produced at once, and size of written IDAT chunks
+_LIMIT = 1 << 20
+_IDAT_SIZE = 1 << 16
+
+# Hidden function `_masks` for byte-wise arithmetic on whole rows
+@lru_cache(maxsize=16)
+def _masks(size):
+    """Returns the ints of *size* bytes 0x80 and of *size* bytes 0x7f
+
+Rows read as big ints (`int.from_bytes`) are added or subtracted byte
+by byte, modulo 256, by doing it on the low 7 bits of every byte and
+patching the top bits with XOR, so no carry crosses bytes. It runs
+over the whole row in C instead of one Python step per byte.
+"""
+
+    return int.from_bytes(b'\x80' * size, 'big'), \
+        int.from_bytes(b'\x7f' * size, 'big')
+
+
+# Hidden function `_unfilter` to reconstruct a scanline
+def _unfilter(kind, raw, prior, bpp):
+    """Returns the bytes of a row from its filtered bytes *raw*
+
+prior: the previous (reconstructed) row, zeros for the first one.
+bpp: bytes per complete pixel (at least 1).
+"""
+
+    if kind == 0:
+        return bytes(raw)
+
+    size = len(raw)
+
+    if kind in (1, 2):
+        high, low = _masks(size)
+        x = int.from_bytes(raw, 'big')
+
+        if kind == 2:
+            y = int.from_bytes(prior, 'big')
+
+            return (((x & low) + (y & low)) ^ ((x ^ y) & high)) \
+                .to_bytes(size, 'big')
+
+        # Sub is a running sum of each byte lane: add the row shifted
+        # by 1, 2, 4... pixels to itself (a log-step prefix sum)
+        shift = bpp * 8
+
+        while shift < size * 8:
+            y = x >> shift
+            x = ((x & low) + (y & low)) ^ ((x ^ y) & high)
+            shift <<= 1
+
+        return x.to_bytes(size, 'big')
+
+    if kind == 3:
+        out = bytearray(raw)
+
+        for index in range(min(bpp, size)):
+            out[index] = (out[index] + (prior[index] >> 1)) & 255
+
+        for index in range(bpp, size):
+            out[index] = (out[index] + ((out[index - bpp] + prior[index])
+                                        >> 1)) & 255
+
+        return bytes(out)
+
+    if kind == 4:
+        out = bytearray(raw)
+
+        # Without a left neighbour, Paeth predicts the byte above
+        for index in range(min(bpp, size)):
+            out[index] = (out[index] + prior[index]) & 255
+
+        for index in range(bpp, size):
+            a = out[index - bpp]
+            b = prior[index]
+            c = prior[index - bpp]
+            pa = abs(b - c)
+            pb = abs(a - c)
+            pc = abs(a + b - c - c)
+
+            if pa <= pb and pa <= pc:
+                out[index] = (out[index] + a) & 255
+
+            elif pb <= pc:
+                out[index] = (out[index] + b) & 255
+
+            else:
+                out[index] = (out[index] + c) & 255
+
+        return bytes(out)
+
+    raise ValueError(f'invalid PNG filter type {kind}')
+
+
+# Hidden function `_filter` to filter a scanline before compression
+def _filter(kind, row, prior, bpp):
+    """Returns the filtered bytes of *row* (without the filter type)
+"""
+
+    if kind == 0:
+        return row
+
+    size = len(row)
+
+    if kind < 4:
+        high, low = _masks(size)
+        x = int.from_bytes(row, 'big')
+
+        if kind == 1:
+            y = x >> bpp * 8
+
+        elif kind == 2:
+            y = int.from_bytes(prior, 'big')
+
+        else:
+            # Byte-wise floor((left + up) / 2), without overflow
+            left = x >> bpp * 8
+            up = int.from_bytes(prior, 'big')
+            y = (left & up) + (((left ^ up) >> 1) & low)
+
+        return (((x | high) - (y & low)) ^ ((x ^ ~y) & high)) \
+            .to_bytes(size, 'big')
+
+    left = bytes(bpp) + row[:-bpp]
+    upleft = bytes(bpp) + prior[:-bpp]
+    out = bytearray(size)
+
+    for index, (x, a, b, c) in enumerate(zip(row, left, prior, upleft)):
+        pa = abs(b - c)
+        pb = abs(a - c)
+        pc = abs(a + b - c - c)
+
+        if pa <= pb and pa <= pc:
+            out[index] = (x - a) & 255
+
+        elif pb <= pc:
+            out[index] = (x - b) & 255
+
+        else:
+            out[index] = (x - c) & 255
+
+    return bytes(out)
+
+
+# Hidden function `_unpack` to split sub-byte samples into bytes
+def _unpack(depth, width):
+    """Returns a function unpacking rows of 1, 2 or 4-bit samples into
+one byte per sample (*width* samples)
+"""
+
+    count = 8 // depth
+    mask = (1 << depth) - 1
+    tables = [bytes((value >> (8 - depth * (index + 1))) & mask
+                    for value in range(256)) for index in range(count)]
+
+    def unpack(row):
+        out = bytearray(len(row) * count)
+
+        for index, table in enumerate(tables):
+            out[index::count] = row.translate(table)
+
+        return bytes(out[:width])
+
+    return unpack
+
+
+# A class to read a PNG image row by row
+class PNGReader:
+    """PNGReader class
+
+Reads the PNG image *file* (a path or a binary file) scanline by
+scanline. Every color type and bit depth is supported, except
+interlaced (Adam7) images.
+
+width, height (int): size of the image in pixels.
+bit_depth (int): bits per sample (1, 2, 4, 8 or 16).
+color_type (int): 0 (gray), 2 (RGB), 3 (palette), 4 (gray, alpha) or
+    6 (RGBA).
+palette: packed RGB bytes of the palette of color type 3, else None.
+
+`raw_rows` yields the samples of each row as stored in the file, and
+`rows` as packed 8-bit RGB (palettes applied, alpha dropped, 16-bit
+samples reduced to their high byte). Rows can only be read once.
+
+E.g.:
+with PNGReader('photo.png') as image:
+    colors = image.colors()
+"""
+
+    def __init__(self, file):
+        if isinstance(file, (str, bytes)) or hasattr(file, '__fspath__'):
+            self._file = open(file, 'rb')
+            self._owned = True
+
+        else:
+            self._file = file
+            self._owned = False
+
+        try:
+            self._start()
+
+        except BaseException:
+            self.close()
+            raise
+
+    def __repr__(self):
+        return f'PNGReader({self.width}×{self.height}, \
+color_type={self.color_type}, bit_depth={self.bit_depth})'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _start(self):
+        """Reads the chunks up to the first IDAT
+"""
+
+        if self._file.read(8) != _SIGNATURE:
+            raise ValueError('not a PNG image')
+
+        kind, data = self._chunk()
+
+        if kind != b'IHDR' or len(data) != 13:
+            raise ValueError('invalid PNG image: IHDR must come first')
+
+        self.width, self.height, self.bit_depth, self.color_type, \
+            compression, filtering, interlace = struct.unpack('>IIBBBBB',
+                                                              data)
+
+        if self.bit_depth not in _DEPTHS.get(self.color_type, ()):
+            raise ValueError(f'invalid PNG image: bit depth \
+{self.bit_depth} with color type {self.color_type}')
+
+        if compression or filtering:
+            raise ValueError('invalid PNG image: unknown compression or \
+filter method')
+
+        if interlace:
+            raise ValueError('interlaced PNG images are not supported')
+
+        self.palette = None
+
+        while True:
+            kind, data = self._chunk()
+
+            if kind == b'PLTE':
+                self.palette = data
+
+            elif kind == b'IDAT':
+                self._data = data
+                break
+
+            elif kind == b'IEND':
+                raise ValueError('invalid PNG image: no IDAT chunk')
+
+        if self.color_type == 3 and self.palette is None:
+            raise ValueError('invalid PNG image: no PLTE chunk')
+
+        self._read = False
+
+    def _chunk(self):
+        """Returns (type, data) of the next chunk, checking its CRC
+"""
+
+        header = self._file.read(8)
+
+        if len(header) < 8:
+            raise ValueError('truncated PNG image')
+
+        length, kind = struct.unpack('>I4s', header)
+        data = self._file.read(length)
+        crc = self._file.read(4)
+
+        if len(data) < length or len(crc) < 4:
+            raise ValueError('truncated PNG image')
+
+        if zlib.crc32(data, zlib.crc32(kind)) != struct.unpack('>I',
+                                                               crc)[0]:
+            raise ValueError(f'corrupt PNG image: bad CRC of chunk \
+{kind.decode("latin-1")!r}')
+
+        return kind, data
+
+    def _chunks(self):
+        """Yields the data of the consecutive IDAT chunks
+"""
+
+        data = self._data
+
+        while True:
+            yield data
+
+            kind, data = self._chunk()
+
+            while not data and kind == b'IDAT':
+                kind, data = self._chunk()
+
+            if kind != b'IDAT':
+                return
+
+    @property
+    def channels(self):
+        """Samples per pixel (1 for palette images)
+"""
+
+        return _CHANNELS[self.color_type]
+
+    @property
+    def stride(self):
+        """Number of bytes of each raw row
+"""
+
+        return (self.width * self.channels * self.bit_depth + 7) // 8
+
+    def raw_rows(self):
+        """Yields each row as bytes of unfiltered samples, as stored
+in the file (big-endian 16-bit samples, packed sub-byte samples)
+"""
+
+        if self._read:
+            raise ValueError('the rows of the image were already read')
+
+        self._read = True
+        stride = self.stride
+        bpp = max(1, self.channels * self.bit_depth // 8)
+        decompressor = zlib.decompressobj()
+        pending = bytearray()
+        prior = bytes(stride)
+        count = 0
+
+        for data in self._chunks():
+            while count < self.height:
+                # Output is bounded: the rest of the input is kept
+                out = decompressor.decompress(data, _LIMIT)
+                data = decompressor.unconsumed_tail
+
+                if not out and not data:
+                    break
+
+                pending += out
+
+                while len(pending) > stride and count < self.height:
+                    prior = _unfilter(pending[0], pending[1:stride + 1],
+                                      prior, bpp)
+                    del pending[:stride + 1]
+                    count += 1
+
+                    yield prior
+
+            if count == self.height:
+                return
+
+        raise ValueError(f'truncated PNG image: {count} of {self.height} \
+rows')
+
+    def rows(self):
+        """Yields each row as packed 8-bit RGB bytes
+"""
+
+        color_type = self.color_type
+        channels = self.channels
+        width = self.width
+        unpack = _unpack(self.bit_depth, width) if self.bit_depth < 8 \
+            else None
+
+        if color_type == 0 and unpack:
+            # Scales 1, 2 or 4-bit grays to 0-255
+            top = (1 << self.bit_depth) - 1
+            scale = bytes(value * 255 // top if value <= top else 0
+                          for value in range(256))
+
+        if color_type == 3:
+            palette = self.palette.ljust(768, b'\0')
+            tables = [palette[index::3] for index in range(3)]
+
+        for row in self.raw_rows():
+            if self.bit_depth == 16:
+                row = row[0::2]
+
+            elif unpack:
+                row = unpack(row)
+
+            if color_type == 2:
+                yield row
+                continue
+
+            out = bytearray(width * 3)
+
+            if color_type == 3:
+                for index, table in enumerate(tables):
+                    out[index::3] = row.translate(table)
+
+            elif color_type == 6:
+                for index in range(3):
+                    out[index::3] = row[index::4]
+
+            else:  # Gray, with or without alpha
+                gray = row[0::channels]
+
+                if unpack:
+                    gray = gray.translate(scale)
+
+                out[0::3] = out[1::3] = out[2::3] = gray
+
+            yield bytes(out)
+
+    def colors(self):
+        """Returns all the pixels as an RGB `ColorArray`, using `rows`
+"""
+
+        return ColorArray.frombuffer(b''.join(self.rows()))
+
+    def close(self):
+        """Closes the file (if opened from a path)
+"""
+
+        if self._owned and self._file is not None:
+            self._file.close()
+
+        self._file = None
+
+
+# A class to write a PNG image row by row
+class PNGWriter:
+    """PNGWriter class
+
+Writes a PNG image of *width* × *height* pixels to *file* (a path or
+a binary file), one row at a time.
+
+channels (int): 1 (gray), 2 (gray, alpha), 3 (RGB) or 4 (RGBA).
+bit_depth (int): 8 or 16.
+filter: the filter of every row, 'none', 'sub', 'up', 'average' or
+    'paeth'; or a strategy trying several filters per row and keeping
+    the one with the smallest sum of absolute (signed) bytes:
+    'adaptive' tries all five (the best compression, the slowest as
+    Paeth runs in Python), 'fast' tries none, sub and up.
+level (int): zlib compression level, 0 to 9.
+
+Rows may be bytes-like objects of raw samples (big-endian for 16-bit
+images), an RGB `ColorArray`, or sequences of integers.
+
+E.g.:
+with PNGWriter('ramp.png', 256, 1, channels=1) as writer:
+    writer.write_row(range(256))
+"""
+
+    def __init__(self, file, width, height, channels=3, bit_depth=8,
+                 filter='adaptive', level=6):
+        for value in (width, height, level):
+            if type(value) is not int:
+                raise TypeError(f'\'{value}\' must be of type \'int\', \
+not {_type(value)}')
+
+        if width < 1 or height < 1:
+            raise ValueError(f'\'width\' and \'height\' must be ≥ 1, not \
+\'{width}\' and \'{height}\'')
+
+        if channels not in _COLOR_TYPES:
+            raise ValueError(f'\'channels\' must be 1, 2, 3 or 4, not \
+\'{channels}\'')
+
+        if bit_depth not in (8, 16):
+            raise ValueError(f'\'bit_depth\' must be 8 or 16, not \
+\'{bit_depth}\'')
+
+        if filter in _FILTERS:
+            self._kinds = (_FILTERS[filter],)
+
+        elif filter in _STRATEGIES:
+            self._kinds = _STRATEGIES[filter]
+
+        else:
+            raise ValueError(f'unknown filter \'{filter}\'')
+
+        if not 0 <= level <= 9:
+            raise ValueError(f'\'level\' must be ≥ 0 and ≤ 9, not \
+\'{level}\'')
+
+        self.width = width
+        self.height = height
+        self.channels = channels
+        self.bit_depth = bit_depth
+        self.filter = filter
+        self.rows_written = 0
+
+        self._bpp = channels * bit_depth // 8
+        self._stride = width * self._bpp
+        self._prior = bytes(self._stride)
+        self._compressor = zlib.compressobj(level)
+        self._buffer = bytearray()
+
+        if isinstance(file, (str, bytes)) or hasattr(file, '__fspath__'):
+            self._file = open(file, 'wb')
+            self._owned = True
+
+        else:
+            self._file = file
+            self._owned = False
+
+        self._file.write(_SIGNATURE)
+        self._chunk(b'IHDR', struct.pack('>IIBBBBB', width, height,
+                                         bit_depth, _COLOR_TYPES[channels],
+                                         0, 0, 0))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, kind, *args):
+        # Do not hide the exception that interrupted the writing
+        self.close(check=kind is None)
+
+    def _chunk(self, kind, data):
+        """Writes a chunk of type *kind*
+"""
+
+        self._file.write(struct.pack('>I', len(data)) + kind + data
+                         + struct.pack('>I', zlib.crc32(data,
+                                                        zlib.crc32(kind))))
+
+    def _raw(self, row):
+        """Returns *row* as bytes of raw samples (big-endian)
+"""
+
+        if isinstance(row, ColorArray):
+            row = row.data
+
+        if isinstance(row, (bytes, bytearray, memoryview)):
+            return bytes(row)
+
+        if self.bit_depth == 8:
+            return bytes(row)
+
+        samples = array('H', row)
+
+        if sys.byteorder == 'little':
+            samples.byteswap()
+
+        return samples.tobytes()
+
+    def write_row(self, row):
+        """Filters, compresses and writes the next row of the image
+"""
+
+        if self.rows_written >= self.height:
+            raise ValueError(f'the image already has all its {self.height} \
+rows')
+
+        raw = self._raw(row)
+
+        if len(raw) != self._stride:
+            raise ValueError(f'rows must have {self._stride} bytes \
+({self.width} pixels), not {len(raw)}')
+
+        if len(self._kinds) == 1:
+            kind = self._kinds[0]
+            filtered = _filter(kind, raw, self._prior, self._bpp)
+
+        else:
+            kind, filtered = min(
+                ((kind, _filter(kind, raw, self._prior, self._bpp))
+                 for kind in self._kinds),
+                key=lambda candidate: sum(candidate[1].translate(_SIGNED)))
+
+        self._buffer += self._compressor.compress(bytes((kind,)))
+        self._buffer += self._compressor.compress(filtered)
+        self._prior = raw
+        self.rows_written += 1
+
+        if len(self._buffer) >= _IDAT_SIZE:
+            self._chunk(b'IDAT', bytes(self._buffer))
+            self._buffer.clear()
+
+    def write_rows(self, rows):
+        """Writes every row of the iterable *rows*
+"""
+
+        for row in rows:
+            self.write_row(row)
+
+    def close(self, check=True):
+        """Writes the last chunks and closes the file (if opened from
+a path)
+
+Raises ValueError if *check* and fewer than *height* rows were
+written (the file is then left incomplete).
+"""
+
+        if self._file is None:
+            return
+
+        complete = self.rows_written == self.height
+
+        if complete:
+            self._buffer += self._compressor.flush()
+            self._chunk(b'IDAT', bytes(self._buffer))
+            self._chunk(b'IEND', b'')
+
+        if self._owned:
+            self._file.close()
+
+        else:
+            self._file.flush()
+
+        self._file = None
+
+        if check and not complete:
+            raise ValueError(f'expected {self.height} rows, only \
+{self.rows_written} written')
+
+
+# A function to read a PNG image in one call
+def read_png(file):
+    """Returns the pixels of the PNG image *file* as an RGB `ColorArray`
+together with its width and height: (colors, width, height)
+"""
+
+    with PNGReader(file) as image:
+        return image.colors(), image.width, image.height
+
+
+# A function to write a PNG image in one call
+def write_png(file, rows, width, height, channels=3, bit_depth=8,
+              filter='adaptive', level=6):
+    """Writes *rows* as a PNG image to *file*, streaming them
+
+For the arguments, refer to `PNGWriter`.
+"""
+
+    with PNGWriter(file, width, height, channels, bit_depth, filter,
+                   level) as writer:
+        writer.write_rows(rows)
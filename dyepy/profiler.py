@@ -0,0 +1,280 @@
+"""Module with `profile`, a profiler of the dyepy call tree.
+
+Within a `with profile():` block, the scalar dyepy functions (the same
+ones as `dyepy.instrument`) are wrapped to record the path of nested
+calls that led to each of them, e.g. hex2cmyk → rgb2cmyk, with its
+number of calls, its cumulative time and its self time (without the
+dyepy functions it called). The original functions are put back when
+the block ends, so code outside of it pays nothing.
+
+The results can be printed as a sorted table or as a tree, and saved
+in the `.pstats` format of `cProfile`, loadable with `pstats.Stats`,
+snakeviz, gprof2dot...
+
+E.g.:
+with dyepy.profile() as profiler:
+    for code in codes:
+        dyepy.hex2cmyk(code)
+profiler.print_tree()
+-> hex2cmyk      1000 calls   9.8 ms  self 1.2 ms
+     rgb2cmyk    1000 calls   6.1 ms  self 6.1 ms
+     hex2rgb     1000 calls   2.5 ms  self 2.5 ms
+profiler.dump_stats('convert.pstats')
+
+Separate documentation for each function and class written with them.
+To read the documentation, type `help(<function/class>)` into the CLI
+"""
+
+
+import marshal
+import sys
+import threading
+from functools import wraps
+from inspect import getattr_static
+from time import perf_counter
+
+from dyepy.instrument import _rebind, _targets
+
+
+# Columns `Profile.print_stats` can sort on, and their row key
+_SORTS = {
+    'cumulative': lambda row: -row[2],
+    'self': lambda row: -row[3],
+    'calls': lambda row: -row[1],
+    'name': lambda row: row[0],
+}
+
+# The profiler running, as only one can wrap the functions at a time
+_active = None
+
+
+# A class to profile the calls of dyepy functions
+class Profile:
+    """Profile class
+
+A context manager recording the tree of dyepy calls made in its
+block, as returned by `profile`.
+
+nodes (dict): {path: [calls, cumulative time, time of children]}
+    where *path* is the tuple of the names of the nested calls, from
+    the outermost dyepy function to the one measured; times are in
+    seconds.
+"""
+
+    def __init__(self, output=None):
+        self.output = output
+        self.nodes = {}
+        self._functions = {}
+        self._installed = []
+        self._local = threading.local()
+
+    def __enter__(self):
+        global _active
+
+        if _active is not None:
+            raise RuntimeError('a dyepy profile is already running')
+
+        _active = self
+
+        try:
+            self._install()
+
+        except BaseException:
+            _active = None
+            raise
+
+        return self
+
+    def __exit__(self, *args):
+        global _active
+
+        self._uninstall()
+        _active = None
+
+        if self.output is not None:
+            self.dump_stats(self.output)
+
+    def _wrap(self, name, function):
+        """Returns a wrapper of *function* recording its calls as *name*
+"""
+
+        nodes, local = self.nodes, self._local
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            parent = getattr(local, 'path', ())
+            path = local.path = parent + (name,)
+            start = perf_counter()
+
+            try:
+                return function(*args, **kwargs)
+
+            finally:
+                elapsed = perf_counter() - start
+                local.path = parent
+                node = nodes.get(path)
+
+                if node is None:
+                    node = nodes[path] = [0, 0.0, 0.0]
+
+                node[0] += 1
+                node[1] += elapsed
+
+                if parent:
+                    # The parent is still running, its node may not exist
+                    nodes.setdefault(parent, [0, 0.0, 0.0])[2] += elapsed
+
+        return wrapper
+
+    def _install(self):
+        """Wraps every profiled function
+"""
+
+        replacements = {}
+
+        for name, owner, attribute in list(_targets()):
+            raw = getattr_static(owner, attribute)
+            static = isinstance(raw, staticmethod)
+            function = raw.__func__ if static else raw
+            wrapper = self._wrap(name, function)
+
+            setattr(owner, attribute, staticmethod(wrapper) if static
+                    else wrapper)
+            self._installed.append((owner, attribute, raw, function,
+                                    wrapper))
+            self._functions[name] = function
+            replacements[id(function)] = wrapper
+
+        _rebind(replacements)
+
+    def _uninstall(self):
+        """Puts the original functions back
+"""
+
+        for owner, attribute, raw, _, _ in self._installed:
+            setattr(owner, attribute, raw)
+
+        _rebind({id(wrapper): function
+                 for _, _, _, function, wrapper in self._installed})
+        self._installed.clear()
+
+    def rows(self):
+        """Returns a list of (name, calls, cumulative time, self time) of
+every function called, summed over the paths that reached it
+
+Recursive calls count once in the cumulative time.
+"""
+
+        totals = {}
+
+        for path, (calls, cumulative, children) in self.nodes.items():
+            name = path[-1]
+            row = totals.setdefault(name, [name, 0, 0.0, 0.0])
+            row[1] += calls
+            row[3] += cumulative - children
+
+            if name not in path[:-1]:
+                row[2] += cumulative
+
+        return [tuple(row) for row in totals.values()]
+
+    def print_stats(self, sort='cumulative', limit=None, file=None):
+        """Prints a table of every function called, sorted by *sort*
+('cumulative', 'self', 'calls' or 'name'), at most *limit* rows
+"""
+
+        if sort not in _SORTS:
+            raise ValueError(f'\'sort\' must be one of \
+{", ".join(_SORTS)}, not \'{sort}\'')
+
+        rows = sorted(self.rows(), key=_SORTS[sort])[:limit]
+        width = max((len(row[0]) for row in rows), default=8)
+        lines = [f'{"function":<{width}} {"calls":>9} {"cumulative":>12} \
+{"self":>12} {"per call":>10}']
+
+        for name, calls, cumulative, own in rows:
+            lines.append(f'{name:<{width}} {calls:>9} \
+{cumulative * 1e3:>9.3f} ms {own * 1e3:>9.3f} ms \
+{cumulative / calls * 1e6:>7.2f} µs')
+
+        print('\n'.join(lines), file=file or sys.stdout)
+
+    def print_tree(self, file=None):
+        """Prints the tree of nested calls, the slowest paths first
+"""
+
+        children = {}
+
+        for path in self.nodes:
+            children.setdefault(path[:-1], []).append(path)
+
+        width = max((2 * len(path) + len(path[-1]) for path in self.nodes),
+                    default=8)
+        lines = []
+
+        def walk(parent):
+            for path in sorted(children.get(parent, ()),
+                               key=lambda path: -self.nodes[path][1]):
+                calls, cumulative, children_time = self.nodes[path]
+                own = cumulative - children_time
+                label = '  ' * (len(path) - 1) + path[-1]
+                lines.append(f'{label:<{width}} {calls:>9} calls \
+{cumulative * 1e3:>9.3f} ms  self {own * 1e3:.3f} ms')
+                walk(path)
+
+        walk(())
+        print('\n'.join(lines), file=file or sys.stdout)
+
+    def stats(self):
+        """Returns the statistics in the format of `cProfile` (the
+`stats` dict of `pstats.Stats`)
+"""
+
+        def key(name):
+            code = self._functions[name].__code__
+
+            return code.co_filename, code.co_firstlineno, name
+
+        stats = {}
+
+        for path, (calls, cumulative, children) in self.nodes.items():
+            name = path[-1]
+            own = cumulative - children
+            primitive = name not in path[:-1]
+            entry = stats.setdefault(key(name), [0, 0, 0.0, 0.0, {}])
+            entry[0] += calls if primitive else 0
+            entry[1] += calls
+            entry[2] += own
+            entry[3] += cumulative if primitive else 0
+
+            if len(path) > 1:
+                callers = entry[4]
+                caller = callers.get(key(path[-2]), (0, 0, 0.0, 0.0))
+                callers[key(path[-2])] = (
+                    caller[0] + (calls if primitive else 0),
+                    caller[1] + calls, caller[2] + own,
+                    caller[3] + cumulative)
+
+        return {function: tuple(entry) for function, entry in stats.items()}
+
+    def dump_stats(self, path):
+        """Saves the statistics to the `.pstats` file *path*
+"""
+
+        with open(path, 'wb') as file:
+            marshal.dump(self.stats(), file)
+
+
+# A function to profile the dyepy calls of a block of code
+def profile(output=None):
+    """Returns a `Profile`, to be used as a context manager: the dyepy
+calls made in its block are recorded, and saved to the `.pstats` file
+*output* at its end if given
+
+E.g.:
+with dyepy.profile('job.pstats') as profiler:
+    run_job()
+profiler.print_stats(sort='self', limit=10)
+"""
+
+    return Profile(output)
@@ -0,0 +1,376 @@
+"""Module with a local asyncio server of color conversions.
+
+The server listens on localhost TCP or a Unix socket and speaks
+HTTP/1.1 with keep-alive; requests and responses are JSON:
+
+POST /convert {"colors": ["#0078d7", [255, 0, 0], "navy"], "to": "hsl"}
+-> {"colors": [[207.0, 1.0, 0.4216], [0.0, 1.0, 0.5], [240.0, 1.0, 0.251]]}
+POST /nearest {"colors": ["#ff0001"], "palette": "css"}
+-> {"nearest": [{"name": "red", "hex": "#ff0000", "distance": 0.0982}]}
+POST /contrast {"pairs": [["#777777", "#ffffff"]]}
+-> {"ratios": [4.4781], "levels": [null]}
+GET /health -> {"status": "ok"}
+
+Each of them also takes one value ("color", or "foreground" and
+"background") and answers with one ("color", "nearest", "ratio" and
+"level"). Colors may be anything accepted by `as_rgb`.
+
+Concurrent requests of the same kind (and options) are merged into
+micro-batches: a request waits at most `batch_delay` seconds (by
+default, only until the event loop has read every request ready at
+the same time) and its colors go through the batch kernels with the
+colors of the other requests, at most `batch_size` colors at once.
+
+From the command line:
+python -m dyepy serve --port 8765
+python -m dyepy serve --unix /tmp/dyepy.sock
+
+E.g.:
+asyncio.run(serve(port=8765))
+
+Separate documentation for each function and class written with them.
+To read the documentation, type `help(<function/class>)` into the CLI
+"""
+
+
+import asyncio
+import json
+
+from dyepy.batch import _SPACES, ColorArray, convert_array
+from dyepy.contrast import luminance_array, wcag_level
+from dyepy.converters import _type
+from dyepy.deltae import delta_e_nearest, named_palette
+
+
+# Largest request body, in bytes
+_MAX_BODY = 1 << 20
+
+# Reason phrases of the status codes sent
+_REASONS = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+}
+
+
+# Hidden function `_convert` to convert a batch of colors
+def _convert(colors, space, precision):
+    """Returns *colors* converted to *space*: Hex strings, or lists of
+values rounded to *precision* decimals
+"""
+
+    rgb = ColorArray.fromcolors(colors)
+
+    if space == 'hex':
+        return rgb.hex()
+
+    if space not in _SPACES:
+        raise ValueError(f'unknown color space \'{space}\'')
+
+    converted = convert_array(rgb, space)
+    data, channels = converted.data, converted.channels
+
+    if space != 'rgb':
+        data = [round(value, precision) + 0.0 for value in data]
+
+    return [list(data[index:index + channels])
+            for index in range(0, len(data), channels)]
+
+
+# Hidden function `_nearest` to match a batch of colors to a palette
+def _nearest(colors, palette, method):
+    """Returns the name, Hex code and Delta E of the nearest *palette*
+color of each of *colors*
+"""
+
+    names, codes = named_palette(palette)
+    indexes, distances = delta_e_nearest(colors, codes, method)
+
+    return [{'name': names[index], 'hex': codes[index],
+             'distance': round(distance, 4)}
+            for index, distance in zip(indexes, distances)]
+
+
+# Hidden function `_contrast` to get the contrast ratios of a batch
+def _contrast(pairs, large):
+    """Returns (ratio, WCAG level) of each (foreground, background) of
+*pairs*
+"""
+
+    if any(not isinstance(pair, list) or len(pair) != 2 for pair in pairs):
+        raise ValueError('\'pairs\' must be [foreground, background] lists')
+
+    results = []
+    luminances = luminance_array([color for pair in pairs for color in pair])
+
+    for index in range(0, len(luminances), 2):
+        lighter, darker = sorted(luminances[index:index + 2], reverse=True)
+        ratio = (lighter + 0.05) / (darker + 0.05)
+        results.append((round(ratio, 4), wcag_level(ratio, large)))
+
+    return results
+
+
+# Path: (kernel, request key of the values, {option: default})
+_ROUTES = {
+    '/convert': (_convert, 'colors', {'to': 'hex', 'precision': 4}),
+    '/nearest': (_nearest, 'colors', {'palette': 'css',
+                                      'method': 'ciede2000'}),
+    '/contrast': (_contrast, 'pairs', {'large': False}),
+}
+
+
+# A class to merge concurrent requests into micro-batches
+class Batcher:
+    """Batcher class
+
+Collects the values of the requests made to a kernel with the same
+options and runs the kernel once on all of them.
+
+kernel (function): called as kernel(values, *options), it returns one
+    result per value.
+size (int): most values per batch; a batch that is full runs at once.
+delay (float): seconds a request may wait for others; 0 only waits
+    for the requests the event loop reads in the same iteration.
+"""
+
+    def __init__(self, kernel, size=1024, delay=0.0):
+        self.kernel = kernel
+        self.size = size
+        self.delay = delay
+        self._pending = {}
+
+    async def submit(self, values, *options):
+        """Returns the results of *values*, once their batch has run
+"""
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        queue = self._pending.setdefault(options, [0, []])
+        queue[0] += len(values)
+        queue[1].append((values, future))
+
+        if queue[0] >= self.size:
+            self._run(options)
+
+        elif len(queue[1]) == 1:
+            if self.delay:
+                loop.call_later(self.delay, self._run, options)
+
+            else:
+                loop.call_soon(self._run, options)
+
+        return await future
+
+    def _run(self, options):
+        """Runs the batch of the requests with *options*
+"""
+
+        _, requests = self._pending.pop(options, (0, ()))
+
+        if not requests:
+            return
+
+        try:
+            results = self.kernel([value for values, _ in requests
+                                   for value in values], *options)
+
+        except Exception:
+            # A request with a bad value fails alone, its error passed
+            # on to it (a callback of the event loop has no caller)
+            for values, future in requests:
+                if not future.done():
+                    try:
+                        future.set_result(self.kernel(values, *options))
+
+                    except Exception as error:
+                        future.set_exception(error)
+
+            return
+
+        start = 0
+
+        for values, future in requests:
+            if not future.done():
+                future.set_result(results[start:start + len(values)])
+
+            start += len(values)
+
+
+# A class of the conversion server
+class ColorServer:
+    """ColorServer class
+
+The HTTP/JSON server described by the module documentation; `serve`
+runs one.
+
+batch_size (int): most colors per batch of the kernels.
+batch_delay (float): seconds a request may wait to be batched.
+"""
+
+    def __init__(self, batch_size=1024, batch_delay=0.0):
+        if type(batch_size) is not int:
+            raise TypeError(f'\'{batch_size}\' must be of type \'int\', \
+not {_type(batch_size)}')
+
+        if batch_size < 1:
+            raise ValueError(f'\'batch_size\' must be ≥ 1, not \
+\'{batch_size}\'')
+
+        self.batchers = {path: Batcher(kernel, batch_size, batch_delay)
+                         for path, (kernel, _, _) in _ROUTES.items()}
+
+    async def handle(self, reader, writer):
+        """Serves the requests of one connection, until it is closed
+"""
+
+        try:
+            while True:
+                line = await reader.readline()
+
+                if not line:
+                    break
+
+                method, path, version = (line.decode('latin-1').split()
+                                         + ['', '', ''])[:3]
+                headers = {}
+
+                while True:
+                    line = await reader.readline()
+
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip().lower()
+
+                length = headers.get('content-length') or '0'
+                keep = headers.get('connection', '') != 'close' \
+                    if version == 'HTTP/1.1' \
+                    else headers.get('connection', '') == 'keep-alive'
+
+                # Without a length, the end of the body is unknown
+                if not (length.isascii() and length.isdecimal()):
+                    status, response, keep = 400, {'error': f'bad \
+Content-Length \'{length}\''}, False
+
+                elif int(length) > _MAX_BODY:
+                    status, response, keep = 413, {'error': 'body too \
+large'}, False
+
+                else:
+                    body = await reader.readexactly(int(length))
+                    status, response = await self.respond(method, path, body)
+
+                data = json.dumps(response).encode()
+                writer.write(f'HTTP/1.1 {status} {_REASONS[status]}\r\n\
+Content-Type: application/json\r\nContent-Length: {len(data)}\r\n\
+Connection: {"keep-alive" if keep else "close"}\r\n\r\n'.encode() + data)
+                await writer.drain()
+
+                if not keep:
+                    break
+
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass    # A client gone or speaking something else than HTTP
+
+        finally:
+            writer.close()
+
+    async def respond(self, method, path, body):
+        """Returns (status, response object) of a request
+"""
+
+        if path == '/health':
+            return 200, {'status': 'ok'}
+
+        if path not in _ROUTES:
+            return 404, {'error': f'no route \'{path}\''}
+
+        if method != 'POST':
+            return 405, {'error': f'\'{path}\' only accepts POST'}
+
+        kernel, key, defaults = _ROUTES[path]
+
+        try:
+            request = json.loads(body)
+
+            if not isinstance(request, dict):
+                raise ValueError('the request must be a JSON object')
+
+            options = tuple(request.get(option, default)
+                            for option, default in defaults.items())
+
+            # Options are batch keys too, so no lists or dicts
+            for option, value, default in zip(defaults, options,
+                                              defaults.values()):
+                if type(value) is not type(default):
+                    raise TypeError(f'\'{option}\' must be of type \
+\'{type(default).__name__}\', not {_type(value)}')
+
+            # One value, e.g. {"color": ...}, gets one result
+            single = key == 'colors' and 'color' in request \
+                or key == 'pairs' and ('foreground' in request
+                                       or 'background' in request)
+
+            if single:
+                values = [request['color']] if key == 'colors' else \
+                    [[request['foreground'], request['background']]]
+
+            else:
+                values = request[key]
+
+                if not isinstance(values, list):
+                    raise ValueError(f'\'{key}\' must be a list')
+
+            results = await self.batchers[path].submit(values, *options)
+
+        except KeyError as error:
+            return 400, {'error': f'missing {error}'}
+
+        except (OverflowError, TypeError, ValueError) as error:
+            return 400, {'error': str(error)}
+
+        if path == '/contrast':
+            ratios = [ratio for ratio, _ in results]
+            levels = [level for _, level in results]
+
+            if single:
+                return 200, {'ratio': ratios[0], 'level': levels[0]}
+
+            return 200, {'ratios': ratios, 'levels': levels}
+
+        if path == '/nearest':
+            return 200, {'nearest': results[0] if single else results}
+
+        if single:
+            return 200, {'color': results[0]}
+
+        return 200, {'colors': results}
+
+
+# A function to run the conversion server
+async def serve(host='127.0.0.1', port=8765, path=None, batch_size=1024,
+                batch_delay=0.0, ready=None):
+    """Runs a `ColorServer` on *host*:*port*, or on the Unix socket
+*path* if given, until cancelled
+
+ready (function): called with the address listened on once the server
+    accepts connections (e.g. to learn the port when *port* is 0).
+"""
+
+    server = ColorServer(batch_size, batch_delay)
+
+    if path is not None:
+        listener = await asyncio.start_unix_server(server.handle, path)
+
+    else:
+        listener = await asyncio.start_server(server.handle, host, port)
+
+    async with listener:
+        if ready is not None:
+            ready(listener.sockets[0].getsockname())
+
+        await listener.serve_forever()
@@ -0,0 +1,236 @@
+"""Module with `Styles`, ANSI escape codes to style and color text.
+
+The text styles, the named foreground and background colors, and the
+`n` (256-color) and `rgb` (truecolor) helpers of the command-line.
+
+Separate documentation for each function and class written with them.
+To read the documentation, type `help(<function/class>)` into the CLI
+"""
+
+
+from dyepy.converters import _type
+
+
+# A class to print in different colors (command-line only)
+class Styles:
+    """Styles class
+
+A class to print both foreground and background in different
+styles and colors (both as variables) on a command-line.
+
+Print blue text with green background
+E.g.: print(Styles.Bg.GREEN+Styles.Fg.BLUE+'Blue text'+Styles.RESET)
+
+Or print the text in italics
+E.g.: print(Styles.ITALIC+'Italic text'+Styles.RESET)
+
+Here's what the constants are supposed to do:
+    ---- Reset ----
+    RESET: resets all the colors and styles used in the preceding text
+
+    ---- Styles ----
+    BOLD: bolds all the succeeding text
+    DISABLE: reduces intensity (not widely supported)
+    ITALIC: writes text in italics (not widely supported)
+    UNDERLINE: underlines succeeding text
+    SLOWBLINK: makes the text blink slowly (< 150 per minute)
+    RAPIDBLINK: makes the text blink > 150/min (not widely supported)
+    REVERSE: swaps default foreground and background colors and styles
+    INVISIBLE: makes the foreground transparent
+    STRIKETHROUGH: strikes through the text
+    REVEAL: switches Conceal off (not widely supported)
+    FRAME: frames the succeeding text
+    ENCIRCLE: encircles the succeeding text
+    OVERLINE: prints an overline on the succeeding text
+
+    ---- Colors ----
+        -- Foreground (Fg) --
+        Fg.<COLOR_NAME>: sets the color to the succeeding fg
+        Fg.n(<intensity>): sets the pre-selected color to fg
+        Fg.rgb(<r>, <g>, <b>): sets the calculated color to fg
+
+        -- Background (Bg) --
+        Bg.<COLOR_NAME>: sets the color to the succeding bg
+        Bg.n(<intensity>): sets the pre-selected color to bg
+        Bg.rgb(<r>, <g>, <b>): sets the calculated color to bg
+
+    For more info on `n`, refer to this table:
+      https://i.stack.imgur.com/KTSQa.png
+
+Please do not attempt to change these constants in the module
+or the Python file this is being imported to, as it may affect
+the output of the colors and may even corrupt and work irregularly
+and not as expected when being ran in a Python environment
+
+For more information on command-line styling, refer to:
+  http://ascii-table.com/ansi-escape-sequences-vt-100.php
+"""
+
+    # Reset
+    RESET = reset = '\x1b[00m'
+
+    # Styles
+    BOLD = bold = '\x1b[01m'
+    DISABLE = disable = '\x1b[02m'
+    ITALIC = italic = '\x1b[03m'
+    UNDERLINE = underline = '\x1b[04m'
+    SLOWBLINK = slowblink = '\x1b[05m'
+    RAPIDBLINK = rapidblink = '\x1b[06m'
+    REVERSE = reverse = '\x1b[07m'
+    INVISIBLE = invisible = '\x1b[08m'
+    STRIKETHROUGH = strikethrough = '\x1b[09m'
+    REVEAL = reveal = '\x1b[28m'
+    FRAME = frame = '\x1b[51m'
+    ENCIRCLE = encircle = '\x1b[52m'
+    OVERLINE = overline = '\x1b[53m'
+
+    # Foreground colors
+    class Foreground:
+        """Foreground (Fg) sub-class to set foreground
+colors of succeeding text occurences
+"""
+
+        BLACK = black = '\x1b[30m'
+        RED = red = '\x1b[31m'
+        GREEN = green = '\x1b[32m'
+        ORANGE = orange = '\x1b[33m'
+        BLUE = blue = '\x1b[34m'
+        PURPLE = purple = '\x1b[35m'
+        CYAN = cyan = '\x1b[36m'
+        LIGHTGREY = lightgrey = '\x1b[37m'
+        DARKGREY = darkgrey = '\x1b[90m'
+        LIGHTRED = lightred = '\x1b[91m'
+        LIGHTGREEN = lightgreen = '\x1b[92m'
+        YELLOW = yellow = '\x1b[93m'
+        LIGHTBLUE = lightblue = '\x1b[94m'
+        PINK = pink = '\x1b[95m'
+        LIGHTCYAN = lightcyan = '\x1b[96m'
+
+        WHITE = white = '\x1b[38;2;255;255;255m'
+        SPOTIFYGREEN = spotifygreen = '\x1b[38;2;29;185;84m'
+        WINDOWSBLUE = '\x1b[38;2;0;120;215m'
+
+        @staticmethod
+        def n(intensity=0):
+            """Returns calculated ANSI color code for unnamed bg colors
+
+Can be used as follow:
+print(Styles.Fg.n(69)+'Some random color'+Styles.RESET)
+
+Refer to https://i.stack.imgur.com/KTSQa.png for more
+information on how to use the function to get a color
+"""
+
+            if type(intensity) not in (int, float):
+                raise TypeError(f'\'{intensity}\' must be of type \
+\'int\' or \'float\', not {_type(intensity)}')
+
+            if intensity < 0 or intensity > 255:
+                raise ValueError(f'\'intensity\' must be ≥ 0 and ≤ 255\
+, not \'{intensity}\'')
+
+            intensity = round(intensity)
+
+            return f'\x1b[38;5;{intensity}m'
+
+        @staticmethod
+        def rgb(red=0, blue=0, green=0):
+            """Returns calculated ANSI color code for unnamed fg colors
+
+Can be used as follows:
+print(Styles.Fg.rgb(0, 120, 215)+'Windows Default Blue'+Styles.RESET)
+print(Styles.Fg.rgb(29, 185, 84)+'Spotify Green'+Styles.RESET)
+
+Note: 0 ≤ r, g, b ≤ 255
+"""
+
+            # Check if all parameters are perfect or not
+            for color_value in (red, green, blue):
+                if type(color_value) not in (int, float):
+                    raise TypeError(f'\'{color_value}\' must be of \
+type \'int\' or \'float\', not {_type(color_value)}')
+
+                elif color_value < 0 or color_value > 255:
+                    raise ValueError(f'\'color_value\' must be ≥ 0 \
+and ≤ 255, not \'{color_value}\'')
+
+            red, green, blue = round(red), round(green), round(blue)
+
+            return f'\x1b[38;2;{red};{blue};{green}m'
+
+    Fg = Foreground
+
+    # Background colors
+    class Background:
+        """Background (Bg) sub-class to set background
+colors of succeeding text occurences"""
+
+        BLACK = black = '\x1b[40m'
+        RED = red = '\x1b[41m'
+        GREEN = green = '\x1b[42m'
+        ORANGE = orange = '\x1b[43m'
+        BLUE = blue = '\x1b[44m'
+        PURPLE = purple = '\x1b[45m'
+        CYAN = cyan = '\x1b[46m'
+        LIGHTGREY = lightgrey = '\x1b[47m'
+        DARKGREY = darkgrey = '\x1b[100m'
+        LIGHTRED = lightred = '\x1b[101m'
+        LIGHTGREEN = lightgreen = '\x1b[102m'
+        YELLOW = yellow = '\x1b[103m'
+        LIGHTBLUE = lightblue = '\x1b[104m'
+        PINK = pink = '\x1b[105m'
+        LIGHTCYAN = lightcyan = '\x1b[106m'
+
+        WHITE = white = '\x1b[48;2;255;255;255m'
+        SPOTIFYGREEN = spotifygreen = '\x1b[48;2;29;185;84m'
+        WINDOWSBLUE = '\x1b[48;2;0;120;215m'
+
+        @staticmethod
+        def n(intensity=255):
+            """Returns calculated ANSI color code for unnamed bg colors
+
+Can be used as follow:
+print(Styles.Bg.n(69)+'Some random color'+Styles.RESET)
+
+Refer to https://i.stack.imgur.com/KTSQa.png for more
+information on how to use the function to get a color
+"""
+
+            if type(intensity) not in (int, float):
+                raise TypeError(f'\'{intensity}\' must be of type \
+\'int\' or \'float\', not {_type(intensity)}')
+
+            if intensity < 0 or intensity > 255:
+                raise ValueError(f'\'intensity\' must be ≥ 0 and \
+≤ 255, not \'{intensity}\'')
+
+            intensity = round(intensity)
+
+            return f'\x1b[48;5;{intensity}m'
+
+        @staticmethod
+        def rgb(red=255, blue=255, green=255):
+            """Returns calculated ANSI color code for unnamed bg colors
+
+Can be used as follows:
+print(Styles.Bg.rgb(0, 120, 215)+'Windows Default Blue'+Styles.RESET)
+print(Styles.Bg.rgb(29, 185, 84)+'Spotify Green'+Styles.RESET)
+
+Note: 0 ≤ red, green, blue ≤ 255
+"""
+
+            # Check if all parameters are perfect or not
+            for color_value in (red, green, blue):
+                if type(color_value) not in (int, float):
+                    raise TypeError(f'\'{color_value}\' must be of \
+type \'int\' or \'float\', not {_type(color_value)}')
+
+                elif color_value < 0 or color_value > 255:
+                    raise ValueError(f'\'color_value\' must be ≥ 0 \
+and ≤ 255, not \'{color_value}\'')
+
+            red, green, blue = round(red), round(green), round(blue)
+
+            return f'\x1b[48;2;{red};{blue};{green}m'
+
+    Bg = Background
@@ -0,0 +1,102 @@
+"""Tests of `dyepy.batch`.
+"""
+
+
+import random
+
+import pytest
+
+from dyepy import converters
+from dyepy.batch import _SPACES, ColorArray, as_rgb, convert_array, \
+    oklab2rgb_array, oklch2rgb_array, rgb2oklab_array, rgb2oklch_array
+
+
+@pytest.mark.parametrize('color, expected', [
+    ('#0078d7', (0, 120, 215)),
+    ('#07d', (0, 119, 221)),
+    ('WindowsBlue', (0, 120, 215)),
+    ('rgb(0, 120, 215)', (0, 120, 215)),
+    ('rgba(0, 120, 215, 0.5)', (0, 120, 215)),
+    ('hsl(0, 1, 0.5)', (255, 0, 0)),
+    (0x0078d7, (0, 120, 215)),
+    (0xffffff, (255, 255, 255)),
+    ((0, 119.6, 215), (0, 120, 215)),
+    ([255, 255, 255], (255, 255, 255)),
+])
+def test_as_rgb(color, expected):
+    assert as_rgb(color) == expected
+
+
+@pytest.mark.parametrize('color, error', [
+    ((300, 0, 0), ValueError),
+    ([0, -1, 0], ValueError),
+    ('rgb(0, 0, 256)', ValueError),
+    (('0', 0, 0), TypeError),
+    ('nocolor', ValueError),
+    ('xyz(1, 2, 3)', ValueError),
+    (1.5, TypeError),
+    (-1, ValueError),
+    (0x1000000, ValueError),
+])
+def test_as_rgb_errors(color, error):
+    with pytest.raises(error):
+        as_rgb(color)
+
+
+def test_packed_round_trip():
+    rng = random.Random(26)
+    packed = [rng.getrandbits(24) for _ in range(1000)]
+    colors = ColorArray.frompacked(packed)
+
+    assert list(colors.packed()) == packed
+    assert colors.hex()[:2] == [f'#{value:06x}' for value in packed[:2]]
+
+
+@pytest.mark.parametrize('space', sorted(set(_SPACES) - {'rgb'}))
+def test_convert_array_matches_the_scalar_converters(space):
+    rng = random.Random(len(space))
+    rgb = [tuple(rng.randrange(256) for _ in range(3)) for _ in range(200)]
+    convert = getattr(converters, f'rgb2{space}')
+    converted = list(convert_array(ColorArray.fromcolors(rgb), space))
+
+    for color, values in zip(rgb, converted):
+        assert values == pytest.approx(convert(*color), abs=1e-9)
+
+
+# Random colors, and colors repeating as in images (converted once)
+@pytest.fixture(params=['random', 'repeated'])
+def colors(request):
+    rng = random.Random(27)
+
+    if request.param == 'random':
+        return ColorArray.frombuffer(bytes(rng.getrandbits(8)
+                                           for _ in range(3 * 5000)))
+
+    palette = [bytes(rng.getrandbits(8) for _ in range(3))
+               for _ in range(20)]
+
+    return ColorArray.frombuffer(b''.join(rng.choice(palette)
+                                          for _ in range(5000)))
+
+
+def test_oklab_kernels(colors):
+    lab = rgb2oklab_array(colors)
+    lch = rgb2oklch_array(colors)
+
+    for color, values in zip(colors[:500], lab):
+        assert values == pytest.approx(converters.rgb2oklab(*color),
+                                       abs=1e-9)
+
+    assert oklab2rgb_array(lab) == colors
+    assert oklch2rgb_array(lch) == colors
+    assert list(lch.data) == pytest.approx(
+        list(convert_array(lab, 'oklch').data), abs=1e-9)
+
+
+def test_oklab_and_oklch_are_converted_directly():
+    lab = ColorArray('oklab', [0.5, 0.1, -0.05, 0.7, 0.0, 0.0])
+    lch = convert_array(lab, 'oklch')
+
+    # Through 8-bit RGB, the values would be rounded
+    assert list(convert_array(lch, 'oklab').data) == \
+        pytest.approx(list(lab.data), abs=1e-12)
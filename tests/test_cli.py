@@ -0,0 +1,57 @@
+"""Tests of the command-line interface, `python -m dyepy`.
+"""
+
+
+import pytest
+
+from dyepy.__main__ import main
+
+
+# Runs the CLI with *argv*, returns (exit status, stdout, stderr)
+def run(capsys, *argv):
+    status = main(list(argv))
+    captured = capsys.readouterr()
+
+    return status, captured.out, captured.err
+
+
+def test_convert(capsys):
+    assert run(capsys, 'convert', '--to', 'hex', 'red', 'rgb(0, 120, 215)') \
+        == (0, '#ff0000\n#0078d7\n', '')
+
+
+# rgb2hsv and rgb2hsl round the hue and rgb2yiq clamps I and Q
+@pytest.mark.parametrize('space', ['rgb', 'cmyk', 'oklab', 'oklch', 'lab'])
+def test_convert_round_trip(capsys, space):
+    colors = ['#ff0000', '#0078d7', '#30c060', '#000000', '#ffffff']
+    _, out, _ = run(capsys, 'convert', '--from', 'hex', '--to', space,
+                    '--precision', '6', *colors)
+    status, back, err = run(capsys, 'convert', '--from', space, '--to',
+                            'hex', *out.splitlines())
+
+    assert (status, err) == (0, '')
+    assert back.splitlines() == colors
+
+
+def test_yiq_units(capsys):
+    assert run(capsys, 'convert', '--from', 'rgb', '--to', 'yiq',
+               '255,0,0')[1] == 'yiq(76, 153, 54)\n'
+    assert run(capsys, 'convert', '--from', 'yiq', '--to', 'rgb',
+               '76,153,54')[1] == 'rgb(255, 0, 0)\n'
+
+
+def test_convert_errors(capsys):
+    status, out, err = run(capsys, 'convert', 'red', 'nocolor',
+                           'rgb(300, 0, 0)')
+
+    assert status == 1
+    assert out.splitlines() == ['#ff0000', '', '']
+    assert 'unknown color \'nocolor\'' in err
+    assert 'must be ≥ 0 and ≤ 255, not \'300.0\'' in err
+
+
+def test_nearest(capsys):
+    status, out, _ = run(capsys, 'nearest', '#ff0001')
+
+    assert status == 0
+    assert out.split()[0] == 'red'
@@ -0,0 +1,66 @@
+"""Tests of `dyepy.colormap`.
+"""
+
+
+from array import array
+
+import pytest
+
+from dyepy.colormap import Colormap
+
+
+STOPS = ['#000004', '#b73779', '#fcffa4']
+
+
+@pytest.mark.parametrize('size', [2, 256, 1000])
+def test_endpoints(size):
+    cmap = Colormap(STOPS, size, vmin=-5, vmax=5)
+
+    assert cmap.hex([-5, 5]) == ['#000004', '#fcffa4']
+    assert list(cmap.indices([-5, 5])) == [0, size - 1]
+
+
+def test_clamping_and_nan():
+    cmap = Colormap(STOPS, vmin=0, vmax=100)
+
+    assert list(cmap.indices([-1, 101, float('inf'), float('-inf'),
+                              float('nan')])) == [0, 255, 255, 0, 0]
+
+
+def test_rounding():
+    cmap = Colormap(STOPS, 11, vmin=0, vmax=10)
+
+    assert list(cmap.indices([0.49, 0.5, 4.5, 9.6, 10])) == [0, 1, 5, 10, 10]
+
+
+def test_bytes_match_numbers():
+    cmap = Colormap(STOPS, 16, vmin=0, vmax=255)
+    values = bytes(range(256))
+    expected = cmap.indices(list(values))
+
+    for packed in (values, bytearray(values), array('B', values),
+                   memoryview(values)):
+        assert cmap.indices(packed) == expected
+
+    assert list(cmap.rgb(values)) == [cmap.table[index]
+                                      for index in expected]
+    assert list(cmap.rgb(list(values))) == list(cmap.rgb(values))
+
+
+def test_styles():
+    cmap = Colormap(STOPS, vmin=0, vmax=1)
+
+    assert cmap.fg([0]) == ['\x1b[38;2;0;0;4m']
+    assert cmap.bg([1]) == ['\x1b[48;2;252;255;164m']
+
+
+@pytest.mark.parametrize('size, vmin, vmax, error', [
+    (1, 0, 1, ValueError),
+    (65537, 0, 1, ValueError),
+    (2.0, 0, 1, TypeError),
+    (256, 1, 1, ValueError),
+    (256, '0', 1, TypeError),
+])
+def test_bad_arguments(size, vmin, vmax, error):
+    with pytest.raises(error):
+        Colormap(STOPS, size, vmin, vmax)
@@ -0,0 +1,92 @@
+"""Tests of `dyepy.contrast`.
+"""
+
+
+import pytest
+
+from dyepy.contrast import accessible_color, accessible_palette, \
+    contrast_failures, contrast_matrix, contrast_ratio, luminance_array, \
+    relative_luminance, wcag_level
+from dyepy.converters import hex2rgb, rgb2hsl, rgb2oklch
+
+
+@pytest.mark.parametrize('color1, color2, ratio', [
+    ('black', 'white', 21.0),
+    ('#777777', '#ffffff', 4.478),
+    ('#767676', '#ffffff', 4.542),
+    ('#ff0000', '#ffffff', 3.998),
+    ('#0078d7', '#000000', 4.668),
+    ('navy', 'navy', 1.0),
+])
+def test_known_ratios(color1, color2, ratio):
+    assert contrast_ratio(color1, color2) == pytest.approx(ratio, abs=1e-3)
+    assert contrast_ratio(color2, color1) == contrast_ratio(color1, color2)
+
+
+def test_luminance():
+    colors = ['black', 'white', '#808080', (0, 120, 215)]
+
+    assert relative_luminance('black') == 0.0
+    assert relative_luminance('white') == pytest.approx(1.0)
+    assert list(luminance_array(colors)) == \
+        [relative_luminance(color) for color in colors]
+
+
+def test_matrix_and_failures():
+    colors = ['black', 'white', '#777777', '#767676']
+    matrix = contrast_matrix(colors)
+
+    assert [list(row) for row in matrix] == [
+        [pytest.approx(contrast_ratio(color1, color2)) for color2 in colors]
+        for color1 in colors]
+    assert [(i, j) for i, j, _ in contrast_failures(colors)] == \
+        [(1, 2), (2, 3)]
+    assert [(i, j) for i, j, _ in contrast_failures(colors, ['white'],
+                                                    large=True)] == [(1, 0)]
+
+
+@pytest.mark.parametrize('ratio, large, level', [
+    (21, False, 'AAA'), (7.0, False, 'AAA'), (6.99, False, 'AA'),
+    (4.5, False, 'AA'), (4.49, False, None), (4.5, True, 'AAA'),
+    (3.0, True, 'AA'), (2.99, True, None),
+])
+def test_wcag_level(ratio, large, level):
+    assert wcag_level(ratio, large) == level
+
+
+@pytest.mark.parametrize('space', ['oklch', 'hsl'])
+@pytest.mark.parametrize('target', [3, 4.5, 7])
+@pytest.mark.parametrize('color, background', [
+    ('#1d9bf0', 'white'), ('#f91880', '#15202b'), ('#808080', '#333333'),
+    ('#ffff00', 'white'), ('#000080', 'black'),
+])
+def test_accessible_color_meets_its_target(color, background, target,
+                                           space):
+    result = accessible_color(color, background, target, space)
+
+    assert contrast_ratio(result, background) >= target
+
+    if contrast_ratio(color, background) >= target:
+        assert result == color
+
+
+@pytest.mark.parametrize('space, convert', [
+    ('oklch', rgb2oklch), ('hsl', rgb2hsl),
+])
+def test_accessible_color_keeps_the_hue(space, convert):
+    result = accessible_color('#1d9bf0', 'white', 4.5, space)
+    hue = convert(*hex2rgb('#1d9bf0'))[-1 if space == 'oklch' else 0]
+    new_hue = convert(*hex2rgb(result))[-1 if space == 'oklch' else 0]
+
+    assert result != '#1d9bf0'
+    assert new_hue == pytest.approx(hue, abs=5)
+
+
+def test_unreachable_and_palettes():
+    assert accessible_color('#808080', '#808080', 21) is None
+    assert accessible_palette(['#1d9bf0'], ['white', 'black']) == \
+        [[accessible_color('#1d9bf0', 'white'),
+          accessible_color('#1d9bf0', 'black')]]
+
+    with pytest.raises(ValueError, match='\'target\' must be ≥ 1'):
+        accessible_color('red', 'white', 0.5)
@@ -0,0 +1,86 @@
+"""Tests of `dyepy.csvconvert`.
+"""
+
+
+import pytest
+
+from dyepy.csvconvert import convert_csv
+
+
+def test_columns_are_added(tmp_path):
+    source = tmp_path / 'colors.csv'
+    source.write_bytes(b'id,color\r\n1,red\r\n2,\r\n3,"rgb(0, 120, 215)"\r\n')
+    output = tmp_path / 'out.csv'
+
+    assert convert_csv(str(source), str(output), ['color'], ['hex', 'hsl'],
+                       workers=1) == 3
+    assert output.read_bytes() == (
+        b'id,color,color_hex,color_hsl_h,color_hsl_s,color_hsl_l\r\n'
+        b'1,red,#ff0000,0.0,1.0,0.5\r\n'
+        b'2,,,,,\r\n'
+        b'3,"rgb(0, 120, 215)",#0078d7,207.0,1.0,0.4216\r\n')
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_chunks_keep_the_order(tmp_path, workers):
+    source = tmp_path / 'colors.tsv'
+    source.write_text('c\n' + ''.join(f'#{n:06x}\n' for n in range(500)))
+    output = tmp_path / 'out.tsv'
+
+    assert convert_csv(str(source), str(output), ['c'], ['rgb'],
+                       workers=workers, chunk_size=256) == 500
+    assert output.read_text().splitlines()[1:] == [
+        f'#{n:06x}\t0\t{n >> 8}\t{n & 255}' for n in range(500)]
+
+
+@pytest.mark.parametrize('value, message', [
+    ('"rgb(300, 0, 0)"', 'row 3: column \'color\': \'color_value\' must '
+                         'be ≥ 0 and ≤ 255, not \'300.0\''),
+    ('nocolor', 'row 3: column \'color\': unknown color \'nocolor\''),
+])
+@pytest.mark.parametrize('workers', [1, 2])
+def test_invalid_values(tmp_path, value, message, workers):
+    source = tmp_path / 'colors.csv'
+    source.write_text(f'color\nred\n{value}\n')
+
+    with pytest.raises(ValueError, match='^' + message):
+        convert_csv(str(source), str(tmp_path / 'out.csv'), ['color'],
+                    workers=workers)
+
+
+def test_unknown_column(tmp_path):
+    source = tmp_path / 'colors.csv'
+    source.write_text('color\nred\n')
+
+    with pytest.raises(ValueError, match='no column \'fg\''):
+        convert_csv(str(source), str(tmp_path / 'out.csv'), ['fg'])
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_row_numbers_across_chunks(tmp_path, workers):
+    source = tmp_path / 'colors.csv'
+    source.write_text('id,color\n' + ''.join(f'{n},#{n:06x}\n'
+                                              for n in range(200))
+                      + '\n200\n')
+
+    with pytest.raises(ValueError, match='^row 203: no column \'color\''):
+        convert_csv(str(source), str(tmp_path / 'out.csv'), ['color'],
+                    workers=workers, chunk_size=64)
+
+    source.write_text('id,color\n' + ''.join(f'{n},#{n:06x}\n'
+                                              for n in range(200))
+                      + '200,nocolor\n')
+
+    with pytest.raises(ValueError, match='^row 202: column \'color\': '
+                                         'unknown color'):
+        convert_csv(str(source), str(tmp_path / 'out.csv'), ['color'],
+                    workers=workers, chunk_size=64)
+
+
+def test_empty_rows_and_paths(tmp_path):
+    source = tmp_path / 'colors.tsv'
+    source.write_text('c\nred\n\nblue\n\n')
+    output = tmp_path / 'out.tsv'
+
+    assert convert_csv(source, output, ['c'], workers=1) == 2
+    assert output.read_text() == 'c\tc_hex\nred\t#ff0000\nblue\t#0000ff\n'
@@ -0,0 +1,65 @@
+"""Tests of `dyepy.cvd`.
+"""
+
+
+import random
+from operator import sub
+
+import pytest
+
+from dyepy.batch import ColorArray
+from dyepy.converters import _SRGB_TO_LINEAR, _linear2srgb
+from dyepy.cvd import CVD_MATRICES, cvd_distinguishable, cvd_matrix, \
+    simulate_cvd
+
+
+# Every 8-bit value in every channel, then random colors
+PIXELS = bytes(value for value in range(256) for _ in range(3)) + \
+    bytes(random.Random(7).randrange(256) for _ in range(3000))
+
+
+@pytest.mark.parametrize('deficiency', list(CVD_MATRICES))
+def test_severity_0_is_the_identity(deficiency):
+    assert cvd_matrix(deficiency, 0) == ((1, 0, 0), (0, 1, 0), (0, 0, 1))
+    assert simulate_cvd(PIXELS, deficiency, 0).tobytes() == PIXELS
+
+
+@pytest.mark.parametrize('deficiency', list(CVD_MATRICES))
+def test_grays_stay_gray(deficiency):
+    grays = PIXELS[:768]
+    simulated = simulate_cvd(grays, deficiency)
+
+    for value, color in zip(range(256), simulated):
+        assert max(abs(channel - value) for channel in color) <= 1
+
+
+@pytest.mark.parametrize('severity', [0.25, 0.5, 1.0])
+def test_matches_the_matrix(severity):
+    matrix = cvd_matrix('deutan', severity)
+    colors = ColorArray.frombuffer(PIXELS[768:])
+
+    for color, simulated in zip(colors, simulate_cvd(colors, 'deutan',
+                                                     severity)):
+        linear = [_SRGB_TO_LINEAR[value] for value in color]
+        expected = [
+            round(255 * _linear2srgb(min(max(sum(
+                weight * value for weight, value in zip(row, linear)), 0),
+                1)))
+            for row in matrix]
+
+        assert max(map(abs, map(sub, simulated, expected))) <= 1
+
+
+def test_distinguishable():
+    assert cvd_distinguishable(['#0000ff', '#ffff00'])
+    assert not cvd_distinguishable(['#ff0000', '#ff4000'], 'protan')
+
+
+@pytest.mark.parametrize('deficiency, severity, error', [
+    ('deuteranopia', 1.0, ValueError),
+    ('protan', 1.5, ValueError),
+    ('protan', '1', TypeError),
+])
+def test_bad_arguments(deficiency, severity, error):
+    with pytest.raises(error):
+        cvd_matrix(deficiency, severity)
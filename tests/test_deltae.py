@@ -0,0 +1,109 @@
+"""Tests of `dyepy.deltae`.
+"""
+
+
+import pytest
+
+from dyepy.batch import ColorArray
+from dyepy.deltae import _ciede2000, delta_e, delta_e_matrix, \
+    delta_e_nearest, delta_e_one_to_many, named_palette
+
+
+# The CIEDE2000 test data of Sharma, Wu and Dalal (2005):
+# (L, a, b of the first color, of the second one, Delta E)
+SHARMA = [
+    ((50.0, 2.6772, -79.7751), (50.0, 0.0, -82.7485), 2.0425),
+    ((50.0, 3.1571, -77.2803), (50.0, 0.0, -82.7485), 2.8615),
+    ((50.0, 2.8361, -74.02), (50.0, 0.0, -82.7485), 3.4412),
+    ((50.0, -1.3802, -84.2814), (50.0, 0.0, -82.7485), 1.0),
+    ((50.0, -1.1848, -84.8006), (50.0, 0.0, -82.7485), 1.0),
+    ((50.0, -0.9009, -85.5211), (50.0, 0.0, -82.7485), 1.0),
+    ((50.0, 0.0, 0.0), (50.0, -1.0, 2.0), 2.3669),
+    ((50.0, -1.0, 2.0), (50.0, 0.0, 0.0), 2.3669),
+    ((50.0, 2.49, -0.001), (50.0, -2.49, 0.0009), 7.1792),
+    ((50.0, 2.49, -0.001), (50.0, -2.49, 0.001), 7.1792),
+    ((50.0, 2.49, -0.001), (50.0, -2.49, 0.0011), 7.2195),
+    ((50.0, 2.49, -0.001), (50.0, -2.49, 0.0012), 7.2195),
+    ((50.0, -0.001, 2.49), (50.0, 0.0009, -2.49), 4.8045),
+    ((50.0, -0.001, 2.49), (50.0, 0.001, -2.49), 4.8045),
+    ((50.0, -0.001, 2.49), (50.0, 0.0011, -2.49), 4.7461),
+    ((50.0, 2.5, 0.0), (50.0, 0.0, -2.5), 4.3065),
+    ((50.0, 2.5, 0.0), (73.0, 25.0, -18.0), 27.1492),
+    ((50.0, 2.5, 0.0), (61.0, -5.0, 29.0), 22.8977),
+    ((50.0, 2.5, 0.0), (56.0, -27.0, -3.0), 31.903),
+    ((50.0, 2.5, 0.0), (58.0, 24.0, 15.0), 19.4535),
+    ((50.0, 2.5, 0.0), (50.0, 3.1736, 0.5854), 1.0),
+    ((50.0, 2.5, 0.0), (50.0, 3.2972, 0.0), 1.0),
+    ((50.0, 2.5, 0.0), (50.0, 1.8634, 0.5757), 1.0),
+    ((50.0, 2.5, 0.0), (50.0, 3.2592, 0.335), 1.0),
+    ((60.2574, -34.0099, 36.2677), (60.4626, -34.1751, 39.4387), 1.2644),
+    ((63.0109, -31.0961, -5.8663), (62.8187, -29.7946, -4.0864), 1.263),
+    ((61.2901, 3.7196, -5.3901), (61.4292, 2.248, -4.962), 1.8731),
+    ((35.0831, -44.1164, 3.7933), (35.0232, -40.0716, 1.5901), 1.8645),
+    ((22.7233, 20.0904, -46.694), (23.0331, 14.973, -42.5619), 2.0373),
+    ((36.4612, 47.858, 18.3852), (36.2715, 50.5065, 21.2231), 1.4146),
+    ((90.8027, -2.0831, 1.441), (91.1528, -1.6435, 0.0447), 1.4441),
+    ((90.9257, -0.5406, -0.9208), (88.6381, -0.8985, -0.7239), 1.5381),
+    ((6.7747, -0.2908, -2.4247), (5.8714, -0.0985, -2.2286), 0.6377),
+    ((2.0776, 0.0795, -1.135), (0.9033, -0.0636, -0.5514), 0.9082),
+]
+
+
+@pytest.mark.parametrize('lab1, lab2, expected', SHARMA)
+def test_ciede2000_sharma(lab1, lab2, expected):
+    for first, second in ((lab1, lab2), (lab2, lab1)):
+        lightness, a, b = first
+        distance = _ciede2000(lightness, a, b, *zip(second))[0]
+
+        assert distance == pytest.approx(expected, abs=5e-5)
+
+
+def test_ciede2000_sharma_in_batches():
+    first = ColorArray('lab', [value for lab, _, _ in SHARMA
+                               for value in lab])
+    second = ColorArray('lab', [value for _, lab, _ in SHARMA
+                                for value in lab])
+    matrix = {}
+
+    for row, column, block in delta_e_matrix(first, second, tile=8):
+        for i, distances in enumerate(block, row):
+            for j, distance in enumerate(distances, column):
+                matrix[i, j] = distance
+
+    assert [matrix[i, i] for i in range(len(SHARMA))] == \
+        pytest.approx([expected for _, _, expected in SHARMA], abs=5e-5)
+
+
+@pytest.mark.parametrize('method', ['cie76', 'cie94', 'ciede2000'])
+def test_same_color(method):
+    assert delta_e('#0078d7', (0, 120, 215), method) == 0
+
+
+def test_one_to_many_and_nearest():
+    colors = ['#ff0000', '#00ff00', '#0000ff', '#fe0101', '#808080']
+    palette = ['#000000', '#ffffff', '#ff0000', '#00ff00', '#0000ff']
+    indexes, distances = delta_e_nearest(colors, palette)
+
+    for color, index, distance in zip(colors, indexes, distances):
+        row = delta_e_one_to_many(color, palette)
+
+        assert distance == min(row)
+        assert index == list(row).index(min(row))
+
+    assert list(indexes[:4]) == [2, 3, 4, 2]
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        delta_e('red', 'blue', 'cie2001')
+
+
+def test_named_palette():
+    names, codes = named_palette('css')
+
+    assert len(names) == len(set(codes)) == len(codes)
+    assert codes[names.index('red')] == '#ff0000'
+    assert named_palette('xterm')[0][:3] == ('0', '1', '2')
+
+    with pytest.raises(ValueError, match='unknown palette \'nope\''):
+        named_palette('nope')
@@ -0,0 +1,173 @@
+"""Tests of `dyepy.dither`.
+"""
+
+
+import random
+
+import pytest
+
+from dyepy.batch import ColorArray
+from dyepy.dither import XTERM_PALETTE, PaletteIndex, floyd_steinberg, \
+    ordered_dither
+
+
+# Index of the palette color nearest to *color*, comparing all of them
+def brute_force(palette, color):
+    distances = [sum((x - y) ** 2 for x, y in zip(color, entry))
+                 for entry in palette]
+
+    return distances.index(min(distances))
+
+
+# Floyd-Steinberg as usually written: a whole image of float pixels,
+# the error off the edges of the image being dropped
+def reference_floyd_steinberg(rows, width, palette):
+    pixels = [[list(row[x * 3:x * 3 + 3]) for x in range(width)]
+              for row in rows]
+    out = []
+
+    for y, row in enumerate(pixels):
+        indexes = bytearray()
+
+        for x, pixel in enumerate(row):
+            pixel = [min(255, max(0, value)) for value in pixel]
+            index = brute_force(palette, pixel)
+            error = [value - entry
+                     for value, entry in zip(pixel, palette[index])]
+            indexes.append(index)
+
+            for dx, dy, weight in ((1, 0, 7), (-1, 1, 3), (0, 1, 5),
+                                   (1, 1, 1)):
+                if 0 <= x + dx < width and y + dy < len(pixels):
+                    target = pixels[y + dy][x + dx]
+
+                    for channel in range(3):
+                        target[channel] += error[channel] * weight / 16
+
+        out.append(bytes(indexes))
+
+    return out
+
+
+# Squared distance between two colors
+def distance(color, other):
+    return sum((x - y) ** 2 for x, y in zip(color, other))
+
+
+@pytest.mark.parametrize('size', [1, 2, 16, 256])
+def test_nearest_is_the_brute_force_one(size):
+    rng = random.Random(size)
+    palette = [tuple(rng.randrange(256) for _ in range(3))
+               for _ in range(size)]
+    index = PaletteIndex(palette)
+    points = [tuple(rng.randrange(256) for _ in range(3))
+              for _ in range(500)]
+    # Cell edges, and floats just below them (errors of dithering)
+    points += [(value, 255 - value, value) for value in range(0, 256, 15)]
+    points += [(value + 0.999, value, 0.5) for value in range(15, 255, 16)]
+
+    for point in points:
+        # Ties may be broken either way: compare the distances
+        assert distance(point, palette[index.nearest(*point)]) == \
+            distance(point, palette[brute_force(palette, point)])
+
+
+def test_xterm_palette():
+    index = PaletteIndex(XTERM_PALETTE)
+    colors = list(index.palette)
+    rng = random.Random(256)
+
+    for _ in range(500):
+        point = tuple(rng.randrange(256) for _ in range(3))
+
+        assert distance(point, colors[index.nearest(*point)]) == \
+            distance(point, colors[brute_force(colors, point)])
+
+
+def test_map_row():
+    index = PaletteIndex(['#000000', '#ffffff', '#ff0000'])
+
+    assert index.map_row(b'\x10\x10\x10\xf0\xf0\xf0\xc8\x1e\x28') == \
+        b'\x00\x01\x02'
+    assert index.rgb_row(b'\x02\x00') == b'\xff\x00\x00\x00\x00\x00'
+
+
+@pytest.mark.parametrize('palette', [[], ['#000000'] * 257])
+def test_palette_size(palette):
+    with pytest.raises(ValueError):
+        PaletteIndex(palette)
+
+
+BLACK_WHITE = [(0, 0, 0), (255, 255, 255)]
+
+
+@pytest.mark.parametrize('width', [1, 2, 7])
+def test_floyd_steinberg_is_the_reference(width):
+    rng = random.Random(width)
+    palette = BLACK_WHITE + [(255, 0, 0), (0, 0, 255)]
+    rows = [bytes(rng.randrange(256) for _ in range(width * 3))
+            for _ in range(6)]
+
+    assert list(floyd_steinberg(rows, width, palette)) == \
+        reference_floyd_steinberg(rows, width, palette)
+
+
+def test_floyd_steinberg_keeps_the_mean():
+    rows = [bytes([64] * 16 * 3)] * 64
+    indexes = b''.join(floyd_steinberg(rows, 16, BLACK_WHITE))
+
+    assert sum(indexes) / len(indexes) == pytest.approx(64 / 255, abs=0.02)
+
+
+def test_floyd_steinberg_edges():
+    # The last pixel of the first row (120, black) sends 3/16 of its
+    # error to the first pixel of the next row (100 + 22.5: black);
+    # its 7/16 for the right must not wrap there too (it would be white)
+    rows = [b'\x00\x00\x00\x78\x78\x78', b'\x64\x64\x64\x00\x00\x00']
+
+    assert list(floyd_steinberg(rows, 2, BLACK_WHITE)) == \
+        [b'\x00\x00', b'\x00\x00'] == \
+        reference_floyd_steinberg(rows, 2, BLACK_WHITE)
+
+
+@pytest.mark.parametrize('dither', [floyd_steinberg, ordered_dither])
+def test_palette_images_are_unchanged(dither):
+    rng = random.Random(30)
+    width = 9
+    expected = [bytes(rng.randrange(256) for _ in range(width))
+                for _ in range(5)]
+    colors = [PaletteIndex(XTERM_PALETTE).colors[index]
+              for row in expected for index in row]
+    rows = [ColorArray('rgb', [value for color in colors[y * width:
+                                                         (y + 1) * width]
+                               for value in color])
+            for y in range(len(expected))]
+
+    # Thresholds within half the distance of the closest colors (3)
+    options = {'spread': 2} if dither is ordered_dither else {}
+    index = PaletteIndex(XTERM_PALETTE)
+
+    # The palette repeats some colors: compare colors, not indexes
+    assert [index.rgb_row(row) for row in dither(rows, width, index,
+                                                 **options)] == \
+        [index.rgb_row(row) for row in expected]
+
+
+@pytest.mark.parametrize('size', [2, 4, 8])
+def test_ordered_dither_pattern(size):
+    rows = [bytes([128] * size * 3)] * size
+    indexes = list(ordered_dither(rows, size, BLACK_WHITE, size, 255))
+
+    # Half of the thresholds of the matrix are under mid-gray
+    assert sum(map(sum, indexes)) == size * size // 2
+
+
+def test_dither_errors():
+    with pytest.raises(ValueError):
+        next(ordered_dither([b'\0\0\0'], 1, size=3))
+
+    with pytest.raises(ValueError):
+        next(floyd_steinberg([b'\0\0\0'], 2))
+
+    with pytest.raises(TypeError):
+        next(floyd_steinberg([b'\0\0\0'], 1.0))
@@ -0,0 +1,42 @@
+"""Tests of `dyepy.gradient`.
+"""
+
+
+import random
+
+import pytest
+
+from dyepy.batch import _SPACES
+from dyepy.gradient import Gradient
+
+
+@pytest.mark.parametrize('space', sorted(_SPACES))
+def test_stops_are_reproduced(space):
+    rng = random.Random(31)
+
+    for _ in range(100):
+        stops = [f'#{rng.getrandbits(24):06x}' for _ in range(3)]
+        samples = Gradient(stops, space).hex(5)
+
+        assert samples[0::2] == tuple(stops)
+
+
+@pytest.mark.parametrize('space', sorted(_SPACES))
+def test_stops_at_positions(space):
+    gradient = Gradient(['#ff0000', '#0000ff', '#30c060'], space,
+                        positions=[0, 0.25, 1])
+
+    assert gradient(0) == '#ff0000'
+    assert gradient(0.25) == '#0000ff'
+    assert gradient(1) == '#30c060'
+
+
+def test_yiq_keeps_the_sign_of_i_and_q():
+    samples = Gradient(['#ff0000', '#0000ff', '#30c060'], 'yiq').hex(5)
+
+    assert samples == ('#ff0000', '#800080', '#0000ff', '#1860b0', '#30c060')
+
+
+def test_unknown_space():
+    with pytest.raises(ValueError):
+        Gradient(['red', 'blue'], 'xyz')
@@ -0,0 +1,72 @@
+"""Tests of `dyepy.heatmap`.
+"""
+
+
+import io
+import re
+
+import pytest
+
+from dyepy.colormap import Colormap
+from dyepy.heatmap import HEATMAP_STOPS, heatmap, render_heatmap
+from dyepy.styles import Styles
+
+
+# Returns the lines of a heatmap as lists of (escape, number of blanks)
+def cells(text, cell=2):
+    assert text.endswith(Styles.RESET + '\n')
+
+    return [[(escape, len(blanks) // cell) for escape, blanks in
+             re.findall(r'(\x1b\[48;[25];[0-9;]+m)( *)', line)]
+            for line in text[:-1].split(Styles.RESET + '\n')]
+
+
+def test_cells_and_runs():
+    cmap = Colormap(HEATMAP_STOPS, vmin=0, vmax=2)
+    first, last = cmap.bg([0, 2])
+    lines = cells(render_heatmap([[0, 0, 2], [2, 2, 2]], size=(80, 24)))
+
+    assert lines == [[(first, 2), (last, 1)], [(last, 3)]]
+
+
+def test_constant_and_nan():
+    first = Colormap(HEATMAP_STOPS).bg([0])[0]
+
+    assert cells(render_heatmap([[5, 5], [5, float('nan')]],
+                                size=(80, 24), cell=1), 1) == \
+        [[(first, 2)], [(first, 2)]]
+
+
+@pytest.mark.parametrize('reduce, expected', [
+    ('mean', [[2.5, 4.5], [10.5, 12.5]]),
+    ('max', [[5, 7], [13, 15]]),
+])
+def test_downsampling(reduce, expected):
+    matrix = [list(range(row, row + 4)) for row in range(0, 16, 4)]
+    cmap = Colormap(HEATMAP_STOPS, vmin=0, vmax=15)
+    lines = cells(render_heatmap(matrix, cmap, size=(4, 2), reduce=reduce))
+
+    assert lines == [[(escape, 1) for escape in cmap.bg(row)]
+                     for row in expected]
+
+
+def test_256_colors():
+    text = render_heatmap([[0, 1]], size=(80, 24), truecolor=False)
+
+    assert re.fullmatch(r'(\x1b\[48;5;\d+m  )+', text.split(Styles.RESET)[0])
+
+
+def test_heatmap_writes_the_rendering():
+    file = io.StringIO()
+    matrix = [[1, 2, 3], [4, 5, 6]]
+    heatmap(matrix, ['navy', 'crimson'], size=(10, 5), file=file)
+
+    assert file.getvalue() == render_heatmap(matrix, ['navy', 'crimson'],
+                                             size=(10, 5))
+
+
+def test_empty_and_ragged():
+    assert render_heatmap([]) == render_heatmap([[]]) == ''
+
+    with pytest.raises(ValueError, match='same length'):
+        render_heatmap([[1, 2], [3]])
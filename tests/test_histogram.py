@@ -0,0 +1,71 @@
+"""Tests of `dyepy.histogram`.
+"""
+
+
+import random
+from array import array
+from collections import Counter
+
+import pytest
+
+from dyepy.batch import ColorArray
+from dyepy.histogram import ColorHistogram, top_colors
+
+
+# Returns random packed colors, some of them frequent, and their counts
+def packed_colors(count=3000):
+    rng = random.Random(count)
+    values = [rng.choice([0xff0000, 0x0078d7, 0x000000, 0x000001])
+              if rng.random() < 0.3 else rng.randrange(1 << 24)
+              for _ in range(count)]
+
+    return array('I', values), Counter(values)
+
+
+# Returns the expected `top` of *counts* (ties: smallest color first)
+def expected_top(counts, k):
+    best = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+
+    return [('#%06x' % value, count) for value, count in best[:k]]
+
+
+def test_top_colors_counts():
+    packed, counts = packed_colors()
+    pixels = ColorArray.frompacked(packed)
+
+    for values in (packed, pixels, pixels.tobytes(), pixels.hex()):
+        assert top_colors(values, 6) == expected_top(counts, 6)
+
+
+def test_ties_and_short_histograms():
+    pixels = ['#000002', '#000001', '#000002', '#000001', 'red']
+
+    assert top_colors(pixels, 2) == [('#000001', 2), ('#000002', 2)]
+    assert top_colors(pixels, 10) == [('#000001', 2), ('#000002', 2),
+                                      ('#ff0000', 1)]
+    assert top_colors([], 3) == []
+
+
+def test_sparse_and_dense_agree():
+    packed, counts = packed_colors()
+    histogram = ColorHistogram(dense_after=2000).feed(packed[:1000])
+    other = ColorHistogram().feed(packed[1000:])
+
+    assert not histogram.dense and not other.dense
+
+    # The merged colors are too many for a sparse histogram
+    histogram.merge(other)
+
+    assert histogram.dense
+    assert histogram.total == 3000 and len(histogram) == len(counts)
+    assert histogram['#ff0000'] == counts[0xff0000]
+    assert dict(histogram.items()) == counts
+    assert histogram.top(5) == expected_top(counts, 5)
+
+
+def test_bad_input():
+    with pytest.raises(ValueError, match='multiple of 3'):
+        ColorHistogram().feed(b'\0\0')
+
+    with pytest.raises(TypeError):
+        ColorHistogram().top(2.0)
@@ -0,0 +1,88 @@
+"""Tests of `dyepy.imageconvert`.
+"""
+
+
+import random
+
+import pytest
+
+from dyepy.batch import _yiq2rgb_exact
+from dyepy.imageconvert import PLANES, convert_image
+from dyepy.netpbm import read_pnm, write_pnm
+
+
+# A function to write a random RGB image and return its path and pixels
+def _image(tmp_path, width=13, height=7):
+    rng = random.Random(width * height)
+    pixels = [tuple(rng.randrange(256) for _ in range(3))
+              for _ in range(width * height)]
+    rows = [[value for pixel in pixels[start:start + width]
+             for value in pixel]
+            for start in range(0, len(pixels), width)]
+    path = tmp_path / 'image.ppm'
+
+    with open(path, 'wb') as file:
+        write_pnm(file, rows, width, height)
+
+    return path, pixels
+
+
+# A function to read the samples of the planes at some paths
+def _planes(paths):
+    planes = []
+
+    for path in paths:
+        with read_pnm(path) as image:
+            planes.append(list(image.samples()))
+
+    return planes
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+@pytest.mark.parametrize('image_format', ['pgm', 'png'])
+def test_rgb_planes_round_trip(tmp_path, workers, image_format):
+    path, pixels = _image(tmp_path)
+    paths = convert_image(path, tmp_path / 'out', 'rgb', tile=4,
+                          workers=workers, image_format=image_format)
+
+    assert paths == [f'{tmp_path / "out"}.{name}.{image_format}'
+                     for name in 'rgb']
+
+    if image_format == 'pgm':
+        assert list(zip(*_planes(paths))) == pixels
+
+
+def test_yiq_planes_keep_negative_i_and_q(tmp_path):
+    path, pixels = _image(tmp_path)
+    paths = convert_image(path, tmp_path / 'out', 'yiq', tile=4, workers=1,
+                          depth=16)
+    maxval = 65535
+    values = [[low + sample * (high - low) / maxval for sample in plane]
+              for plane, (_, low, high) in zip(_planes(paths),
+                                                PLANES['yiq'])]
+
+    assert min(values[1]) < 0 and min(values[2]) < 0
+
+    for pixel, yiq in zip(pixels, zip(*values)):
+        assert _yiq2rgb_exact(*yiq) == pytest.approx(pixel, abs=0.1)
+
+
+def test_yiq_extremes_fit_the_planes(tmp_path):
+    path = tmp_path / 'image.ppm'
+
+    with open(path, 'wb') as file:
+        write_pnm(file, [[255, 0, 0, 0, 255, 255, 255, 0, 255, 0, 255, 0]],
+                  4, 1)
+
+    paths = convert_image(path, tmp_path / 'out', 'yiq', workers=1)
+    _, i, q = _planes(paths)
+
+    # Red and cyan span I, magenta and green span Q, around the middle
+    assert (i[0], i[1], q[2], q[3]) == (255, 0, 255, 0)
+
+
+def test_bad_image_format(tmp_path):
+    path, _ = _image(tmp_path)
+
+    with pytest.raises(ValueError, match='image_format'):
+        convert_image(path, tmp_path / 'out', 'rgb', image_format='jpg')
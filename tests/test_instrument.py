@@ -0,0 +1,93 @@
+"""Tests of `dyepy.instrument`.
+"""
+
+
+import sys
+from inspect import getattr_static
+from types import FunctionType
+
+import pytest
+
+import dyepy.batch
+import dyepy.converters
+from dyepy import instrument
+from dyepy.styles import Styles
+
+
+# Leaves the functions unwrapped and the counts at 0 after each test
+@pytest.fixture(autouse=True)
+def restore():
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+# Returns {(module, global, key): function} of every loaded dyepy module
+def functions():
+    found = {}
+
+    for name, module in list(sys.modules.items()):
+        if module is None or not (name == 'dyepy'
+                                  or name.startswith('dyepy.')):
+            continue
+
+        for attribute, value in vars(module).items():
+            if isinstance(value, FunctionType):
+                found[name, attribute, None] = value
+
+            elif isinstance(value, dict):
+                found.update(((name, attribute, key), item)
+                             for key, item in value.items()
+                             if isinstance(item, FunctionType))
+
+    for kind in (Styles.Foreground, Styles.Background):
+        for attribute in ('n', 'rgb'):
+            found[kind.__name__, attribute, None] = \
+                getattr_static(kind, attribute)
+
+    return found
+
+
+def test_disable_restores_the_original_functions():
+    before = functions()
+    instrument.enable()
+
+    assert instrument.is_enabled()
+    assert dyepy.converters.rgb2hsl is not before[
+        'dyepy.converters', 'rgb2hsl', None]
+
+    instrument.enable()  # Does nothing while enabled
+    instrument.disable()
+    after = functions()
+
+    assert not instrument.is_enabled()
+    assert after.keys() == before.keys()
+    assert all(after[key] is function for key, function in before.items())
+
+
+def test_calls_are_counted():
+    instrument.enable()
+    dyepy.converters.rgb2hsl(0, 120, 215)
+    dyepy.batch.as_rgb('hsl(207, 1, 0.42)')  # Through a dispatch dict
+    Styles.Fg.rgb(1, 2, 3)
+
+    with pytest.raises(ValueError):
+        dyepy.converters.hex2rgb('#zz')
+
+    stats = instrument.snapshot()
+
+    assert stats['rgb2hsl']['calls'] == 1
+    assert stats['hex2rgb']['errors'] == 1
+    assert stats['hsl2rgb']['calls'] == 1
+    assert stats['Styles.Fg.rgb']['calls'] == 1
+    assert 0 <= stats['rgb2hsl']['max'] <= stats['rgb2hsl']['total']
+
+    # Counts are kept when disabled, not after `reset`
+    instrument.disable()
+    dyepy.converters.rgb2hsl(0, 0, 0)
+
+    assert instrument.snapshot()['rgb2hsl']['calls'] == 1
+
+    instrument.reset()
+
+    assert instrument.snapshot() == {}
@@ -0,0 +1,69 @@
+"""Tests of `dyepy.jsonl`.
+"""
+
+
+import io
+
+import pytest
+
+from dyepy.jsonl import convert_jsonl
+
+
+# Converts the JSON lines *text*, returns the output text
+def convert(text, *args, **kwargs):
+    output = io.BytesIO()
+    convert_jsonl(io.BytesIO(text.encode()), output, *args, **kwargs)
+
+    return output.getvalue().decode()
+
+
+def test_fields_are_appended():
+    text = '{"id": 1, "rgb": [0, 120, 215]}\n\n{"rgb": "red", "x": {}}\n'
+
+    assert convert(text, 'rgb', ('hex', ('l', 'hsl'))) == \
+        '{"id": 1, "rgb": [0, 120, 215], "hex": "#0078d7", ' \
+        '"l": [207.0, 1.0, 0.4216]}\n' \
+        '{"rgb": "red", "x": {}, "hex": "#ff0000", "l": [0.0, 1.0, 0.5]}\n'
+
+
+def test_batches_and_cache():
+    lines = [f'{{"c": [{n % 7}, {n % 5}, 0]}}' for n in range(100)]
+    expected = [f'{line[:-1]}, "hex": "#{n % 7:02x}{n % 5:02x}00"}}'
+                for n, line in enumerate(lines)]
+
+    assert convert('\n'.join(lines), 'c', batch_size=8).splitlines() == \
+        expected
+
+
+@pytest.mark.parametrize('record, message', [
+    ('{"rgb": [300, 0, 0]}', 'record 2: \'color_value\' must be ≥ 0 and '
+                             '≤ 255, not \'300\''),
+    ('{"rgb": [-1, 0, 0]}', 'record 2: \'color_value\' must be ≥ 0'),
+    ('{"rgb": "nocolor"}', 'record 2: unknown color \'nocolor\''),
+    ('{"color": "red"}', 'record 2: no field \'rgb\''),
+    ('{"rgb": ', 'record 2: '),
+])
+def test_invalid_records(record, message):
+    with pytest.raises(ValueError, match='^' + message):
+        convert('{"rgb": [0, 0, 0]}\n' + record + '\n')
+
+
+@pytest.mark.parametrize('lines, message', [
+    (['{"rgb": [0, 0, 0]}, {"rgb": [1, 1, 1]}'], 'record 2: Extra data'),
+    (['{"rgb": [0,', '0, 0]}'], 'record 2: '),
+    (['[{"rgb": [0, 0, 0]}]'], 'record 2: not a JSON object'),
+])
+def test_lines_not_one_object(lines, message):
+    with pytest.raises(ValueError, match='^' + message):
+        convert('\n'.join(['{"rgb": [0, 0, 0]}'] + lines) + '\n')
+
+
+@pytest.mark.parametrize('other', ['[4, 5, 6]', '"#fff"'])
+def test_channel_types_like_as_rgb(other):
+    # Bools are rejected and floats rounded, whatever the other records
+    with pytest.raises(ValueError, match='^record 1: \'True\' must be of '
+                                         'type \'int\' or \'float\''):
+        convert('{"rgb": [true, 2, 3]}\n{"rgb": ' + other + '}\n')
+
+    assert convert('{"rgb": [1.4, 2, 3]}\n{"rgb": ' + other + '}\n') \
+        .splitlines()[0] == '{"rgb": [1.4, 2, 3], "hex": "#010203"}'
@@ -0,0 +1,71 @@
+"""Tests of `dyepy.kmeans`.
+"""
+
+
+import random
+
+import pytest
+
+from dyepy.kmeans import KMeans, kmeans_palette
+
+
+# Pixels scattered around *centers*, *count* of each
+def clusters(centers, count, spread=6, seed=29):
+    rng = random.Random(seed)
+
+    return [tuple(min(255, max(0, value + rng.randint(-spread, spread)))
+                  for value in center)
+            for center in centers for _ in range(count)]
+
+
+CENTERS = [(200, 30, 40), (20, 180, 60), (30, 40, 210)]
+
+
+@pytest.mark.parametrize('space', ['rgb', 'lab'])
+def test_separated_clusters_are_found(space):
+    pixels = clusters(CENTERS, 300) + clusters(CENTERS[:1], 100)
+    model = KMeans(3, space, seed=1).fit(pixels)
+
+    assert model.counts == [400, 300, 300]
+
+    assert model.rgb()[0] == pytest.approx(CENTERS[0], abs=3)
+
+    # The clusters of 300 pixels may come in either order
+    for center in CENTERS:
+        assert any(color == pytest.approx(center, abs=3)
+                   for color in model.rgb())
+
+
+def test_workers_give_the_same_palette():
+    pixels = clusters(CENTERS, 200, spread=40)
+
+    assert kmeans_palette(pixels, 4, workers=2, seed=5) == \
+        kmeans_palette(pixels, 4, workers=1, seed=5)
+
+
+def test_fewer_colors_than_centers():
+    model = KMeans(5, seed=0).fit(['#ff0000'] * 3 + ['#0000ff'])
+
+    assert model.hex() == ['#ff0000', '#0000ff']
+    assert model.counts == [3, 1]
+
+
+@pytest.mark.parametrize('arguments, error', [
+    ({'k': 0}, ValueError),
+    ({'k': 2.0}, TypeError),
+    ({'space': 'hsv'}, ValueError),
+    ({'workers': 0}, ValueError),
+    ({'max_iterations': 0}, ValueError),
+    ({'max_iterations': 1.5}, TypeError),
+    ({'tolerance': -1}, ValueError),
+    ({'tolerance': float('nan')}, ValueError),
+    ({'tolerance': '0.1'}, TypeError),
+])
+def test_invalid_arguments(arguments, error):
+    with pytest.raises(error):
+        KMeans(**arguments)
+
+
+def test_no_pixels():
+    with pytest.raises(ValueError):
+        KMeans().fit([])
@@ -0,0 +1,73 @@
+"""Tests of `dyepy.netpbm`.
+"""
+
+
+import random
+
+import pytest
+
+from dyepy.netpbm import PNMWriter, read_pnm
+
+
+@pytest.mark.parametrize('binary', [True, False])
+@pytest.mark.parametrize('channels', [1, 3])
+@pytest.mark.parametrize('maxval', [255, 1000])
+def test_round_trip(tmp_path, binary, channels, maxval):
+    rng = random.Random(maxval + channels)
+    width, height = 11, 4
+    rows = [[rng.randint(0, maxval) for _ in range(width * channels)]
+            for _ in range(height)]
+    path = tmp_path / ('image.ppm' if channels == 3 else 'image.pgm')
+
+    with PNMWriter(path, width, height, channels, maxval, binary) as writer:
+        for row in rows:
+            writer.write_row(row)
+
+    magic = {(3, True): b'P6', (1, True): b'P5',
+             (3, False): b'P3', (1, False): b'P2'}[channels, binary]
+
+    with read_pnm(path) as image:
+        assert (image.magic, image.width, image.height, image.maxval) == \
+            (magic, width, height, maxval)
+        assert list(image.samples()) == [value for row in rows
+                                         for value in row]
+
+        if maxval == 255:
+            assert [bytes(row) for row in image.rows()] == \
+                [bytes(row) for row in rows]
+
+
+def test_ascii_with_comments(tmp_path):
+    path = tmp_path / 'image.ppm'
+    path.write_bytes(b'P3 # a comment\n2 1\n# another\n15\n'
+                     b'15 0 0  0 15 15\n')
+
+    with read_pnm(path) as image:
+        assert image.colors().hex() == ['#ff0000', '#00ffff']
+
+
+@pytest.mark.parametrize('header', [b'P6\n0 2\n255\n', b'P6\n2 0\n255\n',
+                                    b'P3\n0 0\n255\n'])
+def test_zero_dimensions(tmp_path, header):
+    path = tmp_path / 'image.ppm'
+    path.write_bytes(header + bytes(12))
+
+    with pytest.raises(ValueError, match='must be ≥ 1'):
+        read_pnm(path)
+
+
+@pytest.mark.parametrize('content', [b'P7\n1 1\n255\n\0\0\0',
+                                     b'P6\n2 2\n255\n\0\0\0',
+                                     b'P6\n1 1\n0\n\0\0\0', b'P6\n1'])
+def test_invalid_images(tmp_path, content):
+    path = tmp_path / 'image.ppm'
+    path.write_bytes(content)
+
+    with pytest.raises(ValueError):
+        read_pnm(path)
+
+
+def test_missing_rows(tmp_path):
+    with pytest.raises(ValueError):
+        with PNMWriter(tmp_path / 'image.ppm', 1, 2) as writer:
+            writer.write_row(b'\0\0\0')
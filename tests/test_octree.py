@@ -0,0 +1,62 @@
+"""Tests of `dyepy.octree`.
+"""
+
+
+import random
+
+import pytest
+
+from dyepy.octree import OctreeQuantizer, quantize
+
+
+# Returns *count* random pixels as packed RGB bytes
+def random_pixels(count=5000, seed=3):
+    rng = random.Random(seed)
+
+    return bytes(rng.randrange(256) for _ in range(count * 3))
+
+
+@pytest.mark.parametrize('colors', [1, 2, 16, 256])
+def test_palette_size(colors):
+    quantizer = OctreeQuantizer(colors, max_leaves=256)
+    quantizer.feed(random_pixels())
+    histogram = quantizer.histogram()
+
+    assert len(quantizer) <= 256
+    assert 1 <= len(histogram) <= colors
+    assert sum(count for _, count in histogram) == quantizer.pixels == 5000
+    assert [count for _, count in histogram] == \
+        sorted((count for _, count in histogram), reverse=True)
+    assert len(quantizer.palette(4)) <= 4
+
+
+def test_few_colors_are_exact():
+    pixels = ['#ff0000'] * 5 + ['#0078d7'] * 3 + ['#000000']
+
+    assert OctreeQuantizer(8).feed(pixels).histogram() == \
+        [('#ff0000', 5), ('#0078d7', 3), ('#000000', 1)]
+
+    # One color left: the mean of all the pixels
+    assert quantize(pixels, 1) == ['#8e2848']
+
+
+def test_feeding_in_parts():
+    pixels = random_pixels()
+    whole = OctreeQuantizer(16, 256).feed(pixels)
+    parts = OctreeQuantizer(16, 256)
+
+    for start in range(0, len(pixels), 3 * 777):
+        parts.feed(pixels[start:start + 3 * 777])
+
+    assert parts.pixels == whole.pixels == 5000
+    assert len(parts.palette()) <= 16
+
+
+@pytest.mark.parametrize('colors, max_leaves, error', [
+    (0, 8, ValueError),
+    (16, 8, ValueError),
+    (2.0, 8, TypeError),
+])
+def test_bad_arguments(colors, max_leaves, error):
+    with pytest.raises(error):
+        OctreeQuantizer(colors, max_leaves)
@@ -0,0 +1,81 @@
+"""Tests of `dyepy.parallel`.
+"""
+
+
+import random
+from array import array
+
+import pytest
+
+from dyepy import parallel
+from dyepy.batch import ColorArray, convert_array
+from dyepy.parallel import _chunk_size, convert_many
+
+
+# Runs each test in this process, then in the pool in small chunks
+@pytest.fixture(params=['serial', 'pool'])
+def path(request, monkeypatch):
+    if request.param == 'pool':
+        monkeypatch.setattr(parallel, '_SERIAL_TIME', -1.0)
+        monkeypatch.setattr(parallel, '_TASK_TIME', 0.0)
+        request.addfinalizer(parallel._shutdown)
+
+    return request.param
+
+
+# Returns *count* random RGB colors as a list of tuples
+def rgb_colors(count=2000):
+    rng = random.Random(count)
+
+    return [tuple(rng.randrange(256) for _ in range(3)) for _ in range(count)]
+
+
+@pytest.mark.parametrize('count', [0, 1, 2000])
+def test_list_to_hex(path, count):
+    colors = rgb_colors(count)
+
+    assert convert_many(colors, 'rgb', 'hex', workers=2) == \
+        ['#%02x%02x%02x' % color for color in colors]
+
+
+def test_list_and_packed(path):
+    colors = rgb_colors()
+    expected = convert_array(ColorArray.fromcolors(colors), 'oklab')
+
+    result = convert_many(colors, 'rgb', 'oklab', workers=2)
+    assert type(result) is list
+    assert result == list(expected)
+
+    for values in (ColorArray.fromcolors(colors),
+                   ColorArray.fromcolors(colors).tobytes()):
+        result = convert_many(values, 'rgb', 'oklab', workers=2)
+        assert type(result) is ColorArray
+        assert result.space == 'oklab' and result.data.typecode == 'd'
+        assert result.data == expected.data
+
+
+def test_to_rgb_keeps_bytes(path):
+    colors = rgb_colors()
+    hsl = convert_array(ColorArray.fromcolors(colors), 'hsl')
+    result = convert_many(array('d', hsl.data), 'hsl', 'rgb', workers=2)
+
+    assert result.space == 'rgb' and result.data.typecode == 'B'
+    assert list(result) == list(convert_array(hsl, 'rgb'))
+
+
+@pytest.mark.parametrize('count, cost, workers, size', [
+    (100000, 1e-5, 4, 6250),     # 4 chunks per worker
+    (100000, 1e-6, 4, 20000),    # Fewer, of 20 ms each
+    (10, 1e-6, 8, 20000),        # One chunk
+    (10, 0.0, 8, 10),
+])
+def test_chunk_size(count, cost, workers, size):
+    assert _chunk_size(count, cost, workers) == size
+
+
+def test_bad_arguments():
+    with pytest.raises(ValueError, match='\'dst\' must be'):
+        convert_many([], 'rgb', 'xyz')
+
+    with pytest.raises(ValueError, match='\'workers\' must be ≥ 1'):
+        convert_many([], 'rgb', 'hsl', workers=0)
@@ -0,0 +1,129 @@
+"""Tests of `dyepy.png`.
+"""
+
+
+import io
+import random
+import struct
+import zlib
+
+import pytest
+
+from dyepy.batch import ColorArray
+from dyepy.png import PNGReader, PNGWriter, _filter, _unfilter, read_png, \
+    write_png
+
+
+# The filters of the PNG specification, one byte at a time
+def reference_filter(kind, row, prior, bpp):
+    out = bytearray()
+
+    for index, x in enumerate(row):
+        a = row[index - bpp] if index >= bpp else 0
+        b = prior[index]
+        c = prior[index - bpp] if index >= bpp else 0
+        p = a + b - c
+        pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+        paeth = a if pa <= pb and pa <= pc else b if pb <= pc else c
+        out.append((x - (0, a, b, (a + b) // 2, paeth)[kind]) & 255)
+
+    return bytes(out)
+
+
+@pytest.mark.parametrize('kind', range(5))
+@pytest.mark.parametrize('bpp', [1, 2, 3, 4, 6, 8])
+def test_filters(kind, bpp):
+    rng = random.Random(kind * 10 + bpp)
+    # Edge bytes make wrong carries and borrows show
+    edges = (0, 1, 127, 128, 254, 255)
+
+    for size, values in ((bpp, range(256)), (2 * bpp, range(256)),
+                         (37 * bpp, range(256)), (37 * bpp, edges)):
+        row = bytes(rng.choice(values) for _ in range(size))
+        prior = bytes(rng.choice(values) for _ in range(size))
+        filtered = _filter(kind, row, prior, bpp)
+
+        assert filtered == reference_filter(kind, row, prior, bpp)
+        assert _unfilter(kind, filtered, prior, bpp) == row
+
+
+def test_unknown_filter_type():
+    with pytest.raises(ValueError):
+        _unfilter(5, b'\0\0\0', b'\0\0\0', 3)
+
+
+@pytest.mark.parametrize('channels', [1, 2, 3, 4])
+@pytest.mark.parametrize('bit_depth', [8, 16])
+@pytest.mark.parametrize('filter', ['none', 'sub', 'up', 'average', 'paeth',
+                                    'adaptive', 'fast'])
+def test_round_trip(channels, bit_depth, filter):
+    rng = random.Random(channels * bit_depth)
+    width, height = 13, 7
+    stride = width * channels * bit_depth // 8
+    rows = [bytes(rng.getrandbits(8) for _ in range(stride))
+            for _ in range(height)]
+    file = io.BytesIO()
+
+    write_png(file, rows, width, height, channels, bit_depth, filter)
+    file.seek(0)
+
+    with PNGReader(file) as image:
+        assert (image.width, image.height, image.bit_depth) == \
+            (width, height, bit_depth)
+        assert list(image.raw_rows()) == rows
+
+
+def test_colors_round_trip():
+    colors = ColorArray.fromcolors(['red', '#00ff00', 'navy', '#c0ffee',
+                                    'black', 'white'])
+    file = io.BytesIO()
+
+    with PNGWriter(file, 3, 2) as writer:
+        writer.write_rows([colors[:3], colors[3:]])
+
+    file.seek(0)
+    pixels, width, height = read_png(file)
+
+    assert (pixels.tobytes(), width, height) == (colors.tobytes(), 3, 2)
+
+
+# A PNG file of raw *rows* (filter type 0), made without `dyepy.png`
+def make_png(width, height, bit_depth, color_type, rows, palette=None):
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data \
+            + struct.pack('>I', zlib.crc32(kind + data))
+
+    return b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', struct.pack(
+        '>IIBBBBB', width, height, bit_depth, color_type, 0, 0, 0)) \
+        + (chunk(b'PLTE', palette) if palette else b'') \
+        + chunk(b'IDAT', zlib.compress(b''.join(b'\0' + row
+                                                for row in rows))) \
+        + chunk(b'IEND', b'')
+
+
+@pytest.mark.parametrize('bit_depth, color_type, rows, palette, expected', [
+    (8, 2, [b'\xff\0\0\0\x80\xff'], None, b'\xff\0\0\0\x80\xff'),
+    (16, 2, [b'\xff\x01\0\x02\0\x03'], None, b'\xff\0\0'),
+    (8, 6, [b'\x10\x20\x30\x40'], None, b'\x10\x20\x30'),
+    (8, 4, [b'\x7f\0'], None, b'\x7f\x7f\x7f'),
+    (1, 0, [b'\xa0'], None, b'\xff\xff\xff\0\0\0\xff\xff\xff'),
+    (2, 3, [b'\x1b'], b'\x01\x02\x03\x04\x05\x06\x07\x08\x09',
+     b'\x01\x02\x03\x04\x05\x06\x07\x08\x09'),
+])
+def test_read_color_types(bit_depth, color_type, rows, palette, expected):
+    width = len(expected) // 3
+    data = make_png(width, len(rows), bit_depth, color_type, rows, palette)
+
+    with PNGReader(io.BytesIO(data)) as image:
+        assert b''.join(image.rows()) == expected
+
+
+def test_missing_rows():
+    with pytest.raises(ValueError, match='expected 2 rows'):
+        with PNGWriter(io.BytesIO(), 1, 2) as writer:
+            writer.write_row(b'\0\0\0')
+
+
+def test_not_a_png():
+    with pytest.raises(ValueError):
+        PNGReader(io.BytesIO(b'GIF89a' + bytes(32)))
@@ -0,0 +1,60 @@
+"""Tests of `dyepy.profiler`.
+"""
+
+
+import io
+import pstats
+
+import pytest
+
+import dyepy.converters
+from dyepy.profiler import profile
+
+
+def test_pstats_file_loads(tmp_path):
+    path = tmp_path / 'convert.pstats'
+
+    with profile(str(path)):
+        for code in ('#0078d7', '#ff0000', '#000000'):
+            dyepy.converters.hex2cmyk(code)
+
+    assert path.exists()
+
+    stats = pstats.Stats(str(path))
+    entries = {name: entry for (_, _, name), entry in stats.stats.items()}
+
+    assert entries['hex2cmyk'][:2] == (3, 3)
+    assert entries['hex2rgb'][:2] == (3, 3)
+    assert [name for _, _, name in entries['hex2rgb'][4]] == ['hex2cmyk']
+    assert stats.total_calls == sum(entry[1] for entry in entries.values())
+    assert entries['hex2cmyk'][3] >= entries['hex2rgb'][3]
+
+
+def test_tree_and_table():
+    original = dyepy.converters.hex2cmyk
+
+    with profile() as profiler:
+        assert dyepy.converters.hex2cmyk is not original
+        dyepy.converters.hex2cmyk('#0078d7')
+
+    assert dyepy.converters.hex2cmyk is original
+    assert ('hex2cmyk', 'hex2rgb') in profiler.nodes
+    assert {row[0]: row[1] for row in profiler.rows()}['hex2cmyk'] == 1
+
+    tree, table = io.StringIO(), io.StringIO()
+    profiler.print_tree(tree)
+    profiler.print_stats('calls', file=table)
+
+    assert tree.getvalue().startswith('hex2cmyk')
+    assert '\n  hex2rgb' in tree.getvalue()
+    assert table.getvalue().startswith('function')
+
+
+def test_one_profile_at_a_time():
+    with profile():
+        with pytest.raises(RuntimeError, match='already running'):
+            with profile():
+                pass
+
+    with profile():
+        pass
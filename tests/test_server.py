@@ -0,0 +1,104 @@
+"""Tests of `dyepy.server`.
+"""
+
+
+import asyncio
+import json
+
+import pytest
+
+from dyepy.server import ColorServer
+
+
+# A class of a stream writer keeping what is written to it
+class Writer:
+    def __init__(self):
+        self.data = b''
+        self.closed = False
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+# Sends the raw HTTP *requests* on one connection, returns the responses
+def exchange(requests):
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(requests)
+        reader.feed_eof()
+        writer = Writer()
+        await ColorServer().handle(reader, writer)
+
+        return writer
+
+    writer = asyncio.run(run())
+    assert writer.closed
+
+    return writer.data
+
+
+# Returns (status, response object) of a request of *body*
+def respond(path, body, method='POST'):
+    return asyncio.run(ColorServer().respond(method, path,
+                                             json.dumps(body).encode()))
+
+
+@pytest.mark.parametrize('path, body, response', [
+    ('/convert', {'colors': ['#0078d7', [255, 0, 0]], 'to': 'hsl'},
+     {'colors': [[207.0, 1.0, 0.4216], [0.0, 1.0, 0.5]]}),
+    ('/convert', {'color': 'navy'}, {'color': '#000080'}),
+    ('/nearest', {'color': '#ff0001'},
+     {'nearest': {'name': 'red', 'hex': '#ff0000', 'distance': 0.0982}}),
+    ('/contrast', {'pairs': [['#777777', '#ffffff']]},
+     {'ratios': [4.4781], 'levels': [None]}),
+    ('/contrast', {'foreground': 'black', 'background': 'white'},
+     {'ratio': 21.0, 'level': 'AAA'}),
+])
+def test_routes(path, body, response):
+    assert respond(path, body) == (200, response)
+
+
+@pytest.mark.parametrize('path, body, error', [
+    ('/convert', {'colors': ['red'], 'to': ['x']},
+     '\'to\' must be of type \'str\', not \'list\''),
+    ('/convert', {'colors': ['red'], 'precision': True},
+     '\'precision\' must be of type \'int\', not \'bool\''),
+    ('/nearest', {'colors': ['red'], 'palette': {}},
+     '\'palette\' must be of type \'str\', not \'dict\''),
+    ('/contrast', {'pairs': [], 'large': 1},
+     '\'large\' must be of type \'bool\', not \'int\''),
+    ('/contrast', {'foreground': 'black'}, 'missing \'background\''),
+    ('/contrast', {'background': 'white'}, 'missing \'foreground\''),
+    ('/convert', {'to': 'hsl'}, 'missing \'colors\''),
+])
+def test_bad_requests(path, body, error):
+    assert respond(path, body) == (400, {'error': error})
+
+
+@pytest.mark.parametrize('length', [b'abc', b'-5', b'1.5'])
+def test_bad_content_length(length):
+    response = exchange(b'POST /convert HTTP/1.1\r\nContent-Length: '
+                        + length + b'\r\n\r\n{}')
+
+    assert response.startswith(b'HTTP/1.1 400 Bad Request\r\n')
+    assert b'Connection: close\r\n' in response
+    assert response.endswith(b'{"error": "bad Content-Length \''
+                             + length + b'\'"}')
+
+
+def test_keep_alive():
+    body = b'{"color": "red", "to": "rgb"}'
+    request = b'POST /convert HTTP/1.1\r\nContent-Length: ' \
+        + str(len(body)).encode() + b'\r\n\r\n' + body
+    response = exchange(request * 2 + b'GET /health HTTP/1.1\r\n'
+                        b'Connection: close\r\n\r\n')
+
+    assert response.count(b'HTTP/1.1 200 OK\r\n') == 3
+    assert response.count(b'{"color": [255, 0, 0]}') == 2
+    assert response.endswith(b'{"status": "ok"}')